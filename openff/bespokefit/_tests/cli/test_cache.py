@@ -1,18 +1,31 @@
+import datetime
+import hashlib
+import json
 import os.path
+import sqlite3
 
 import click.exceptions
 import pytest
 import rich
 from openff.qcsubmit.results import TorsionDriveResultCollection
+from openff.toolkit.typing.engines.smirnoff import ForceField
+from openff.units import unit
 from openff.utilities import get_data_file_path
 
 from openff.bespokefit._tests import does_not_raise
 from openff.bespokefit.cli.cache import (
     _connect_to_qcfractal,
+    _export_cache,
+    _import_cache,
     _results_from_file,
     _update_from_qcsubmit_result,
     update_cli,
 )
+from openff.bespokefit.executor.services.coordinator.utils import (
+    get_cached_force_field,
+    has_cached_parameters,
+    set_cached_force_field,
+)
 
 
 @pytest.mark.parametrize(
@@ -171,3 +184,160 @@ def test_cache_cli_fractal(runner, tmpdir, redis_session, monkeypatch):
     )
     assert output.exit_code == 0, print(output.output)
     assert "4. saving local cache" in output.output
+
+
+def _mock_cached_result(redis_connection, cache, task_hash, task_id, date_done):
+    redis_connection.hset(f"{cache}:task-ids", task_hash, task_id)
+    redis_connection.set(
+        f"celery-task-meta-{task_id}",
+        json.dumps(
+            {
+                "status": "SUCCESS",
+                "result": json.dumps({"task": task_id}),
+                "date_done": date_done.isoformat(),
+                "task_id": task_id,
+            }
+        ),
+    )
+
+
+def test_export_import_cache(redis_connection, tmpdir):
+    """
+    Test exporting the caches to an archive and importing them into an empty redis.
+    """
+
+    old_time = datetime.datetime(2020, 1, 1)
+    new_time = datetime.datetime(2022, 1, 1)
+
+    _mock_cached_result(redis_connection, "qcgenerator", "qc-hash", "qc-1", old_time)
+    redis_connection.hset("qcgenerator:types", "qc-1", "torsion1d")
+    _mock_cached_result(redis_connection, "fragmenter", "frag-hash", "frag-1", new_time)
+    # incomplete tasks should not be exported
+    redis_connection.hset("fragmenter:task-ids", "pending-hash", "frag-2")
+
+    cached_force_field = ForceField()
+    cached_force_field.get_parameter_handler("ProperTorsions").add_parameter(
+        {
+            "smirks": "[*:1]-[#6X4:2]-[#6X4:3]-[*:4]",
+            "periodicity": [3],
+            "phase": [0.0 * unit.degree],
+            "k": [0.2 * unit.kilocalorie_per_mole],
+            "idivf": [1.0],
+        }
+    )
+    set_cached_force_field(
+        redis_connection,
+        "param-hash",
+        cached_force_field.to_string(),
+        new_time.timestamp(),
+    )
+
+    # parameters cached by older versions are not tracked by the index
+    legacy_hash = hashlib.sha512(b"legacy").hexdigest()
+    redis_connection.set(legacy_hash, cached_force_field.to_string())
+
+    archive_path = os.path.join(tmpdir, "cache.sqlite")
+
+    assert _export_cache(redis_connection, archive_path) == 4
+
+    incremental_path = os.path.join(tmpdir, "incremental.sqlite")
+    assert (
+        _export_cache(
+            redis_connection, incremental_path, since=datetime.datetime(2021, 1, 1)
+        )
+        == 2
+    )
+
+    redis_connection.flushdb()
+
+    assert _import_cache(redis_connection, archive_path) == 4
+    # importing a second time should not duplicate any entries
+    assert _import_cache(redis_connection, archive_path) == 0
+
+    task_id = redis_connection.hget("qcgenerator:task-ids", "qc-hash").decode()
+    assert redis_connection.hget("qcgenerator:types", task_id) == b"torsion1d"
+
+    task_meta = json.loads(redis_connection.get(f"celery-task-meta-{task_id}"))
+    assert task_meta["status"] == "SUCCESS"
+    assert json.loads(task_meta["result"]) == {"task": "qc-1"}
+
+    assert redis_connection.hget("fragmenter:task-ids", "pending-hash") is None
+    imported_force_field = ForceField(
+        get_cached_force_field(redis_connection, "param-hash")
+    )
+    imported_parameter = imported_force_field["ProperTorsions"].parameters[
+        "[*:1]-[#6X4:2]-[#6X4:3]-[*:4]"
+    ]
+    assert imported_parameter.k1.m_as(unit.kilocalorie_per_mole) == pytest.approx(0.2)
+
+    assert has_cached_parameters(redis_connection, legacy_hash)
+
+
+def test_import_cache_merge_parameters(redis_connection, tmpdir):
+    """
+    Test that parameters cached for a fitting schema since a previous import are
+    merged into those already cached for it.
+    """
+
+    def _torsion_force_field(smirks, k):
+        force_field = ForceField()
+        force_field.get_parameter_handler("ProperTorsions").add_parameter(
+            {
+                "smirks": smirks,
+                "periodicity": [3],
+                "phase": [0.0 * unit.degree],
+                "k": [k * unit.kilocalorie_per_mole],
+                "idivf": [1.0],
+            }
+        )
+        return force_field.to_string()
+
+    existing_smirks = "[*:1]-[#6X4:2]-[#6X4:3]-[*:4]"
+    new_smirks = "[#1:1]-[#6X4:2]-[#8X2:3]-[#1:4]"
+
+    set_cached_force_field(
+        redis_connection, "param-hash", _torsion_force_field(existing_smirks, 0.2)
+    )
+
+    archive_path = os.path.join(tmpdir, "cache.sqlite")
+    _export_cache(redis_connection, archive_path)
+
+    # the schema hash gains a new parameter after the archive was first imported
+    set_cached_force_field(
+        redis_connection, "param-hash", _torsion_force_field(new_smirks, 0.4)
+    )
+    # an existing parameter should not be replaced by a merge
+    set_cached_force_field(
+        redis_connection, "param-hash", _torsion_force_field(existing_smirks, 9.9)
+    )
+    _export_cache(redis_connection, archive_path)
+
+    redis_connection.flushdb()
+    set_cached_force_field(
+        redis_connection, "param-hash", _torsion_force_field(existing_smirks, 0.2)
+    )
+
+    assert _import_cache(redis_connection, archive_path) == 1
+    assert _import_cache(redis_connection, archive_path) == 0
+
+    imported_torsions = ForceField(
+        get_cached_force_field(redis_connection, "param-hash")
+    )["ProperTorsions"]
+
+    assert imported_torsions.parameters[existing_smirks].k1.m_as(
+        unit.kilocalorie_per_mole
+    ) == pytest.approx(0.2)
+    assert imported_torsions.parameters[new_smirks].k1.m_as(
+        unit.kilocalorie_per_mole
+    ) == pytest.approx(0.4)
+
+
+def test_import_cache_bad_version(redis_connection, tmpdir):
+    archive_path = os.path.join(tmpdir, "cache.sqlite")
+    _export_cache(redis_connection, archive_path)
+
+    with sqlite3.connect(archive_path) as database:
+        database.execute("UPDATE metadata SET value = '-1' WHERE key = 'version'")
+
+    with pytest.raises(ValueError, match="only version 1 is supported"):
+        _import_cache(redis_connection, archive_path)
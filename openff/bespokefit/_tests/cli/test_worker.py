@@ -1,6 +1,7 @@
 import pytest
 
 from openff.bespokefit.cli.worker import worker_cli
+from openff.bespokefit.executor.services import Settings
 from openff.bespokefit.executor.utilities import celery
 
 
@@ -19,7 +20,7 @@ def test_launch_worker(worker_type, runner, monkeypatch):
 
     launched_workers = {}
 
-    def mock_spawn_worker(app, concurrency, asynchronous, pool=None):
+    def mock_spawn_worker(app, concurrency, asynchronous, pool=None, queues=None):
         launched_workers[app.main] = concurrency
 
     monkeypatch.setattr(celery, "spawn_worker", mock_spawn_worker)
@@ -27,3 +28,78 @@ def test_launch_worker(worker_type, runner, monkeypatch):
     output = runner.invoke(worker_cli, args=["--worker-type", worker_type])
     assert output.exit_code == 0
     assert worker_type in output.output
+
+
+def test_launch_worker_queues(runner, monkeypatch):
+    """Test that a worker can be subscribed to specific queues."""
+
+    launched_queues = {}
+
+    def mock_spawn_worker(app, concurrency, asynchronous, pool=None, queues=None):
+        launched_queues[app.main] = queues
+
+    monkeypatch.setattr(celery, "spawn_worker", mock_spawn_worker)
+
+    output = runner.invoke(
+        worker_cli,
+        args=[
+            "--worker-type",
+            "qc-compute",
+            "--queue",
+            "large",
+            "--queue",
+            "qcgenerator-psi4",
+        ],
+    )
+    assert output.exit_code == 0
+    assert launched_queues == {"qcgenerator": ["qcgenerator-large", "qcgenerator-psi4"]}
+
+
+def test_launch_worker_pack_tasks(runner, monkeypatch):
+    """Test that a packing QC worker runs tasks in a thread pool."""
+
+    launched_workers = {}
+
+    def mock_spawn_worker(app, concurrency, asynchronous, pool=None, queues=None):
+        launched_workers[app.main] = (concurrency, pool)
+
+    monkeypatch.setattr(celery, "spawn_worker", mock_spawn_worker)
+
+    with Settings(
+        BEFLOW_QC_COMPUTE_WORKER_PACK_TASKS=True, BEFLOW_QC_COMPUTE_WORKER_N_CORES=4
+    ).apply_env():
+        output = runner.invoke(worker_cli, args=["--worker-type", "qc-compute"])
+
+    assert output.exit_code == 0
+    assert launched_workers == {"qcgenerator": (4, "threads")}
+
+
+def test_launch_worker_optimizer_solo(runner, monkeypatch):
+    """Test that optimizer tasks run in the main process of the worker so that split
+    stages can be fit in parallel."""
+
+    launched_pools = {}
+
+    def mock_spawn_worker(app, concurrency, asynchronous, pool=None, queues=None):
+        launched_pools[app.main] = pool
+
+    monkeypatch.setattr(celery, "spawn_worker", mock_spawn_worker)
+
+    output = runner.invoke(worker_cli, args=["--worker-type", "optimizer"])
+
+    assert output.exit_code == 0
+    assert launched_pools == {"optimizer": "solo"}
+
+
+@pytest.mark.parametrize("worker_type", ["fragmenter", "optimizer"])
+def test_launch_worker_queues_not_qc(worker_type, runner, monkeypatch):
+    """Test that only qc-compute workers can be subscribed to specific queues."""
+
+    monkeypatch.setattr(celery, "spawn_worker", lambda *args, **kwargs: None)
+
+    output = runner.invoke(
+        worker_cli, args=["--worker-type", worker_type, "--queue", "large"]
+    )
+
+    assert output.exit_code == 2
+    assert "queues can only be given for qc-compute workers" in output.stderr
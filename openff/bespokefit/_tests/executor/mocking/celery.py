@@ -1,7 +1,9 @@
+import json
 from collections import namedtuple
 from types import ModuleType
 from typing import Any, Dict, Optional
 
+import redis
 from celery.result import AsyncResult
 
 
@@ -14,10 +16,16 @@ def mock_celery_task(
         submitted_task_kwargs.update(kwargs)
         return namedtuple("MockReturn", "id")(task_id)
 
+    def _mock_celery_task_apply_async(kwargs, queue=None):
+        submitted_task_kwargs.update(kwargs)
+        submitted_task_kwargs["queue"] = queue
+        return namedtuple("MockReturn", "id")(task_id)
+
     def _mock_celery_task():
         pass
 
     _mock_celery_task.delay = _mock_celery_task_delay
+    _mock_celery_task.apply_async = _mock_celery_task_apply_async
 
     monkeypatch.setattr(worker_module, function_name, _mock_celery_task)
 
@@ -29,3 +37,26 @@ def mock_celery_result(status: str, result: Optional[str] = None) -> AsyncResult
     result._cache = {"status": status, "result": result}
 
     return result
+
+
+def mock_celery_task_meta(
+    redis_connection: redis.Redis,
+    task_id: str,
+    status: str,
+    result: Optional[str] = None,
+):
+    """Store the metadata of a mock task directly in the celery result backend."""
+
+    redis_connection.set(
+        f"celery-task-meta-{task_id}",
+        json.dumps(
+            {
+                "status": status,
+                "result": result,
+                "traceback": None,
+                "children": [],
+                "date_done": None,
+                "task_id": task_id,
+            }
+        ),
+    )
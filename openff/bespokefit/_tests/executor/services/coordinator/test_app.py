@@ -1,7 +1,9 @@
 import pytest
 from httpx import HTTPStatusError
+from openff.fragmenter.fragment import Fragment
 
 from openff.bespokefit.executor.services.coordinator.models import (
+    CoordinatorFragmentReport,
     CoordinatorGETPageResponse,
     CoordinatorGETResponse,
     CoordinatorPOSTBody,
@@ -14,6 +16,7 @@ from openff.bespokefit.executor.services.coordinator.storage import (
     pop_task_status,
     push_task_status,
 )
+from openff.bespokefit.executor.services.fragmenter.registry import FragmentRegistry
 
 
 @pytest.mark.parametrize(
@@ -154,3 +157,32 @@ def test_get_molecule_image(coordinator_client, bespoke_optimization_schema):
 
     assert "<svg" in request.text
     assert request.headers["content-type"] == "image/svg+xml"
+
+
+def test_get_fragment_report(coordinator_client, redis_connection):
+    fragment = Fragment(
+        smiles="[H:3][C:1]([H:4])([H:5])[O:2][H:6]", bond_indices=(1, 2)
+    )
+
+    registry = FragmentRegistry(redis_connection)
+    registry.subscribe("1", fragment, "spec")
+    registry.subscribe("2", fragment, "spec")
+    registry.subscribe("3", fragment, "other-spec")
+
+    request = coordinator_client.get("/tasks/fragments")
+    request.raise_for_status()
+
+    report = CoordinatorFragmentReport.parse_raw(request.text)
+
+    assert report.n_fragments == 2
+    assert report.n_subscriptions == 3
+    assert report.n_qc_calculations_saved == 1
+
+    request = coordinator_client.get("/tasks/fragments?ids=1&ids=2")
+    request.raise_for_status()
+
+    report = CoordinatorFragmentReport.parse_raw(request.text)
+
+    assert report.n_fragments == 1
+    assert report.n_subscriptions == 2
+    assert report.n_qc_calculations_saved == 1
@@ -0,0 +1,152 @@
+import pytest
+from openff.fragmenter.fragment import Fragment, FragmentationResult
+from openff.toolkit.topology import Molecule
+from openff.toolkit.typing.engines.smirnoff import ForceField
+from openff.units import unit
+
+from openff.bespokefit.executor.services.coordinator import stages
+from openff.bespokefit.executor.services.coordinator.stages import QCGenerationStage
+from openff.bespokefit.schema.fitting import (
+    BespokeOptimizationSchema,
+    OptimizationStageSchema,
+)
+from openff.bespokefit.schema.optimizers import ForceBalanceSchema
+from openff.bespokefit.schema.smirnoff import ProperTorsionSMIRKS
+from openff.bespokefit.utilities.smirks import CachedTorsionIndex, SMIRKSettings
+
+
+@pytest.fixture()
+def butane_inputs():
+    molecule = Molecule.from_smiles("CCCC")
+    smiles = molecule.to_smiles(mapped=True)
+
+    fragmentation_result = FragmentationResult(
+        parent_smiles=smiles,
+        fragments=[Fragment(smiles=smiles, bond_indices=(2, 3))],
+        provenance={},
+    )
+    input_schema = BespokeOptimizationSchema(
+        smiles=smiles,
+        initial_force_field="openff-2.2.0.offxml",
+        initial_force_field_hash="test_hash",
+        target_torsion_smirks=[],
+        smirk_settings=SMIRKSettings(
+            generate_bespoke_terms=True, expand_torsion_terms=False
+        ),
+        stages=[
+            OptimizationStageSchema(
+                parameters=[],
+                parameter_hyperparameters=[],
+                targets=[],
+                optimizer=ForceBalanceSchema(max_iterations=1),
+            )
+        ],
+    )
+
+    return fragmentation_result, input_schema
+
+
+@pytest.mark.parametrize("n_cached", [0, 1, None])
+def test_generate_torsion_parameters_cached(butane_inputs, monkeypatch, n_cached):
+    """
+    Make sure cached torsion parameters are re-used even when only some of the
+    parameters of a fragment have been cached, and that the fragment is only driven
+    when at least one of its parameters is missing.
+    """
+
+    fragmentation_result, input_schema = butane_inputs
+
+    parameters, _ = QCGenerationStage._generate_torsion_parameters(
+        fragmentation_result, input_schema
+    )
+    n_parameters = len(parameters)
+    assert n_parameters > 1
+
+    n_cached = n_parameters if n_cached is None else n_cached
+
+    cached_force_field = ForceField()
+    cached_handler = cached_force_field.get_parameter_handler("ProperTorsions")
+
+    for parameter in parameters[:n_cached]:
+        cached_handler.add_parameter(
+            {
+                "smirks": parameter.smirks,
+                "periodicity": [1],
+                "phase": [0.0 * unit.degree],
+                "k": [1.0 * unit.kilocalorie_per_mole],
+                "idivf": [1.0],
+            }
+        )
+
+    monkeypatch.setattr(stages, "is_redis_available", lambda **_: True)
+    monkeypatch.setattr(stages, "connect_to_default_redis", lambda: None)
+    monkeypatch.setattr(
+        stages,
+        "get_cached_parameters",
+        lambda **_: CachedTorsionIndex([*cached_handler.parameters]),
+    )
+
+    parameters, fragments = QCGenerationStage._generate_torsion_parameters(
+        fragmentation_result, input_schema
+    )
+
+    assert len(parameters) == n_parameters
+    assert len(fragments) == (0 if n_cached == n_parameters else 1)
+
+    bespoke_parameters = [
+        ProperTorsionSMIRKS.from_smirnoff(parameter) for parameter in parameters
+    ]
+    # only the parameters without a cached value should be fit
+    assert sum(parameter.cached for parameter in bespoke_parameters) == n_cached
+
+
+def test_generate_torsion_parameters_parallel(monkeypatch):
+    """
+    Make sure generating the SMIRKS of each fragment in parallel gives the same
+    parameters, in the same order, as generating them serially.
+    """
+
+    molecule = Molecule.from_smiles("CCCCCC")
+    smiles = molecule.to_smiles(mapped=True)
+
+    fragmentation_result = FragmentationResult(
+        parent_smiles=smiles,
+        fragments=[
+            Fragment(smiles=smiles, bond_indices=bond_indices)
+            for bond_indices in [(2, 3), (3, 4), (4, 5)]
+        ],
+        provenance={},
+    )
+    input_schema = BespokeOptimizationSchema(
+        smiles=smiles,
+        initial_force_field="openff-2.2.0.offxml",
+        initial_force_field_hash="test_hash",
+        target_torsion_smirks=[],
+        stages=[
+            OptimizationStageSchema(
+                parameters=[],
+                parameter_hyperparameters=[],
+                targets=[],
+                optimizer=ForceBalanceSchema(max_iterations=1),
+            )
+        ],
+    )
+
+    monkeypatch.setattr(stages, "is_redis_available", lambda **_: False)
+
+    monkeypatch.setattr(stages, "_n_smirks_processes", lambda n_fragments: 1)
+    expected_parameters, expected_fragments = (
+        QCGenerationStage._generate_torsion_parameters(
+            fragmentation_result, input_schema
+        )
+    )
+
+    monkeypatch.setattr(stages, "_n_smirks_processes", lambda n_fragments: 2)
+    parameters, fragments = QCGenerationStage._generate_torsion_parameters(
+        fragmentation_result, input_schema
+    )
+
+    assert fragments == expected_fragments
+    assert [parameter.to_dict() for parameter in parameters] == [
+        parameter.to_dict() for parameter in expected_parameters
+    ]
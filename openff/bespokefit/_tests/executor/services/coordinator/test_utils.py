@@ -1,9 +1,14 @@
 from openff.toolkit.typing.engines.smirnoff import ForceField
 
 from openff.bespokefit.executor.services.coordinator.utils import (
+    _decode_parameter,
+    _encode_parameter,
     _hash_fitting_schema,
     cache_parameters,
+    get_cached_force_field,
     get_cached_parameters,
+    has_cached_parameters,
+    set_cached_force_field,
 )
 from openff.bespokefit.schema.smirnoff import ProperTorsionSMIRKS
 
@@ -30,21 +35,63 @@ def test_get_cached_parameters(redis_connection, ptp1b_input_schema_single):
     """
 
     # try and get some parameters from redis after not storing
-    force_field = get_cached_parameters(
+    cached_parameters = get_cached_parameters(
         fitting_schema=ptp1b_input_schema_single, redis_connection=redis_connection
     )
-    assert force_field is None
+    assert cached_parameters is None
     # now store some parameters under this hash
     openff_ff = ForceField("openff-1.0.0.offxml")
-    redis_connection.set(
-        _hash_fitting_schema(ptp1b_input_schema_single), openff_ff.to_string()
+    openff_torsions = openff_ff.get_parameter_handler("ProperTorsions").parameters
+
+    schema_hash = _hash_fitting_schema(ptp1b_input_schema_single)
+    set_cached_force_field(redis_connection, schema_hash, openff_ff.to_string())
+
+    cached_parameters = get_cached_parameters(
+        fitting_schema=ptp1b_input_schema_single, redis_connection=redis_connection
     )
 
-    cached_ff = get_cached_parameters(
+    assert len(cached_parameters) == len(openff_torsions)
+    # the parameters should only be loaded once they are needed
+    assert cached_parameters.n_loaded == 0
+
+    index = next(
+        i
+        for i in range(len(cached_parameters))
+        if cached_parameters.smirks(i) == openff_torsions[0].smirks
+    )
+    assert cached_parameters.parameter(index).to_dict() == openff_torsions[0].to_dict()
+    assert cached_parameters.n_loaded == 1
+
+
+def test_get_cached_parameters_legacy(redis_connection, ptp1b_input_schema_single):
+    """
+    Test that parameters cached as a single force field are converted to records.
+    """
+
+    openff_ff = ForceField("openff-1.0.0.offxml")
+    n_torsions = len(openff_ff.get_parameter_handler("ProperTorsions").parameters)
+
+    schema_hash = _hash_fitting_schema(ptp1b_input_schema_single)
+    redis_connection.set(schema_hash, openff_ff.to_string())
+
+    cached_parameters = get_cached_parameters(
         fitting_schema=ptp1b_input_schema_single, redis_connection=redis_connection
     )
 
-    assert cached_ff.__hash__() == openff_ff.__hash__()
+    assert len(cached_parameters) == n_torsions
+    assert redis_connection.get(schema_hash) is None
+    assert has_cached_parameters(redis_connection, schema_hash)
+
+
+def test_encode_parameter():
+    parameter = ForceField("openff-1.0.0.offxml")["ProperTorsions"].parameters[0]
+    parameter.add_cosmetic_attribute(attr_name="cached", attr_value="True")
+
+    decoded_parameter = _decode_parameter(_encode_parameter(parameter))
+
+    assert decoded_parameter.to_dict(
+        discard_cosmetic_attributes=False
+    ) == parameter.to_dict(discard_cosmetic_attributes=False)
 
 
 def test_cache_parameters(bespoke_optimization_results, redis_connection):
@@ -55,9 +102,8 @@ def test_cache_parameters(bespoke_optimization_results, redis_connection):
     hash_string = cache_parameters(
         results_schema=bespoke_optimization_results, redis_connection=redis_connection
     )
-    force_field = ForceField(redis_connection.get(hash_string))
     # we should have nothing saved.
-    assert len(force_field.get_parameter_handler("ProperTorsions").parameters) == 0
+    assert get_cached_force_field(redis_connection, hash_string) is None
     # add a mock parameter to signify it has been fit and cache again
     bespoke_optimization_results.input_schema.stages[0].parameters.append(
         ProperTorsionSMIRKS(smirks="[*:1]~[#6X3:2]-[#6X3:3]~[*:4]", attributes={"k1"})
@@ -66,6 +112,6 @@ def test_cache_parameters(bespoke_optimization_results, redis_connection):
         results_schema=bespoke_optimization_results, redis_connection=redis_connection
     )
     # grab the force field again and make sure we have a parameter saved
-    force_field = ForceField(redis_connection.get(hash_string))
+    force_field = ForceField(get_cached_force_field(redis_connection, hash_string))
     # we should have nothing saved.
     assert len(force_field.get_parameter_handler("ProperTorsions").parameters) == 1
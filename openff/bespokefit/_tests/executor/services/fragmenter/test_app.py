@@ -1,9 +1,20 @@
+import json
+
 from celery.result import AsyncResult
 from openff.fragmenter.fragment import Fragment, FragmentationResult, PfizerFragmenter
 
-from openff.bespokefit._tests.executor.mocking.celery import mock_celery_task
+from openff.bespokefit._tests.executor.mocking.celery import (
+    mock_celery_task,
+    mock_celery_task_meta,
+)
 from openff.bespokefit.executor.services.fragmenter import worker
 from openff.bespokefit.executor.services.fragmenter.models import (
+    FragmenterBatchFragment,
+    FragmenterBatchGETResponse,
+    FragmenterBatchPOSTBody,
+    FragmenterBatchPOSTResponse,
+    FragmenterBatchResult,
+    FragmenterGETPageResponse,
     FragmenterGETResponse,
     FragmenterPOSTBody,
     FragmenterPOSTResponse,
@@ -47,6 +58,32 @@ def test_get_fragment(fragmenter_client, monkeypatch):
     assert result.result.provenance == mock_fragmentation_result.provenance
 
 
+def test_get_fragments(fragmenter_client, redis_connection):
+    mock_fragmentation_result = FragmentationResult(
+        parent_smiles="[H:1][C:2]#[C:3][H:4]",
+        fragments=[Fragment(smiles="[H:1][C:2]#[C:3][H:4]", bond_indices=(2, 3))],
+        provenance={"version": "mock"},
+    )
+    mock_celery_task_meta(
+        redis_connection, "1", "SUCCESS", mock_fragmentation_result.json()
+    )
+
+    request = fragmenter_client.get("/fragmentations?ids=1&ids=2")
+    request.raise_for_status()
+
+    response = FragmenterGETPageResponse.parse_raw(request.text)
+    assert len(response.contents) == 2
+
+    assert response.contents[0].id == "1"
+    assert response.contents[0].status == "success"
+    assert response.contents[0].result == mock_fragmentation_result
+    assert "fragment-0-image" in response.contents[0].links
+
+    assert response.contents[1].id == "2"
+    assert response.contents[1].status == "waiting"
+    assert response.contents[1].result is None
+
+
 def test_post_fragment(fragmenter_client, redis_connection, monkeypatch):
     submitted_task_kwargs = mock_celery_task(worker, "fragment", monkeypatch)
 
@@ -70,6 +107,65 @@ def test_post_fragment(fragmenter_client, redis_connection, monkeypatch):
     assert result.self == "/api/v1/fragmentations/1"
 
 
+def test_post_fragment_batch(fragmenter_client, redis_connection, monkeypatch):
+    submitted_task_kwargs = mock_celery_task(
+        worker, "fragment_batch", monkeypatch, "batch-1"
+    )
+
+    request = fragmenter_client.post(
+        "/fragmentations/batches",
+        data=FragmenterBatchPOSTBody(
+            cmiles=[
+                "[H:3][C:1](=[C:2]([H:5])[H:6])[H:4]",
+                "[H:3][C:1]([H:4])([H:5])[C:2]([H:6])([H:7])[H:8]",
+            ],
+            fragmenter=PfizerFragmenter(),
+            target_bond_smarts=["[#6:1]-[#6:2]"],
+        ).json(),
+    )
+    request.raise_for_status()
+
+    result = FragmenterBatchPOSTResponse.parse_raw(request.text)
+    assert result.id == "batch-1"
+    assert result.self == "/api/v1/fragmentations/batches/batch-1"
+
+    assert len(result.contents) == 2
+    assert [link.id for link in result.contents] == [
+        *json.loads(submitted_task_kwargs["parents_json"])
+    ]
+    assert submitted_task_kwargs["fragmentation_ids"] == [
+        link.id for link in result.contents
+    ]
+
+    for link in result.contents:
+        assert link.self == f"/api/v1/fragmentations/{link.id}"
+
+
+def test_get_fragment_batch(fragmenter_client, redis_connection):
+    mock_batch_result = FragmenterBatchResult(
+        fragmentation_ids=["1", "2"],
+        fragments=[
+            FragmenterBatchFragment(
+                smiles="C=C",
+                central_bond_symmetry=(1, 1),
+                occurrences=[("1", 0), ("2", 0)],
+            )
+        ],
+    )
+    mock_celery_task_meta(
+        redis_connection, "batch-1", "SUCCESS", mock_batch_result.json()
+    )
+
+    request = fragmenter_client.get("/fragmentations/batches/batch-1")
+    request.raise_for_status()
+
+    result = FragmenterBatchGETResponse.parse_raw(request.text)
+
+    assert result.id == "batch-1"
+    assert result.status == "success"
+    assert result.result == mock_batch_result
+
+
 def test_get_molecule_image(fragmenter_client, monkeypatch):
     _mock_fragment(monkeypatch)
 
@@ -0,0 +1,78 @@
+import copy
+
+from openff.fragmenter import fragment as fragment_module
+from openff.toolkit.topology import Molecule
+
+from openff.bespokefit.executor.services.fragmenter.bond_orders import (
+    BondOrderCache,
+    cache_bond_orders,
+    get_bond_order_cache_statistics,
+)
+
+
+def _mock_assign_bond_orders(molecule: Molecule, **_) -> Molecule:
+    molecule = copy.deepcopy(molecule)
+
+    for bond in molecule.bonds:
+        atomic_numbers = sorted([bond.atom1.atomic_number, bond.atom2.atomic_number])
+        bond.fractional_bond_order = (
+            atomic_numbers[0] + 0.1 * atomic_numbers[1] + 0.01 * bond.bond_order
+        )
+
+    return molecule
+
+
+def test_bond_order_cache(redis_connection):
+    molecule = _mock_assign_bond_orders(Molecule.from_smiles("OCC=O"))
+
+    bond_order_cache = BondOrderCache(redis_connection)
+    assert bond_order_cache.get(molecule, max_confs=1) is None
+
+    bond_order_cache.set(molecule, max_confs=1)
+
+    # the bond orders should be re-usable by a molecule with a different atom order
+    reordered_molecule = molecule.remap(
+        {i: molecule.n_atoms - i - 1 for i in range(molecule.n_atoms)}
+    )
+    cached_molecule = bond_order_cache.get(reordered_molecule, max_confs=1)
+
+    assert cached_molecule is not None
+    assert cached_molecule is not reordered_molecule
+
+    expected_molecule = _mock_assign_bond_orders(reordered_molecule)
+
+    assert [bond.fractional_bond_order for bond in cached_molecule.bonds] == [
+        bond.fractional_bond_order for bond in expected_molecule.bonds
+    ]
+
+    # different conformer settings should not share bond orders
+    assert bond_order_cache.get(molecule, max_confs=2) is None
+
+    assert get_bond_order_cache_statistics(redis_connection) == {
+        "hits": 1,
+        "misses": 2,
+        "hit_rate": 1.0 / 3.0,
+    }
+
+
+def test_cache_bond_orders(redis_connection, monkeypatch):
+    n_calls = 0
+
+    def mock_assign_bond_orders(molecule: Molecule, **kwargs) -> Molecule:
+        nonlocal n_calls
+        n_calls += 1
+
+        return _mock_assign_bond_orders(molecule, **kwargs)
+
+    monkeypatch.setattr(
+        fragment_module, "assign_elf10_am1_bond_orders", mock_assign_bond_orders
+    )
+
+    with cache_bond_orders(redis_connection):
+        for smiles in ["CCO", "OCC", "CCC"]:
+            fragment_module.assign_elf10_am1_bond_orders(Molecule.from_smiles(smiles))
+
+    assert n_calls == 2
+    assert fragment_module.assign_elf10_am1_bond_orders == mock_assign_bond_orders
+
+    assert get_bond_order_cache_statistics(redis_connection)["hits"] == 1
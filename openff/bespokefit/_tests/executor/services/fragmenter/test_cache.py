@@ -1,11 +1,17 @@
+import json
+
 from openff.fragmenter.fragment import WBOFragmenter
 
 from openff.bespokefit._tests.executor.mocking.celery import mock_celery_task
 from openff.bespokefit.executor.services.fragmenter import worker
 from openff.bespokefit.executor.services.fragmenter.cache import (
+    cached_fragmentation_batch_task,
     cached_fragmentation_task,
 )
-from openff.bespokefit.executor.services.fragmenter.models import FragmenterPOSTBody
+from openff.bespokefit.executor.services.fragmenter.models import (
+    FragmenterBatchPOSTBody,
+    FragmenterPOSTBody,
+)
 
 
 def test_cached_fragmentation_task(fragmenter_client, redis_connection, monkeypatch):
@@ -38,3 +44,63 @@ def test_cached_fragmentation_task(fragmenter_client, redis_connection, monkeypa
         cached_fragmentation_task(task=task, redis_connection=redis_connection)
         == "task-2"
     )
+
+
+def test_cached_fragmentation_batch_task(redis_connection, monkeypatch):
+    """
+    Make sure batches re-use and populate the same cache as single fragmentations.
+    """
+
+    target_bond_smarts = ["[#6:1]-[#6:2]"]
+
+    mock_celery_task(worker, "fragment", monkeypatch, "task-1")
+    cached_id = cached_fragmentation_task(
+        task=FragmenterPOSTBody(
+            cmiles="[H:4][C:1]([H:5])([H:6])[C:2]([H:7])([H:8])[O:3][H:9]",
+            fragmenter=WBOFragmenter(),
+            target_bond_smarts=target_bond_smarts,
+        ),
+        redis_connection=redis_connection,
+    )
+
+    submitted_task_kwargs = mock_celery_task(
+        worker, "fragment_batch", monkeypatch, "batch-1"
+    )
+
+    batch_id, task_ids = cached_fragmentation_batch_task(
+        task=FragmenterBatchPOSTBody(
+            cmiles=[
+                "[H:4][C:1]([H:5])([H:6])[C:2]([H:7])([H:8])[O:3][H:9]",
+                "[H:4][C:1]([H:5])([H:6])[C:2]([H:7])([H:8])[C:3]([H:9])([H:10])[H:11]",
+                # the same molecule with a different atom order
+                "[H:4][C:3]([H:5])([H:6])[C:2]([H:7])([H:8])[C:1]([H:9])([H:10])[H:11]",
+            ],
+            fragmenter=WBOFragmenter(),
+            target_bond_smarts=target_bond_smarts,
+        ),
+        redis_connection=redis_connection,
+    )
+
+    assert batch_id == "batch-1"
+
+    assert len(task_ids) == 3
+    assert task_ids[0] == cached_id == "task-1"
+    assert task_ids[1] == task_ids[2] != cached_id
+
+    # only the new molecule should be fragmented
+    assert [*json.loads(submitted_task_kwargs["parents_json"])] == [task_ids[1]]
+    assert submitted_task_kwargs["fragmentation_ids"] == task_ids
+
+    # the molecule should now be cached for later single fragmentations
+    mock_celery_task(worker, "fragment", monkeypatch, "task-2")
+    assert (
+        cached_fragmentation_task(
+            task=FragmenterPOSTBody(
+                cmiles="[H:4][C:1]([H:5])([H:6])[C:2]([H:7])([H:8])[C:3]([H:9])([H:10])[H:11]",
+                fragmenter=WBOFragmenter(),
+                target_bond_smarts=target_bond_smarts,
+            ),
+            redis_connection=redis_connection,
+        )
+        == task_ids[1]
+    )
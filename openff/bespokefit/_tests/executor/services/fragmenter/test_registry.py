@@ -0,0 +1,60 @@
+from openff.fragmenter.fragment import Fragment
+from openff.toolkit.topology import Molecule
+
+from openff.bespokefit.executor.services.fragmenter.registry import (
+    FragmentRegistry,
+    get_fragment_key,
+    get_fragment_registry_statistics,
+)
+
+
+def _pentane_fragment(bond_indices) -> Fragment:
+    # the heavy atoms of the molecule are mapped 1-5 along the chain
+    smiles = Molecule.from_smiles("CCCCC").to_smiles(mapped=True)
+    return Fragment(smiles=smiles, bond_indices=bond_indices)
+
+
+def test_get_fragment_key():
+    # the 2-3 and 3-4 bonds of pentane are symmetry equivalent but 1-2 is not
+    assert get_fragment_key(_pentane_fragment((2, 3))) == get_fragment_key(
+        _pentane_fragment((4, 3))
+    )
+    assert get_fragment_key(_pentane_fragment((2, 3))) != get_fragment_key(
+        _pentane_fragment((1, 2))
+    )
+
+
+def test_fragment_registry(redis_connection):
+    registry = FragmentRegistry(redis_connection)
+
+    fragment_a = registry.subscribe("1", _pentane_fragment((2, 3)), "spec-a")
+    assert fragment_a.bond_indices == (2, 3)
+
+    # a second task with an equivalent fragment should share the first entry
+    fragment_b = registry.subscribe("2", _pentane_fragment((3, 4)), "spec-a")
+    assert fragment_b.bond_indices == (2, 3)
+
+    # but not if a different QC calculation will be run
+    fragment_c = registry.subscribe("2", _pentane_fragment((3, 4)), "spec-b")
+    assert fragment_c.bond_indices == (3, 4)
+
+    # re-subscribing should be a no-op
+    registry.subscribe("1", _pentane_fragment((2, 3)), "spec-a")
+
+    assert registry.subscribers(_pentane_fragment((2, 3)), "spec-a") == ["1", "2"]
+
+    assert get_fragment_registry_statistics(redis_connection) == {
+        "entries": 2,
+        "subscriptions": 3,
+        "qc_calculations_saved": 1,
+    }
+    assert get_fragment_registry_statistics(redis_connection, ["2"]) == {
+        "entries": 2,
+        "subscriptions": 2,
+        "qc_calculations_saved": 0,
+    }
+    assert get_fragment_registry_statistics(redis_connection, []) == {
+        "entries": 0,
+        "subscriptions": 0,
+        "qc_calculations_saved": 0,
+    }
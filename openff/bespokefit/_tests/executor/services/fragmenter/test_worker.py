@@ -2,6 +2,7 @@ import json
 import os
 
 from openff.fragmenter.fragment import (
+    Fragment,
     FragmentationResult,
     PfizerFragmenter,
     WBOFragmenter,
@@ -9,7 +10,9 @@ from openff.fragmenter.fragment import (
 from openff.toolkit.topology import Molecule
 from openff.utilities import get_data_file_path
 
-from openff.bespokefit.executor.services.fragmenter import worker
+from openff.bespokefit.executor.services.fragmenter import registry, worker
+from openff.bespokefit.executor.services.fragmenter.models import FragmenterBatchResult
+from openff.bespokefit.executor.utilities.celery import get_task_information
 from openff.bespokefit.workflows.bespoke import _DEFAULT_ROTATABLE_SMIRKS
 
 
@@ -38,6 +41,43 @@ def test_fragment():
     assert result.provenance["options"]["scheme"] == "Pfizer"
 
 
+def test_fragment_batch(monkeypatch):
+    # fragment the parents in this process rather than a pool
+    monkeypatch.setattr(worker, "_n_batch_processes", lambda n_parents: 1)
+
+    molecule = Molecule.from_smiles("CCCCCC")
+
+    result_json = worker.fragment_batch(
+        parents_json=json.dumps(
+            {
+                "parent-1": molecule.to_smiles(mapped=True),
+                "parent-2": molecule.to_smiles(mapped=True),
+                "parent-3": "invalid-cmiles",
+            }
+        ),
+        fragmentation_ids=["parent-1", "parent-2", "parent-3"],
+        fragmenter_json=PfizerFragmenter().json(),
+        target_bond_smarts=["[#6]-[#6]-[#6:1]-[#6:2]-[#6]-[#6]"],
+    )
+    result = FragmenterBatchResult.parse_raw(result_json)
+
+    assert result.fragmentation_ids == ["parent-1", "parent-2", "parent-3"]
+
+    for parent_id in ["parent-1", "parent-2"]:
+        task_info = get_task_information(worker.celery_app, parent_id)
+        assert task_info["status"] == "success"
+
+        fragmentation_result = FragmentationResult.parse_obj(task_info["result"])
+        assert len(fragmentation_result.fragments) == 1
+
+    # the fragments of the two identical parents should be grouped together
+    assert len(result.fragments) == 1
+    assert result.fragments[0].occurrences == [("parent-1", 0), ("parent-2", 0)]
+
+    # the failure to fragment one parent should be reported against that parent alone
+    assert get_task_information(worker.celery_app, "parent-3")["status"] == "errored"
+
+
 def test_fragment_mock(bace):
     """
     Test mocking a fragmentation result, when we want to scan a torsion but not fragment the molecule.
@@ -89,6 +129,59 @@ def test_fragmentation_symmetry_fragments():
     assert len(result.fragment_molecules) == 1
 
 
+def test_deduplicate_fragments_analyses_once(monkeypatch):
+    """Make sure each fragment of a result with many equivalent fragments is only
+    parsed and analysed once when de-duplicating."""
+
+    molecule = Molecule.from_smiles("CCCCCCCCCC")
+    smiles = molecule.to_smiles(mapped=True)
+
+    # three copies of a fragment around each of the nine C-C bonds of decane, which
+    # fall into five symmetry groups.
+    fragments = [
+        Fragment(smiles=smiles, bond_indices=(i, i + 1))
+        for _ in range(3)
+        for i in range(1, 10)
+    ]
+
+    n_parses, n_symmetry_calls = 0, 0
+
+    def molecule_property(fragment):
+        nonlocal n_parses
+        n_parses += 1
+        return Molecule.from_mapped_smiles(fragment.smiles)
+
+    def get_atom_symmetries(fragment_molecule):
+        nonlocal n_symmetry_calls
+        n_symmetry_calls += 1
+        return original_get_atom_symmetries(fragment_molecule)
+
+    original_get_atom_symmetries = registry.get_atom_symmetries
+
+    monkeypatch.setattr(Fragment, "molecule", property(molecule_property))
+    monkeypatch.setattr(registry, "get_atom_symmetries", get_atom_symmetries)
+
+    fragmentation_result = FragmentationResult(
+        parent_smiles=smiles,
+        fragments=fragments,
+        provenance={},
+    )
+
+    result = worker._deduplicate_fragments(fragmentation_result)
+
+    assert len(result.fragments) == 5
+    assert sorted(tuple(sorted(f.bond_indices)) for f in result.fragments) == [
+        (1, 2),
+        (2, 3),
+        (3, 4),
+        (4, 5),
+        (5, 6),
+    ]
+
+    assert n_parses == len(fragments)
+    assert n_symmetry_calls == len(fragments)
+
+
 def test_fragmentation_equivalent_no_symmetry():
     """Make sure duplicated fragments which are not symmetry equivalent are not filtered."""
 
@@ -0,0 +1,68 @@
+from openff.toolkit.typing.engines.smirnoff import ForceField
+
+from openff.bespokefit.executor.services.optimizer.cache import (
+    StageResultCache,
+    _hash_stage,
+    get_stage_result_cache_statistics,
+)
+from openff.bespokefit.schema.fitting import OptimizationStageSchema
+from openff.bespokefit.schema.optimizers import ForceBalanceSchema
+from openff.bespokefit.schema.results import OptimizationStageResults
+from openff.bespokefit.schema.smirnoff import ProperTorsionSMIRKS
+
+
+def _create_stage(max_iterations: int = 1) -> OptimizationStageSchema:
+    return OptimizationStageSchema(
+        parameters=[
+            ProperTorsionSMIRKS(
+                smirks="[*:1]-[#6X4:2]-[#6X4:3]-[*:4]", attributes={"k1", "k2", "k3"}
+            )
+        ],
+        parameter_hyperparameters=[],
+        targets=[],
+        optimizer=ForceBalanceSchema(max_iterations=max_iterations),
+    )
+
+
+def test_hash_stage():
+    force_field = ForceField("openff-2.2.0.offxml")
+    stage = _create_stage()
+
+    reordered_stage = stage.copy(deep=True)
+    reordered_stage.parameters[0].attributes = {"k3", "k2", "k1"}
+
+    assert _hash_stage(stage, force_field) == _hash_stage(reordered_stage, force_field)
+
+    # the optimizer settings and the initial force field should both change the hash
+    assert _hash_stage(stage, force_field) != _hash_stage(_create_stage(2), force_field)
+    assert _hash_stage(stage, force_field) != _hash_stage(
+        stage, ForceField("openff-2.1.0.offxml")
+    )
+
+
+def test_stage_result_cache(redis_connection):
+    force_field = ForceField("openff-2.2.0.offxml")
+    stage = _create_stage()
+
+    stage_cache = StageResultCache(redis_connection)
+    assert stage_cache.get(stage, force_field) is None
+
+    # failed stages should not be cached
+    stage_cache.set(stage, force_field, OptimizationStageResults(status="errored"))
+    assert stage_cache.get(stage, force_field) is None
+
+    result = OptimizationStageResults(
+        provenance={"ForceBalance": "1.0"},
+        status="success",
+        refit_force_field=force_field.to_string(),
+    )
+    stage_cache.set(stage, force_field, result)
+
+    assert stage_cache.get(stage, force_field) == result
+    assert stage_cache.get(_create_stage(2), force_field) is None
+
+    assert get_stage_result_cache_statistics(redis_connection) == {
+        "hits": 1,
+        "misses": 3,
+        "hit_rate": 0.25,
+    }
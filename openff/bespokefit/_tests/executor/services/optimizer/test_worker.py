@@ -1,10 +1,22 @@
 import json
+import os
+from multiprocessing.pool import ThreadPool
+from types import SimpleNamespace
 
+import pytest
+from celery.concurrency.solo import TaskPool as SoloTaskPool
 from openff.fragmenter.fragment import WBOFragmenter
 from openff.toolkit.typing.engines.smirnoff import ForceField
+from openff.units import unit
 
-from openff.bespokefit.executor.services.coordinator.utils import _hash_fitting_schema
+from openff.bespokefit.executor.services.coordinator.utils import (
+    _hash_fitting_schema,
+    get_cached_force_field,
+)
 from openff.bespokefit.executor.services.optimizer import worker
+from openff.bespokefit.executor.services.optimizer.cache import (
+    get_stage_result_cache_statistics,
+)
 from openff.bespokefit.optimizers import ForceBalanceOptimizer
 from openff.bespokefit.schema.fitting import (
     BespokeOptimizationSchema,
@@ -80,7 +92,7 @@ def test_optimize(monkeypatch, redis_connection):
 
     # make sure the ff parameters were cached
     task_hash = _hash_fitting_schema(fitting_schema=result.input_schema)
-    cached_ff_string = redis_connection.get(task_hash)
+    cached_ff_string = get_cached_force_field(redis_connection, task_hash)
     assert cached_ff_string is not None
 
     # make sure our expected parameter has been cached
@@ -89,6 +101,62 @@ def test_optimize(monkeypatch, redis_connection):
     assert "[*:1]-[#6X4:2]-[#6X4:3]-[*:4]" in torsion_handler.parameters
 
 
+def test_optimize_stage_result_cache(monkeypatch, redis_connection):
+    """
+    Make sure a stage which is submitted again with the same inputs is not re-fit.
+    """
+    input_schema = BespokeOptimizationSchema(
+        id="test",
+        smiles="CC",
+        initial_force_field="openff-2.2.0.offxml",
+        initial_force_field_hash="test_hash",
+        target_torsion_smirks=[],
+        stages=[
+            OptimizationStageSchema(
+                parameters=[
+                    ProperTorsionSMIRKS(
+                        smirks="[*:1]-[#6X4:2]-[#6X4:3]-[*:4]", attributes={"k1"}
+                    )
+                ],
+                parameter_hyperparameters=[],
+                targets=[],
+                optimizer=ForceBalanceSchema(max_iterations=1),
+            )
+        ],
+        fragmentation_engine=WBOFragmenter(),
+    )
+
+    n_calls = 0
+
+    def mock_optimize(schema, initial_force_field, root_directory=None):
+        nonlocal n_calls
+        n_calls += 1
+
+        return OptimizationStageResults(
+            provenance={},
+            status="success",
+            refit_force_field=initial_force_field.to_string(),
+        )
+
+    monkeypatch.setattr(ForceBalanceOptimizer, "optimize", mock_optimize)
+
+    results = [
+        BespokeOptimizationResults.parse_raw(
+            worker.optimize(optimization_input_json=input_schema.json())
+        )
+        for _ in range(2)
+    ]
+
+    assert n_calls == 1
+    assert results[0].stages == results[1].stages
+
+    assert get_stage_result_cache_statistics(redis_connection) == {
+        "hits": 1,
+        "misses": 1,
+        "hit_rate": 0.5,
+    }
+
+
 def test_optimise_cache(bespoke_optimization_schema):
     """
     Make sure any stages with cached parameters are skipped and a mock result is returned.
@@ -100,3 +168,128 @@ def test_optimise_cache(bespoke_optimization_schema):
     result = BespokeOptimizationResults.parse_raw(result_json)
     assert result.status == "success"
     assert result.stages[0].provenance["skipped"] == "True"
+
+
+@pytest.mark.parametrize(
+    "mode, expected_started", [("in-process", True), ("subprocess", False)]
+)
+def test_start_force_balance_runner_solo(mode, expected_started, monkeypatch):
+    """Make sure the ForceBalance runner is pre-warmed by the solo pool that optimizer
+    workers are launched with."""
+
+    monkeypatch.setenv("BEFLOW_OPTIMIZER_FORCEBALANCE_MODE", mode)
+
+    started = []
+    monkeypatch.setattr(
+        worker,
+        "get_force_balance_runner",
+        lambda: SimpleNamespace(start=lambda: started.append(True)),
+    )
+
+    SoloTaskPool()
+
+    assert started == ([True] if expected_started else [])
+
+
+def test_n_stage_processes(monkeypatch):
+    monkeypatch.setenv("BEFLOW_OPTIMIZER_WORKER_N_CORES", "4")
+
+    assert worker._n_stage_processes(2) == 2
+    assert worker._n_stage_processes(8) == 4
+
+    # daemonic processes cannot have children
+    monkeypatch.setattr(
+        worker,
+        "current_process",
+        lambda: SimpleNamespace(name="Process-1", daemon=True),
+    )
+    assert worker._n_stage_processes(8) == 1
+
+
+@pytest.mark.parametrize("n_processes", [1, 2])
+def test_optimize_split_stage(n_processes, monkeypatch, tmpdir):
+    """
+    Make sure each sub-stage of a split stage is optimized and the results merged.
+    """
+    monkeypatch.setenv("BEFLOW_OPTIMIZER_SPLIT_STAGES", "True")
+    monkeypatch.setattr(worker, "_n_stage_processes", lambda n_sub_stages: n_processes)
+
+    pool_sizes = []
+
+    def mock_pool(processes):
+        # use threads rather than spawned processes so that the mocks below apply
+        pool_sizes.append(processes)
+        return ThreadPool(processes)
+
+    monkeypatch.setattr(
+        worker, "get_context", lambda method: SimpleNamespace(Pool=mock_pool)
+    )
+
+    smirks = ["[*:1]-[#6X4:2]-[#6X4:3]-[*:4]", "[#1:1]-[#6X4:2]-[#8X2:3]-[#1:4]"]
+
+    initial_force_field = ForceField("openff-2.2.0.offxml")
+    initial_force_field["ProperTorsions"].add_parameter(
+        {
+            "smirks": smirks[1],
+            "periodicity": [3],
+            "phase": [0.0 * unit.degree],
+            "k": [0.0 * unit.kilocalorie_per_mole],
+            "idivf": [1.0],
+        }
+    )
+
+    stage = OptimizationStageSchema(
+        parameters=[
+            ProperTorsionSMIRKS(smirks=pattern, attributes={"k1"}) for pattern in smirks
+        ],
+        parameter_hyperparameters=[],
+        targets=[],
+        optimizer=ForceBalanceSchema(max_iterations=1),
+    )
+    sub_stages = [
+        stage.copy(update={"parameters": [parameter]}) for parameter in stage.parameters
+    ]
+
+    monkeypatch.setattr(worker, "split_optimization_stage", lambda *args: [*sub_stages])
+
+    received_schemas = []
+
+    def mock_optimize(schema, initial_force_field, root_directory=None):
+        received_schemas.append((schema, root_directory))
+
+        force_field = ForceField(initial_force_field.to_string())
+        force_field["ProperTorsions"].parameters[schema.parameters[0].smirks].k1 = (
+            1.0 * unit.kilocalorie_per_mole
+        )
+
+        return OptimizationStageResults(
+            provenance={},
+            status="success",
+            refit_force_field=force_field.to_string(),
+        )
+
+    monkeypatch.setattr(ForceBalanceOptimizer, "optimize", mock_optimize)
+
+    with tmpdir.as_cwd():
+        result = worker._optimize_split_stage(stage, initial_force_field, "stage_0")
+
+    # the sub-stages may be fit in any order when run in parallel
+    received_schemas = sorted(received_schemas, key=lambda item: item[1])
+
+    assert [schema for schema, _ in received_schemas] == sub_stages
+    assert [os.path.basename(directory) for _, directory in received_schemas] == [
+        "sub_fit_0",
+        "sub_fit_1",
+    ]
+
+    assert pool_sizes == ([] if n_processes == 1 else [n_processes])
+
+    assert result.status == "success"
+    assert result.provenance["n_sub_fits"] == "2"
+
+    refit_handler = ForceField(result.refit_force_field)["ProperTorsions"]
+
+    for pattern in smirks:
+        assert refit_handler.parameters[pattern].k1.m_as(
+            unit.kilocalorie_per_mole
+        ) == pytest.approx(1.0)
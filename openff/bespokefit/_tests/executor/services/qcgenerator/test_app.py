@@ -1,3 +1,5 @@
+import json
+
 import numpy
 import pytest
 from celery.result import AsyncResult
@@ -11,7 +13,10 @@ from qcelemental.models.procedures import (
     TorsionDriveResult,
 )
 
-from openff.bespokefit._tests.executor.mocking.celery import mock_celery_task
+from openff.bespokefit._tests.executor.mocking.celery import (
+    mock_celery_task,
+    mock_celery_task_meta,
+)
 from openff.bespokefit.executor.services.qcgenerator import worker
 from openff.bespokefit.executor.services.qcgenerator.app import _retrieve_qc_result
 from openff.bespokefit.executor.services.qcgenerator.cache import _canonicalize_task
@@ -87,6 +92,35 @@ def test_retrieve_qc_result_pending_running_errored(
     assert result.id == "1"
 
 
+def test_retrieve_qc_result_progress(redis_connection, monkeypatch):
+    monkeypatch.setattr(
+        AsyncResult,
+        "_get_task_meta",
+        lambda self: {"status": "STARTED", "result": {}},
+    )
+    redis_connection.hset("qcgenerator:types", "1", "torsion1d")
+    redis_connection.set(
+        "qcgenerator:progress:1",
+        json.dumps(
+            {
+                "iteration": 1,
+                "n_grid_points": 24,
+                "completed_grid_ids": ["[0]"],
+                "energies": {"[0]": -1.0},
+            }
+        ),
+    )
+
+    result = QCGeneratorGETResponse.parse_obj(_retrieve_qc_result("1", True))
+
+    assert result.status == "running"
+    assert result.progress is not None
+    assert result.progress.iteration == 1
+    assert result.progress.n_grid_points == 24
+    assert result.progress.completed_grid_ids == ["[0]"]
+    assert result.progress.energies == {"[0]": -1.0}
+
+
 def test_retrieve_qc_result_success(
     qcgenerator_client, redis_connection, monkeypatch, mock_atomic_result
 ):
@@ -182,6 +216,7 @@ def test_post_qc_result(
     result = QCGeneratorPOSTResponse.parse_raw(request.text)
     assert result.id == "1"
     assert result.self == "/api/v1/qc-calcs/1"
+    assert result.input_schema.json() == _canonicalize_task(task).json()
 
 
 @pytest.mark.parametrize("include_result", [True, False])
@@ -192,28 +227,49 @@ def test_get_qc_results(
     mock_atomic_result,
     include_result,
 ):
-    monkeypatch.setattr(
-        AsyncResult,
-        "_get_task_meta",
-        lambda self: {"status": "SUCCESS", "result": mock_atomic_result.json()},
+    for task_id in ["1", "2"]:
+        mock_celery_task_meta(
+            redis_connection, task_id, "SUCCESS", mock_atomic_result.json()
+        )
+
+    mock_celery_task_meta(redis_connection, "3", "STARTED")
+    redis_connection.set(
+        "qcgenerator:progress:3",
+        json.dumps(
+            {
+                "iteration": 1,
+                "n_grid_points": 24,
+                "completed_grid_ids": ["[0]"],
+                "energies": {"[0]": -1.0},
+            }
+        ),
     )
 
     redis_connection.hset("qcgenerator:types", "1", "hessian")
     redis_connection.hset("qcgenerator:types", "2", "hessian")
+    redis_connection.hset("qcgenerator:types", "3", "torsion1d")
 
     request = qcgenerator_client.get(
-        f"/qc-calcs?ids=1&ids=2&results={str(include_result).lower()}"
+        f"/qc-calcs?ids=1&ids=2&ids=3&results={str(include_result).lower()}"
     )
     request.raise_for_status()
 
     response = QCGeneratorGETPageResponse.parse_raw(request.text)
-    assert len(response.contents) == 2
+    assert len(response.contents) == 3
 
-    for i, result in enumerate(response.contents):
+    for i, result in enumerate(response.contents[:2]):
         assert result.status == "success"
         assert (result.result is not None) == include_result
         assert result.type == "hessian"
         assert result.id == f"{i + 1}"
+        assert result.progress is None
+
+    running_result = response.contents[2]
+
+    assert running_result.status == "running"
+    assert running_result.result is None
+    assert running_result.type == "torsion1d"
+    assert running_result.progress.completed_grid_ids == ["[0]"]
 
 
 def test_get_molecule_image_atomic_result(
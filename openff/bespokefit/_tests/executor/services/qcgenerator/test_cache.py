@@ -3,10 +3,12 @@ from openff.utilities import skip_if_missing
 from qcelemental.models.common_models import Model
 
 from openff.bespokefit._tests.executor.mocking.celery import mock_celery_task
-from openff.bespokefit.executor.services.qcgenerator import worker
+from openff.bespokefit.executor.services.qcgenerator import cache, worker
 from openff.bespokefit.executor.services.qcgenerator.cache import (
+    _canonical_task_json,
     _canonicalize_task,
     cached_compute_task,
+    canonicalize_task,
 )
 from openff.bespokefit.schema.tasks import HessianTask, OptimizationTask, Torsion1DTask
 
@@ -25,6 +27,33 @@ def test_canonicalize_torsion_task():
     assert canonical_task.central_bond == (1, 2)
 
 
+def test_canonicalize_task_memoised(redis_connection, monkeypatch):
+    original_task = Torsion1DTask(
+        smiles="[H:1][C:2]([H:3])([H:4])[O:5][H:6]",
+        central_bond=(2, 5),
+        program="rdkit",
+        model=Model(method="uff", basis=None),
+    )
+    expected_task = _canonicalize_task(original_task)
+
+    canonical_task = canonicalize_task(original_task, redis_connection)
+    assert canonical_task.json() == expected_task.json()
+    # both the original and canonical forms should be stored in redis
+    assert redis_connection.hlen("qcgenerator:canonical-tasks") == 2
+
+    def _raise(*_):
+        raise AssertionError("the task should not be re-canonicalized")
+
+    monkeypatch.setattr(cache, "_canonicalize_task", _raise)
+
+    # repeat lookups should hit the in-memory cache
+    assert canonicalize_task(original_task, redis_connection) == canonical_task
+    # and after the in-memory cache is cleared, the persisted redis cache
+    _canonical_task_json.cache_clear()
+    assert canonicalize_task(original_task, redis_connection) == canonical_task
+    assert canonicalize_task(canonical_task, redis_connection) == canonical_task
+
+
 @pytest.mark.parametrize(
     "task, compute_function",
     [
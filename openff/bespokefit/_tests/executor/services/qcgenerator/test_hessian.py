@@ -0,0 +1,72 @@
+import numpy
+from openff.toolkit.topology import Molecule
+from qcelemental.models import AtomicResult, AtomicResultProperties, DriverEnum
+from qcelemental.models.common_models import Model, Provenance
+from qcengine.config import TaskConfig
+
+from openff.bespokefit.executor.services.qcgenerator import hessian
+from openff.bespokefit.executor.services.qcgenerator.hessian import (
+    _displaced_molecules,
+    compute_finite_difference_hessian,
+)
+
+
+def test_displaced_molecules():
+    molecule: Molecule = Molecule.from_smiles("O")
+    molecule.generate_conformers(n_conformers=1)
+
+    qc_molecule = molecule.to_qcschema()
+
+    displaced_molecules = _displaced_molecules(qc_molecule, 0.1)
+    assert len(displaced_molecules) == 6 * molecule.n_atoms
+
+    forward_delta = displaced_molecules[2].geometry - qc_molecule.geometry
+    backward_delta = displaced_molecules[3].geometry - qc_molecule.geometry
+
+    assert numpy.isclose(forward_delta[0, 1], 0.1)
+    assert numpy.isclose(backward_delta[0, 1], -0.1)
+
+    assert numpy.isclose(numpy.abs(forward_delta).sum(), 0.1)
+
+
+def test_compute_finite_difference_hessian(monkeypatch):
+    """Make sure the hessian of a harmonic potential is recovered."""
+
+    molecule: Molecule = Molecule.from_smiles("O")
+    molecule.generate_conformers(n_conformers=1)
+
+    qc_molecule = molecule.to_qcschema()
+    reference_geometry = qc_molecule.geometry.flatten()
+
+    n_coordinates = 3 * molecule.n_atoms
+
+    random_matrix = numpy.random.random((n_coordinates, n_coordinates))
+    expected_hessian = random_matrix + random_matrix.T
+
+    def mock_compute_gradient(atomic_input, program, config):
+        delta = atomic_input.molecule.geometry.flatten() - reference_geometry
+
+        return AtomicResult(
+            **atomic_input.dict(exclude={"schema_name", "provenance"}),
+            return_result=expected_hessian @ delta,
+            properties=AtomicResultProperties(
+                return_energy=0.5 * delta @ expected_hessian @ delta
+            ),
+            success=True,
+            provenance=Provenance(creator="mock"),
+        )
+
+    monkeypatch.setattr(hessian, "_compute_gradient", mock_compute_gradient)
+
+    result = compute_finite_difference_hessian(
+        qc_molecule,
+        model=Model(method="uff", basis=None),
+        program="rdkit",
+        config=TaskConfig(ncores=1, nnodes=1, memory=1, retries=1),
+    )
+
+    assert result.driver == DriverEnum.hessian
+    assert result.extras["n_gradient_evaluations"] == 6 * molecule.n_atoms + 1
+
+    assert numpy.allclose(result.return_result, expected_hessian)
+    assert numpy.allclose(result.properties.return_gradient, 0.0)
@@ -1,7 +1,8 @@
 import pytest
 from openff.toolkit.topology import Molecule
-from qcelemental.models.common_models import DriverEnum, Model
+from qcelemental.models.common_models import DriverEnum, Model, Provenance
 from qcelemental.models.procedures import (
+    OptimizationResult,
     OptimizationSpecification,
     QCInputSpecification,
     TDKeywords,
@@ -10,11 +11,34 @@ from qcelemental.models.procedures import (
 from qcengine.config import TaskConfig
 
 from openff.bespokefit.executor.services.qcgenerator.qcengine import (
+    TorsionDriveCheckpoint,
     TorsionDriveProcedureParallel,
+    TorsionDriveProgress,
     _divide_config,
+    activate_checkpoint,
+    activate_progress,
 )
 
 
+@pytest.fixture()
+def ethane_torsion_drive_input() -> TorsionDriveInput:
+    molecule: Molecule = Molecule.from_smiles("CC")
+    molecule.generate_conformers(n_conformers=1)
+
+    return TorsionDriveInput(
+        keywords=TDKeywords(dihedrals=[(0, 1, 2, 3)], grid_spacing=[15]),
+        initial_molecule=[molecule.to_qcschema(conformer=0)],
+        input_specification=QCInputSpecification(
+            model=Model(method="hf", basis="6-31G*"),
+            driver=DriverEnum.gradient,
+        ),
+        optimization_spec=OptimizationSpecification(
+            procedure="geometric",
+            keywords={"program": "geometric"},
+        ),
+    )
+
+
 def test_divide_config():
     task_config = TaskConfig(ncores=5, nnodes=1, memory=7, retries=1)
     divided_config = _divide_config(task_config, 2)
@@ -65,3 +89,105 @@ class TestTorsionDriveProcedureParallel:
         )
 
         assert results == {"(0,)": [0, 1], "(1,)": [2, 3]}
+
+
+def test_torsion_drive_checkpoint(
+    redis_connection, ethane_torsion_drive_input, monkeypatch
+):
+    """Make sure optimizations stored in a checkpoint are not re-run."""
+
+    spawned_jobs = []
+
+    def mock_spawn_optimization(self, grid_point, job, input_model, config):
+        spawned_jobs.append((grid_point, job))
+
+        return OptimizationResult(
+            initial_molecule=input_model.initial_molecule[0],
+            final_molecule=input_model.initial_molecule[0],
+            input_specification=input_model.input_specification,
+            energies=[float(job[0])],
+            trajectory=[],
+            provenance=Provenance(creator="mock"),
+            success=True,
+        )
+
+    monkeypatch.setattr(
+        TorsionDriveProcedureParallel, "_spawn_optimization", mock_spawn_optimization
+    )
+
+    procedure = TorsionDriveProcedureParallel()
+    task_config = TaskConfig(ncores=1, nnodes=1, memory=5, retries=1)
+
+    checkpoint = TorsionDriveCheckpoint(redis_connection, "task-hash")
+    checkpoint.save_input(ethane_torsion_drive_input)
+
+    assert checkpoint.load_input() == ethane_torsion_drive_input
+
+    with activate_checkpoint(checkpoint):
+        results = procedure._spawn_optimizations(
+            {"[0]": [[0.0], [1.0]]}, ethane_torsion_drive_input, task_config
+        )
+        assert len(spawned_jobs) == 2
+
+        # simulate a re-delivered task re-running the same wavefront along with a
+        # new one.
+        resumed_results = procedure._spawn_optimizations(
+            {"[0]": [[0.0], [1.0]], "[15]": [[2.0]]},
+            ethane_torsion_drive_input,
+            task_config,
+        )
+
+    assert len(spawned_jobs) == 3
+    assert spawned_jobs[-1] == ("[15]", [2.0])
+
+    assert [result.energies[-1] for result in results["[0]"]] == [0.0, 1.0]
+    assert [result.energies[-1] for result in resumed_results["[0]"]] == [0.0, 1.0]
+    assert [result.energies[-1] for result in resumed_results["[15]"]] == [2.0]
+
+    checkpoint.clear()
+    assert checkpoint.load_input() is None
+
+
+def test_torsion_drive_progress(
+    redis_connection, ethane_torsion_drive_input, monkeypatch
+):
+    """Make sure the progress of a drive is published after each wavefront."""
+
+    def mock_spawn_optimization(self, grid_point, job, input_model, config):
+        return OptimizationResult(
+            initial_molecule=input_model.initial_molecule[0],
+            final_molecule=input_model.initial_molecule[0],
+            input_specification=input_model.input_specification,
+            energies=[float(job[0])],
+            trajectory=[],
+            provenance=Provenance(creator="mock"),
+            success=True,
+        )
+
+    monkeypatch.setattr(
+        TorsionDriveProcedureParallel, "_spawn_optimization", mock_spawn_optimization
+    )
+
+    procedure = TorsionDriveProcedureParallel()
+    task_config = TaskConfig(ncores=1, nnodes=1, memory=5, retries=1)
+
+    progress = TorsionDriveProgress(redis_connection, "task-id")
+    assert TorsionDriveProgress.load(redis_connection, "task-id") is None
+
+    with activate_progress(progress):
+        procedure._spawn_optimizations(
+            {"[0]": [[2.0], [1.0]]}, ethane_torsion_drive_input, task_config
+        )
+        procedure._spawn_optimizations(
+            {"[0]": [[0.5]], "[15]": [[3.0]]}, ethane_torsion_drive_input, task_config
+        )
+
+    assert TorsionDriveProgress.load(redis_connection, "task-id") == {
+        "iteration": 2,
+        "n_grid_points": 24,
+        "completed_grid_ids": ["[0]", "[15]"],
+        "energies": {"[0]": 0.5, "[15]": 3.0},
+    }
+
+    progress.clear()
+    assert TorsionDriveProgress.load(redis_connection, "task-id") is None
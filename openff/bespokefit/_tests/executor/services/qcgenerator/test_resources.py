@@ -0,0 +1,68 @@
+import threading
+import time
+
+from openff.bespokefit.executor.services.qcgenerator.resources import (
+    ResourceBudget,
+    get_worker_utilisation,
+    publish_utilisation,
+)
+
+
+def test_resource_budget_acquire():
+    budget = ResourceBudget(n_cores=4, memory=8.0)
+
+    with budget.acquire(2, 4.0):
+        with budget.acquire(2, 4.0):
+            assert budget.utilisation() == {
+                "n_tasks": 2,
+                "n_cores": 4,
+                "n_cores_used": 4,
+                "memory": 8.0,
+                "memory_used": 8.0,
+            }
+
+    assert budget.utilisation()["n_cores_used"] == 0
+    assert budget.utilisation()["n_tasks"] == 0
+
+
+def test_resource_budget_blocks():
+    budget = ResourceBudget(n_cores=2, memory=4.0)
+
+    admitted = threading.Event()
+
+    def _run_task():
+        with budget.acquire(2, 2.0):
+            admitted.set()
+
+    with budget.acquire(1, 1.0):
+        thread = threading.Thread(target=_run_task)
+        thread.start()
+
+        time.sleep(0.1)
+        # the second task needs more cores than are currently free
+        assert not admitted.is_set()
+
+    thread.join(timeout=5.0)
+    assert admitted.is_set()
+
+
+def test_resource_budget_oversized_task():
+    """An idle worker should always admit a task even if it exceeds the budget."""
+
+    budget = ResourceBudget(n_cores=2, memory=4.0)
+
+    with budget.acquire(8, 16.0):
+        assert budget.utilisation()["n_cores_used"] == 8
+
+
+def test_publish_utilisation(redis_connection):
+    budget = ResourceBudget(n_cores=4, memory=8.0)
+
+    with budget.acquire(1, 2.0):
+        publish_utilisation(budget, redis_connection, name="worker-1")
+
+    utilisation = get_worker_utilisation(redis_connection)
+
+    assert {*utilisation} == {"worker-1"}
+    assert utilisation["worker-1"]["n_cores_used"] == 1
+    assert utilisation["worker-1"]["memory_used"] == 2.0
@@ -0,0 +1,86 @@
+import pytest
+from qcelemental.models.common_models import Model
+
+from openff.bespokefit.executor.services import Settings
+from openff.bespokefit.executor.services.qcgenerator.routing import (
+    estimate_task_cost,
+    get_task_queue,
+    get_worker_queues,
+)
+from openff.bespokefit.schema.tasks import OptimizationTask, Torsion1DTask
+
+
+def _torsion_task(smiles: str, program: str, method: str, basis=None):
+    return Torsion1DTask(
+        smiles=smiles,
+        central_bond=(1, 2),
+        program=program,
+        model=Model(method=method, basis=basis),
+    )
+
+
+def test_estimate_task_cost():
+    small_task = _torsion_task("[CH3:1][CH3:2]", "xtb", "gfn2xtb")
+    large_task = _torsion_task("[CH3:1][CH2:2]CCCCCCCCCC", "psi4", "b3lyp-d3bj", "dzvp")
+
+    assert estimate_task_cost(small_task) < estimate_task_cost(large_task)
+
+    # a larger basis should cost more
+    assert estimate_task_cost(
+        large_task.copy(update={"model": Model(method="b3lyp", basis="def2-tzvp")})
+    ) > estimate_task_cost(large_task)
+
+    # fewer grid points should cost less
+    assert estimate_task_cost(
+        large_task.copy(update={"grid_spacing": 30})
+    ) < estimate_task_cost(large_task)
+
+    optimization_task = OptimizationTask(
+        smiles="[CH3:1][CH3:2]",
+        n_conformers=1,
+        program="xtb",
+        model=Model(method="gfn2xtb", basis=None),
+    )
+    assert estimate_task_cost(optimization_task) < estimate_task_cost(small_task)
+
+
+@pytest.mark.parametrize(
+    "routing, task, expected_queue",
+    [
+        (
+            "none",
+            _torsion_task("[CH3:1][CH3:2]", "xtb", "gfn2xtb"),
+            "qcgenerator",
+        ),
+        (
+            "program",
+            _torsion_task("[CH3:1][CH3:2]", "xtb", "gfn2xtb"),
+            "qcgenerator-xtb",
+        ),
+        (
+            "program",
+            _torsion_task("[CH3:1][CH3:2]", "PSI4", "b3lyp-d3bj", "dzvp"),
+            "qcgenerator-psi4",
+        ),
+        (
+            "program",
+            _torsion_task("[CH3:1][CH3:2]", "unknown-program", "method"),
+            "qcgenerator",
+        ),
+        (
+            "size",
+            _torsion_task("[CH3:1][CH3:2]", "xtb", "gfn2xtb"),
+            "qcgenerator-small",
+        ),
+        (
+            "size",
+            _torsion_task("[CH3:1][CH2:2]CCCCCCCCCC", "psi4", "b3lyp-d3bj", "dzvp"),
+            "qcgenerator-large",
+        ),
+    ],
+)
+def test_get_task_queue(routing, task, expected_queue):
+    with Settings(BEFLOW_QC_COMPUTE_QUEUE_ROUTING=routing).apply_env():
+        assert get_task_queue(task) == expected_queue
+
+        assert expected_queue in get_worker_queues()
@@ -1,11 +1,14 @@
 import json
 
+import numpy
 from openff.toolkit.topology import Molecule
+from qcelemental.models import AtomicResult, DriverEnum
 from qcelemental.models.common_models import Model
 from qcelemental.models.procedures import OptimizationResult, TorsionDriveResult
 
+from openff.bespokefit.executor.services import Settings
 from openff.bespokefit.executor.services.qcgenerator import worker
-from openff.bespokefit.schema.tasks import OptimizationTask, Torsion1DTask
+from openff.bespokefit.schema.tasks import HessianTask, OptimizationTask, Torsion1DTask
 
 
 def test_compute_torsion_drive():
@@ -102,3 +105,65 @@ def test_compute_optimization():
         # Make sure a molecule can be created from CMILES
         final_molecule = Molecule.from_mapped_smiles(cmiles)
         assert Molecule.are_isomorphic(final_molecule, Molecule.from_smiles("CCCCC"))
+
+
+def test_compute_hessian():
+    task = HessianTask(
+        smiles="[H:2][O:1][H:3]",
+        n_conformers=1,
+        program="rdkit",
+        model=Model(method="uff", basis=None),
+    )
+
+    result_json = worker.compute_hessian(task.json())
+    assert isinstance(result_json, str)
+
+    result = AtomicResult.parse_raw(result_json)
+    assert result.success
+    assert result.driver == DriverEnum.hessian
+
+    hessian = numpy.asarray(result.return_result).reshape((9, 9))
+    assert numpy.allclose(hessian, hessian.T)
+
+    cmiles = result.molecule.extras[
+        "canonical_isomeric_explicit_hydrogen_mapped_smiles"
+    ]
+    assert Molecule.are_isomorphic(
+        Molecule.from_mapped_smiles(cmiles), Molecule.from_smiles("O")
+    )[0]
+
+
+def test_task_config_pack_tasks():
+    """Cheap tasks should only be given a share of the workers cores when packing."""
+
+    cheap_task = Torsion1DTask(
+        smiles="[F][CH2:1][CH2:2][F]",
+        central_bond=(1, 2),
+        program="xtb",
+        model=Model(method="gfn2xtb", basis=None),
+    )
+    expensive_task = Torsion1DTask(
+        smiles="[F][CH2:1][CH2:2]CCCCCCCCCCCC[F]",
+        central_bond=(1, 2),
+        program="psi4",
+        model=Model(method="b3lyp-d3bj", basis="def2-tzvp"),
+    )
+
+    with Settings(
+        BEFLOW_QC_COMPUTE_WORKER_N_CORES=8, BEFLOW_QC_COMPUTE_WORKER_MAX_MEM=1.0
+    ).apply_env():
+        assert worker._task_config(cheap_task)["ncores"] == 8
+
+    with Settings(
+        BEFLOW_QC_COMPUTE_WORKER_N_CORES=8,
+        BEFLOW_QC_COMPUTE_WORKER_MAX_MEM=1.0,
+        BEFLOW_QC_COMPUTE_WORKER_PACK_TASKS=True,
+    ).apply_env():
+        full_config = worker._task_config()
+        cheap_config = worker._task_config(cheap_task)
+        expensive_config = worker._task_config(expensive_task)
+
+    assert full_config["ncores"] == 8
+    assert cheap_config["ncores"] == 1
+    assert cheap_config["memory"] < full_config["memory"]
+    assert expensive_config == full_config
@@ -2,6 +2,10 @@ import pytest
 from openff.toolkit.typing.engines.smirnoff import ForceField
 
 from openff.bespokefit.executor.services.coordinator.stages import QCGenerationStage
+from openff.bespokefit.executor.services.qcgenerator.models import (
+    QCGeneratorGETResponse,
+    QCGeneratorProgress,
+)
 
 
 def test_generate_torsions(ptp1b_fragment, ptp1b_input_schema_single):
@@ -85,3 +89,35 @@ async def test_generate_parameters_multiple_stages(
                 parameter.smirks
                 in force_field.get_parameter_handler(parameter.type).parameters
             )
+
+
+def test_summarize_progress():
+    """
+    Make sure the progress of running and completed torsion drives is summarized.
+    """
+    get_responses = [
+        QCGeneratorGETResponse(
+            id="1",
+            self="",
+            type="torsion1d",
+            status="running",
+            result=None,
+            error=None,
+            progress=QCGeneratorProgress(
+                iteration=2,
+                n_grid_points=24,
+                completed_grid_ids=["[0]", "[15]"],
+                energies={"[0]": -1.0, "[15]": -0.5},
+            ),
+        ),
+        QCGeneratorGETResponse(
+            id="2", self="", type="torsion1d", status="waiting", result=None, error=None
+        ),
+    ]
+
+    progress = QCGenerationStage._summarize_progress(get_responses)
+
+    assert progress.n_tasks == 2
+    assert progress.n_completed_tasks == 0
+    assert progress.n_grid_points == 24
+    assert progress.n_completed_grid_points == 2
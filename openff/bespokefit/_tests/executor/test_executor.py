@@ -221,9 +221,14 @@ class TestBespokeExecutor:
 
     def test_launch_workers(self, monkeypatch):
         launched_workers = {}
+        launched_queues = {}
 
-        def mock_spawn_worker(app, concurrency):
+        launched_pools = {}
+
+        def mock_spawn_worker(app, concurrency, queues=None, pool=None, daemon=True):
             launched_workers[app.main] = concurrency
+            launched_queues[app.main] = queues
+            launched_pools[app.main] = (pool, daemon)
 
         executor_module = importlib.import_module("openff.bespokefit.executor.executor")
         monkeypatch.setattr(executor_module, "spawn_worker", mock_spawn_worker)
@@ -238,6 +243,9 @@ class TestBespokeExecutor:
         executor._launch_workers()
 
         assert launched_workers == {"fragmenter": 3, "qcgenerator": 2, "optimizer": 1}
+        assert launched_queues["qcgenerator"] == ["qcgenerator"]
+        assert launched_pools["optimizer"] == ("solo", False)
+        assert launched_pools["fragmenter"] == (None, True)
 
     def test_start_already_started(self):
         executor = BespokeExecutor()
@@ -10,6 +10,7 @@ from openff.bespokefit.executor.utilities.celery import (
     configure_celery_app,
     get_status,
     get_task_information,
+    get_task_information_batch,
     spawn_worker,
 )
 
@@ -104,3 +105,27 @@ def test_get_task_information_error(celery_app, celery_worker):
     assert task_info["error"]["type"] == "RuntimeError"
     assert task_info["error"]["message"] == "mock error occured"
     assert task_info["error"]["traceback"] is not None
+
+
+def test_get_task_information_batch(celery_app, celery_worker):
+    success_result = mock_task_success.delay()
+    success_result.get(timeout=10)
+
+    error_result = mock_task_error.delay()
+    error_result.get(propagate=False, timeout=10)
+
+    task_ids = [success_result.id, "missing-id", error_result.id]
+
+    task_infos = get_task_information_batch(celery_app, task_ids)
+    assert [task_info["id"] for task_info in task_infos] == task_ids
+
+    assert task_infos[0] == get_task_information(celery_app, success_result.id)
+    assert task_infos[2] == get_task_information(celery_app, error_result.id)
+
+    assert task_infos[1]["status"] == "waiting"
+    assert task_infos[1]["result"] is None
+    assert task_infos[1]["error"] is None
+
+
+def test_get_task_information_batch_empty(celery_app):
+    assert get_task_information_batch(celery_app, []) == []
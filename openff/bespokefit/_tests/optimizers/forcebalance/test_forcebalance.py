@@ -12,6 +12,8 @@ from openff.toolkit.typing.engines.smirnoff import ForceField
 from openff.utilities import get_data_file_path, temporary_cd
 
 from openff.bespokefit.optimizers import ForceBalanceOptimizer
+from openff.bespokefit.optimizers.forcebalance import runner
+from openff.bespokefit.optimizers.forcebalance.runner import ForceBalanceRunner
 from openff.bespokefit.schema.fitting import BaseOptimizationSchema
 from openff.bespokefit.schema.optimizers import ForceBalanceSchema
 from openff.bespokefit.schema.results import OptimizationStageResults
@@ -174,3 +176,64 @@ def test_forcebalance_optimize(
         )
 
     assert results.status == "success"
+
+
+@pytest.fixture()
+def force_balance_runner(monkeypatch):
+    """Replace the shared in-process ForceBalance runner with one that is stopped at the
+    end of the test."""
+
+    force_balance_runner = ForceBalanceRunner()
+    monkeypatch.setattr(runner, "_runner", force_balance_runner)
+
+    yield force_balance_runner
+
+    force_balance_runner.stop()
+
+
+@pytest.mark.parametrize("mode", ["subprocess", "in-process"])
+def test_forcebalance_optimize_mode(
+    mode, general_optimization_schema, force_balance_runner, tmpdir, monkeypatch
+):
+    """Make sure a real (short) fit produces the same outputs whether it is run by the
+    ForceBalance executable or by the shared in-process runner."""
+
+    monkeypatch.setenv("BEFLOW_OPTIMIZER_FORCEBALANCE_MODE", mode)
+
+    stage = general_optimization_schema.stages[0].copy(deep=True)
+    stage.optimizer = ForceBalanceSchema(max_iterations=1)
+    stage.targets = [
+        target for target in stage.targets if target.type == "TorsionProfile"
+    ]
+
+    results = ForceBalanceOptimizer.optimize(
+        stage,
+        ForceField(general_optimization_schema.initial_force_field),
+        root_directory=str(tmpdir),
+    )
+
+    assert os.path.isfile(os.path.join(tmpdir, "optimize.out"))
+    assert os.path.isfile(os.path.join(tmpdir, "log.txt"))
+    assert force_balance_runner.is_running == (mode == "in-process")
+
+    # a single iteration may not converge, but the fit should have finished
+    assert results.status in ["success", "errored"]
+
+
+def test_forcebalance_optimize_in_process_error(
+    general_optimization_schema, force_balance_runner, tmpdir, monkeypatch
+):
+    monkeypatch.setenv("BEFLOW_OPTIMIZER_FORCEBALANCE_MODE", "in-process")
+
+    # no ForceBalance inputs have been prepared so the fit should fail
+    with temporary_cd(str(tmpdir)):
+        with pytest.raises(ValueError, match="ForceBalance job failed"):
+            ForceBalanceOptimizer._optimize(
+                general_optimization_schema.stages[0],
+                ForceField(general_optimization_schema.initial_force_field),
+            )
+
+        with open("optimize.err") as file:
+            assert "Traceback" in file.read()
+
+    assert force_balance_runner.is_running
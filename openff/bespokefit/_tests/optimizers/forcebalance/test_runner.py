@@ -0,0 +1,119 @@
+import logging
+import os
+
+from openff.bespokefit.optimizers.forcebalance import runner
+from openff.bespokefit.optimizers.forcebalance.runner import (
+    ForceBalanceRunner,
+    _run_job,
+    get_force_balance_runner,
+)
+
+
+def test_run_job(tmpdir, monkeypatch):
+    def mock_run_force_balance(input_file):
+        os.write(1, f"running {input_file}\n".encode())
+        os.write(2, b"warning\n")
+        logging.getLogger("forcebalance").addHandler(logging.NullHandler())
+
+    monkeypatch.setattr(runner, "_clear_caches", lambda: None)
+    monkeypatch.setattr(runner, "_run_force_balance", mock_run_force_balance)
+
+    n_handlers = len(logging.getLogger("forcebalance").handlers)
+
+    with tmpdir.as_cwd():
+        error = _run_job(str(tmpdir), "optimize.in")
+
+    assert error is None
+    assert len(logging.getLogger("forcebalance").handlers) == n_handlers
+
+    with open(os.path.join(tmpdir, "optimize.out")) as file:
+        assert file.read() == "running optimize.in\n"
+    with open(os.path.join(tmpdir, "optimize.err")) as file:
+        assert file.read() == "warning\n"
+    with open(os.path.join(tmpdir, "log.txt")) as file:
+        assert sorted(file.read().splitlines()) == ["running optimize.in", "warning"]
+
+
+def test_run_job_error(tmpdir, monkeypatch):
+    def mock_run_force_balance(input_file):
+        raise KeyError("mock-error")
+
+    monkeypatch.setattr(runner, "_clear_caches", lambda: None)
+    monkeypatch.setattr(runner, "_run_force_balance", mock_run_force_balance)
+
+    with tmpdir.as_cwd():
+        error = _run_job(str(tmpdir), "optimize.in")
+
+    assert "KeyError: 'mock-error'" in error
+
+    with open(os.path.join(tmpdir, "optimize.err")) as file:
+        contents = file.read()
+
+    assert "Traceback" in contents
+    assert "KeyError: 'mock-error'" in contents
+
+    with open(os.path.join(tmpdir, "log.txt")) as file:
+        assert "KeyError: 'mock-error'" in file.read()
+
+
+def test_get_force_balance_runner(monkeypatch):
+    monkeypatch.setattr(runner, "_runner", None)
+
+    force_balance_runner = get_force_balance_runner()
+
+    assert isinstance(force_balance_runner, ForceBalanceRunner)
+    assert get_force_balance_runner() is force_balance_runner
+    assert not force_balance_runner.is_running
+
+
+def test_runner_persistent(tmpdir):
+    force_balance_runner = ForceBalanceRunner()
+
+    try:
+        force_balance_runner.start()
+        process_id = force_balance_runner._process.pid
+
+        for i in range(2):
+            directory = os.path.join(tmpdir, f"fit-{i}")
+            os.makedirs(directory)
+
+            # the input file is missing so the fit should fail without killing the
+            # runner.
+            error = force_balance_runner.run(directory, "optimize.in")
+
+            assert error is not None
+            assert os.path.isfile(os.path.join(directory, "optimize.out"))
+            assert os.path.isfile(os.path.join(directory, "optimize.err"))
+            assert os.path.isfile(os.path.join(directory, "log.txt"))
+
+            assert force_balance_runner.is_running
+            assert force_balance_runner._process.pid == process_id
+
+    finally:
+        force_balance_runner.stop()
+
+    assert not force_balance_runner.is_running
+
+
+def test_runner_restart(tmpdir):
+    force_balance_runner = ForceBalanceRunner()
+
+    try:
+        force_balance_runner.start()
+        force_balance_runner._process.kill()
+        force_balance_runner._process.wait()
+
+        assert not force_balance_runner.is_running
+
+        force_balance_runner.run(str(tmpdir), "optimize.in")
+        assert force_balance_runner.is_running
+
+    finally:
+        force_balance_runner.stop()
+
+
+def test_runner_stop_not_started():
+    force_balance_runner = ForceBalanceRunner()
+    force_balance_runner.stop()
+
+    assert not force_balance_runner.is_running
@@ -5,7 +5,11 @@ Unit test ability to add and remove new optimizers.
 import pytest
 
 from openff.bespokefit.exceptions import OptimizerError
-from openff.bespokefit.optimizers import BaseOptimizer, ForceBalanceOptimizer
+from openff.bespokefit.optimizers import (
+    BaseOptimizer,
+    ForceBalanceOptimizer,
+    LinearTorsionOptimizer,
+)
 from openff.bespokefit.optimizers.base import (
     deregister_optimizer,
     get_optimizer,
@@ -22,10 +26,15 @@ def test_list_optimizers():
     # get optimizers in lower case
     optimizers = list_optimizers()
     assert "forcebalance" in optimizers
+    assert "lineartorsion" in optimizers
 
 
 @pytest.mark.parametrize(
-    "optimizer_name, expected", [("forcebalance", ForceBalanceOptimizer)]
+    "optimizer_name, expected",
+    [
+        ("forcebalance", ForceBalanceOptimizer),
+        ("lineartorsion", LinearTorsionOptimizer),
+    ],
 )
 def test_get_optimizer(optimizer_name, expected):
     assert get_optimizer(optimizer_name) == expected
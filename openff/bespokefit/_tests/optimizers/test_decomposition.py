@@ -0,0 +1,154 @@
+"""
+Test splitting optimization stages into independent sub-fits.
+"""
+
+import pytest
+from openff.toolkit.topology import Molecule
+from openff.toolkit.typing.engines.smirnoff import ForceField
+from openff.units import unit
+
+from openff.bespokefit.optimizers import decomposition
+from openff.bespokefit.optimizers.decomposition import (
+    merge_stage_results,
+    split_optimization_stage,
+)
+from openff.bespokefit.schema import Error
+from openff.bespokefit.schema.data import LocalQCData
+from openff.bespokefit.schema.fitting import OptimizationStageSchema
+from openff.bespokefit.schema.optimizers import ForceBalanceSchema
+from openff.bespokefit.schema.results import OptimizationStageResults
+from openff.bespokefit.schema.smirnoff import (
+    ProperTorsionHyperparameters,
+    ProperTorsionSMIRKS,
+)
+from openff.bespokefit.schema.targets import TorsionProfileTargetSchema
+
+
+@pytest.fixture()
+def force_field() -> ForceField:
+    return ForceField("openff-1.3.0.offxml")
+
+
+@pytest.fixture(autouse=True)
+def mock_target_molecules(monkeypatch):
+    monkeypatch.setattr(
+        decomposition,
+        "_target_molecules",
+        lambda target: [Molecule.from_smiles(target.extras["smiles"])],
+    )
+
+
+def _torsion_smirks(force_field: ForceField, smiles: str) -> str:
+    labels = force_field.label_molecules(Molecule.from_smiles(smiles).to_topology())
+    return sorted({p.smirks for p in labels[0]["ProperTorsions"].values()})[0]
+
+
+def _create_stage(force_field: ForceField, target_smiles) -> OptimizationStageSchema:
+    # ethane and benzene torsions which are never applied to the same molecule unless
+    # a target contains both, e.g. ethylbenzene.
+    parameter_smirks = [
+        _torsion_smirks(force_field, "CC"),
+        _torsion_smirks(force_field, "c1ccccc1"),
+    ]
+    assert parameter_smirks[0] != parameter_smirks[1]
+
+    return OptimizationStageSchema(
+        optimizer=ForceBalanceSchema(penalty_additive=1.0),
+        parameters=[
+            ProperTorsionSMIRKS(smirks=smirks, attributes={"k1"})
+            for smirks in parameter_smirks
+        ],
+        parameter_hyperparameters=[ProperTorsionHyperparameters()],
+        targets=[
+            TorsionProfileTargetSchema(
+                reference_data=LocalQCData(qc_records=[]), extras={"smiles": smiles}
+            )
+            for smiles in target_smiles
+        ],
+    )
+
+
+def test_split_optimization_stage(force_field):
+    stage = _create_stage(force_field, ["CC", "c1ccccc1"])
+
+    sub_stages = split_optimization_stage(stage, force_field)
+    assert len(sub_stages) == 2
+
+    for sub_stage, parameter, target in zip(
+        sub_stages, stage.parameters, stage.targets
+    ):
+        assert sub_stage.parameters == [parameter]
+        assert sub_stage.targets == [target]
+        assert sub_stage.parameter_hyperparameters == stage.parameter_hyperparameters
+
+        # each sub-stage contains half of the total target weight
+        assert sub_stage.optimizer.penalty_additive == pytest.approx(2.0)
+
+    assert stage.optimizer.penalty_additive == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize(
+    "target_smiles", [["CC", "c1ccccc1", "CCc1ccccc1"], ["CC"], ["CCc1ccccc1"]]
+)
+def test_split_optimization_stage_connected(force_field, target_smiles):
+    stage = _create_stage(force_field, target_smiles)
+    assert split_optimization_stage(stage, force_field) == [stage]
+
+
+def test_merge_stage_results(force_field):
+    stage = _create_stage(force_field, ["CC", "c1ccccc1"])
+    sub_stages = split_optimization_stage(stage, force_field)
+
+    sub_results = []
+
+    for i, sub_stage in enumerate(sub_stages):
+        refit_force_field = ForceField(force_field.to_string())
+
+        for parameter in stage.parameters:
+            # only the parameters of a sub-stage should be taken from its result
+            refit_force_field["ProperTorsions"].parameters[parameter.smirks].k1 = (
+                i + 1.0
+            ) * unit.kilocalorie_per_mole
+
+        sub_results.append(
+            OptimizationStageResults(
+                provenance={"ForceBalance": "1.0"},
+                status="success",
+                refit_force_field=refit_force_field.to_string(),
+            )
+        )
+
+    result = merge_stage_results(force_field, sub_stages, sub_results)
+
+    assert result.status == "success"
+    assert result.provenance == {"ForceBalance": "1.0", "n_sub_fits": "2"}
+
+    merged_handler = ForceField(result.refit_force_field)["ProperTorsions"]
+
+    for i, parameter in enumerate(stage.parameters):
+        assert merged_handler.parameters[parameter.smirks].k1.m_as(
+            unit.kilocalorie_per_mole
+        ) == pytest.approx(i + 1.0)
+
+
+def test_merge_stage_results_error(force_field):
+    stage = _create_stage(force_field, ["CC", "c1ccccc1"])
+    sub_stages = split_optimization_stage(stage, force_field)
+
+    failed_result = OptimizationStageResults(
+        status="errored",
+        error=Error(type="ValueError", message="mock-error"),
+    )
+
+    result = merge_stage_results(
+        force_field,
+        sub_stages,
+        [
+            OptimizationStageResults(
+                status="success", refit_force_field=force_field.to_string()
+            ),
+            failed_result,
+        ],
+    )
+
+    assert result == failed_result
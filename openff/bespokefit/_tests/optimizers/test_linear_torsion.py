@@ -0,0 +1,161 @@
+"""
+Linear torsion optimizer specific testing.
+"""
+
+import json
+import os
+
+import numpy as np
+import pytest
+from openff.toolkit.typing.engines.smirnoff import ForceField
+from openff.units import unit
+from openff.utilities import temporary_cd
+
+from openff.bespokefit.exceptions import OptimizerError
+from openff.bespokefit.optimizers import LinearTorsionOptimizer, get_optimizer
+from openff.bespokefit.optimizers.linear_torsion import _dihedral_angles, _solve
+from openff.bespokefit.schema.data import LocalQCData
+from openff.bespokefit.schema.fitting import OptimizationStageSchema
+from openff.bespokefit.schema.optimizers import LinearTorsionSchema
+from openff.bespokefit.schema.smirnoff import (
+    BondHyperparameters,
+    BondSMIRKS,
+    ProperTorsionHyperparameters,
+    ProperTorsionSMIRKS,
+)
+from openff.bespokefit.schema.targets import TorsionProfileTargetSchema
+
+_BIPHENYL_SMIRKS = "[#6X3:1]:[#6X3:2]-[#6X3:3]:[#6X3:4]"
+
+
+def test_linear_torsion_registered():
+    assert get_optimizer("LinearTorsion") == LinearTorsionOptimizer
+    assert LinearTorsionOptimizer._schema_class() == LinearTorsionSchema
+    assert [*LinearTorsionOptimizer.get_registered_targets()] == ["torsionprofile"]
+
+
+@pytest.mark.parametrize("angle", [60.0, -120.0, 180.0])
+def test_dihedral_angles(angle):
+    theta = np.deg2rad(angle)
+
+    geometry = np.array(
+        [
+            [1.0, 0.0, 0.0],
+            [0.0, 0.0, 0.0],
+            [0.0, 0.0, 1.0],
+            [np.cos(theta), np.sin(theta), 1.0],
+        ]
+    )
+
+    angles = _dihedral_angles(geometry[None, :, :], np.array([[0, 1, 2, 3]]))
+
+    assert angles.shape == (1, 1)
+    assert np.isclose(np.cos(angles[0, 0]), np.cos(theta))
+    assert np.isclose(np.sin(angles[0, 0]), np.sin(theta))
+
+
+def test_solve_l2():
+    random = np.random.default_rng(1)
+
+    design_matrix = random.normal(size=(36, 4))
+    expected_k = np.array([1.0, -0.5, 0.25, 2.0])
+
+    k = _solve(
+        design_matrix,
+        design_matrix @ expected_k,
+        np.zeros(4),
+        np.full(4, 6.0),
+        LinearTorsionSchema(penalty_additive=1.0e-8),
+    )
+
+    assert np.allclose(k, expected_k, atol=1.0e-6)
+
+
+def test_solve_l1_sparsity():
+    random = np.random.default_rng(1)
+
+    design_matrix = random.normal(size=(36, 4))
+    expected_k = np.array([1.0, 0.0, 0.0, 2.0])
+
+    reference = design_matrix @ expected_k + 0.01 * random.normal(size=36)
+
+    kwargs = dict(
+        design_matrix=design_matrix,
+        reference=reference,
+        initial_k=np.zeros(4),
+        prior_widths=np.full(4, 1.0),
+    )
+
+    k_l1 = _solve(**kwargs, settings=LinearTorsionSchema(penalty_type="L1"))
+    k_l2 = _solve(**kwargs, settings=LinearTorsionSchema(penalty_type="L2"))
+
+    # the L1 prior should drive the unused terms closer to zero than the L2 prior
+    assert np.all(np.abs(k_l1[1:3]) <= np.abs(k_l2[1:3]) + 1.0e-8)
+    assert np.allclose(k_l1[[0, 3]], expected_k[[0, 3]], atol=0.1)
+
+
+def test_prepare_invalid_parameters():
+    schema = OptimizationStageSchema(
+        optimizer=LinearTorsionSchema(),
+        parameters=[BondSMIRKS(smirks="[#6:1]-[#6:2]", attributes={"k"})],
+        parameter_hyperparameters=[BondHyperparameters()],
+        targets=[],
+    )
+
+    with pytest.raises(OptimizerError, match="can only fit proper torsion"):
+        LinearTorsionOptimizer.prepare(schema, ForceField("openff-1.3.0.offxml"), ".")
+
+
+@pytest.mark.parametrize("penalty_type", ["L1", "L2"])
+def test_linear_torsion_optimize(qc_torsion_drive_qce_result, penalty_type):
+    qc_result, _ = qc_torsion_drive_qce_result
+
+    force_field = ForceField("openff-1.3.0.offxml")
+    force_field.get_parameter_handler("ProperTorsions").add_parameter(
+        {
+            "smirks": _BIPHENYL_SMIRKS,
+            "periodicity": [1, 2, 3, 4],
+            "phase": [phase * unit.degree for phase in [0.0, 180.0, 0.0, 180.0]],
+            "k": [0.0 * unit.kilocalorie_per_mole] * 4,
+            "idivf": [1.0, 1.0, 1.0, 1.0],
+        }
+    )
+
+    schema = OptimizationStageSchema(
+        optimizer=LinearTorsionSchema(penalty_type=penalty_type),
+        parameters=[
+            ProperTorsionSMIRKS(
+                smirks=_BIPHENYL_SMIRKS, attributes={"k1", "k2", "k3", "k4"}
+            )
+        ],
+        parameter_hyperparameters=[ProperTorsionHyperparameters()],
+        targets=[
+            TorsionProfileTargetSchema(
+                reference_data=LocalQCData(qc_records=[qc_result])
+            )
+        ],
+    )
+
+    with temporary_cd():
+        results = LinearTorsionOptimizer.optimize(schema, force_field, "stage_0")
+
+        assert os.path.isfile(os.path.join("stage_0", "log.txt"))
+
+        with open(os.path.join("stage_0", "log.txt")) as file:
+            log = json.load(file)
+
+    assert results.status == "success"
+    assert results.error is None
+
+    assert log["n_scans"] == 1
+    assert log["n_terms"] == 4
+    assert log["final_objective"] < log["initial_objective"]
+
+    refit_force_field = ForceField(results.refit_force_field)
+    refit_parameter = refit_force_field["ProperTorsions"].parameters[_BIPHENYL_SMIRKS]
+    refit_k = [k.m_as(unit.kilocalorie_per_mole) for k in refit_parameter.k]
+
+    assert refit_k == pytest.approx(
+        [parameter["final_k"] for parameter in log["parameters"]]
+    )
+    assert not np.allclose(refit_k, 0.0)
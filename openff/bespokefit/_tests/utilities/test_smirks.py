@@ -1,4 +1,6 @@
+import itertools
 import os
+import random
 from collections import defaultdict
 from typing import List, Tuple
 
@@ -17,9 +19,13 @@ from openff.bespokefit._tests import does_not_raise
 from openff.bespokefit.exceptions import SMIRKSTypeError
 from openff.bespokefit.schema.smirnoff import validate_smirks
 from openff.bespokefit.utilities.smirks import (
+    CachedTorsionIndex,
     SMIRKSGenerator,
+    SMIRKSGraphIndex,
+    _tagged_atom_specs,
     compare_smirks_graphs,
     get_cached_torsion_parameters,
+    smirks_graph_hash,
 )
 from openff.bespokefit.utilities.smirnoff import ForceFieldEditor, SMIRKSType
 
@@ -70,7 +76,8 @@ def compare_matches(matches, target) -> bool:
     return True
 
 
-def test_get_cached_torsion_no_match(bace):
+@pytest.mark.parametrize("use_index", [False, True])
+def test_get_cached_torsion_no_match(bace, use_index):
     """
     Make sure no parameter is returned if no cached parameter matches the same atoms as the bespoke parameter.
     """
@@ -81,17 +88,19 @@ def test_get_cached_torsion_no_match(bace):
         k=[1 * unit.kilocalories_per_mole],
     )
     force_field = ForceField("openff_unconstrained-1.0.0.offxml")
+    cached_parameters = force_field.get_parameter_handler("ProperTorsions").parameters
     cached_parameter = get_cached_torsion_parameters(
         molecule=bace,
         bespoke_parameter=bespoke_parameter,
-        cached_parameters=force_field.get_parameter_handler(
-            "ProperTorsions"
-        ).parameters,
+        cached_parameters=(
+            CachedTorsionIndex(cached_parameters) if use_index else cached_parameters
+        ),
     )
     assert cached_parameter is None
 
 
-def test_get_cached_torsion(bace):
+@pytest.mark.parametrize("use_index", [False, True])
+def test_get_cached_torsion(bace, use_index):
     """
     Make sure we can correctly identify a parameter which is a valid cached term.
     """
@@ -102,12 +111,13 @@ def test_get_cached_torsion(bace):
         k=[1 * unit.kilocalories_per_mole],
     )
     force_field = ForceField("openff_unconstrained-1.0.0.offxml")
+    cached_parameters = force_field.get_parameter_handler("ProperTorsions").parameters
     cached_parameter = get_cached_torsion_parameters(
         molecule=bace,
         bespoke_parameter=bespoke_parameter,
-        cached_parameters=force_field.get_parameter_handler(
-            "ProperTorsions"
-        ).parameters,
+        cached_parameters=(
+            CachedTorsionIndex(cached_parameters) if use_index else cached_parameters
+        ),
     )
     assert cached_parameter is not None
     assert "cached" in cached_parameter._cosmetic_attribs
@@ -119,6 +129,104 @@ def test_get_cached_torsion(bace):
     assert cached_parameter.smirks == "[#6H1:1]@[#6:2]-!@[#6:3]@[#6H1:4]"
 
 
+@pytest.mark.parametrize(
+    "smirks, expected",
+    [
+        (
+            "[#6H1X3x2r6+0a:1]:[#6X3:2]-[#6X4:3]-[#1:4]",
+            ((6, 3), (6, 3), (6, 4), (1, None)),
+        ),
+        (
+            "[*:1]-[#6X4:2]-[#6X3,#7X3:3]-[#8:4]",
+            ((None, None), (6, 4), (None, None), (8, None)),
+        ),
+        ("[#6X4:1]-[#6X4:2]-[#6X4:3]", None),
+    ],
+)
+def test_tagged_atom_specs(smirks, expected):
+    assert _tagged_atom_specs(smirks) == expected
+
+
+def test_cached_torsion_index_benchmark(monkeypatch):
+    """
+    Make sure that only the few candidate parameters from an index of 10,000 cached
+    parameters are matched against a molecule.
+    """
+
+    molecule = Molecule.from_smiles("CCO")
+
+    bespoke_parameter = ProperTorsionHandler.ProperTorsionType(
+        smirks="[#1:1]-[#6X4:2]-[#6X4:3]-[#1:4]",
+        periodicity=[1],
+        phase=[0 * unit.degree],
+        k=[1 * unit.kilocalories_per_mole],
+    )
+
+    terminal_atoms = [
+        *itertools.product([1, 6, 7, 8, 9, 15, 16, 17, 35, 53], [1, 2, 3, 4])
+    ]
+    central_atoms = [*itertools.product([6, 7, 8, 16], [2, 3, 4])]
+
+    environments = random.Random(0).sample(
+        [
+            *itertools.product(
+                terminal_atoms, central_atoms, central_atoms, terminal_atoms
+            )
+        ],
+        10000,
+    )
+    cached_parameters = [
+        ProperTorsionHandler.ProperTorsionType(
+            smirks="~".join(
+                f"[#{atomic_number}X{connectivity}:{i + 1}]"
+                for i, (atomic_number, connectivity) in enumerate(environment)
+            ),
+            periodicity=[1],
+            phase=[0 * unit.degree],
+            k=[2 * unit.kilocalories_per_mole],
+            id=f"t{i}",
+        )
+        for i, environment in enumerate(environments)
+        if environment != ((1, 1), (6, 4), (6, 4), (1, 1))
+    ]
+    cached_parameters.append(
+        ProperTorsionHandler.ProperTorsionType(
+            smirks="[#1X1:1]-[#6X4:2]-[#6X4:3]-[#1X1:4]",
+            periodicity=[1],
+            phase=[0 * unit.degree],
+            k=[3 * unit.kilocalories_per_mole],
+            id="expected",
+        )
+    )
+
+    cached_index = CachedTorsionIndex(cached_parameters)
+
+    n_matches = 0
+    chemical_environment_matches = Molecule.chemical_environment_matches
+
+    def counted_chemical_environment_matches(self, *args, **kwargs):
+        nonlocal n_matches
+        n_matches += 1
+        return chemical_environment_matches(self, *args, **kwargs)
+
+    monkeypatch.setattr(
+        Molecule, "chemical_environment_matches", counted_chemical_environment_matches
+    )
+
+    cached_parameter = get_cached_torsion_parameters(
+        molecule=molecule,
+        bespoke_parameter=bespoke_parameter,
+        cached_parameters=cached_index,
+    )
+
+    assert cached_parameter is not None
+    assert cached_parameter.id == "expected"
+
+    # the bespoke parameter and a small number of candidates rather than every
+    # cached parameter should have been matched
+    assert n_matches < 50
+
+
 @pytest.mark.parametrize(
     "smirks1, smirks2, expected",
     [
@@ -130,6 +238,34 @@ def test_compare_smirks_graphs(smirks1, smirks2, expected):
     assert compare_smirks_graphs(smirks1, smirks2) == expected
 
 
+def test_smirks_graph_hash():
+    """Make sure equivalent SMIRKS patterns have the same hash."""
+
+    assert smirks_graph_hash("[#1:1]-[#6:2]-[#6:3]-[#8:4]") == smirks_graph_hash(
+        "[#8:1]-[#6:2]-[#6:3]-[#1:4]"
+    )
+    assert smirks_graph_hash("[#6:1]-[#6:2]") != smirks_graph_hash("[#6:1]-[#1:2]")
+    assert smirks_graph_hash("[#6:1]-[#6:2]") != smirks_graph_hash(
+        "[#6:1]-[#6:2]-[#6:3]"
+    )
+
+
+def test_smirks_graph_index():
+    candidates = [
+        "[#6:1]-[#1:2]",
+        "[#6:1]-[#6:2]-[#6:3]",
+        "[#8:1]-[#6:2]-[#6:3]-[#1:4]",
+    ]
+
+    index = SMIRKSGraphIndex(candidates)
+
+    assert index.find_equivalent("[#1:1]-[#6:2]-[#6:3]-[#8:4]") == candidates[2]
+    assert index.find_equivalent("[#6:1]-[#6:2]") is None
+
+    index.add("[#6:1]-[#6:2]")
+    assert index.find_equivalent("[#6:1]-[#6:2]") == "[#6:1]-[#6:2]"
+
+
 @pytest.mark.parametrize(
     "smirks, n_tags, expected_raises",
     [
@@ -292,6 +428,40 @@ def test_get_all_bespoke_smirks_fragment(bace_fragment_data):
     ]
 
 
+def test_bespoke_smirks_rdkit_conversions_benchmark(bace_fragment_data, monkeypatch):
+    """Make sure the parent and fragment are only converted to RDKit a fixed number of
+    times rather than once per valence group."""
+
+    fragment = bace_fragment_data.fragments[0]
+
+    gen = SMIRKSGenerator()
+    gen.target_smirks = [
+        SMIRKSType.Vdw,
+        SMIRKSType.Bonds,
+        SMIRKSType.Angles,
+        SMIRKSType.ProperTorsions,
+    ]
+
+    n_conversions = defaultdict(int)
+    to_rdkit = Molecule.to_rdkit
+
+    def counted_to_rdkit(self, *args, **kwargs):
+        n_conversions[id(self)] += 1
+        return to_rdkit(self, *args, **kwargs)
+
+    monkeypatch.setattr(Molecule, "to_rdkit", counted_to_rdkit)
+
+    bespoke_parameters = gen.generate_smirks_from_fragment(
+        parent=bace_fragment_data.parent_molecule,
+        fragment=fragment.molecule,
+        fragment_map_indices=fragment.bond_indices,
+    )
+
+    assert len(bespoke_parameters) > 10
+    # at most one conversion for the cluster graphs and one for the atom symmetries
+    assert all(n <= 2 for n in n_conversions.values())
+
+
 def test_get_existing_parameters():
     """
     Get the full list of smirks which cover this molecule from the forcefield, no new
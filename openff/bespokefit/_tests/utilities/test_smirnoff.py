@@ -4,9 +4,12 @@ Test the force field editing tools.
 
 import copy
 import os
+from collections import OrderedDict
 
 import numpy as np
+import pytest
 from openff.toolkit.topology import Molecule
+from openff.toolkit.typing.engines.smirnoff import ForceField
 from openff.units import unit
 from openff.utilities import get_data_file_path
 
@@ -16,7 +19,14 @@ from openff.bespokefit.schema.smirnoff import (
     ProperTorsionSMIRKS,
     VdWSMIRKS,
 )
-from openff.bespokefit.utilities.smirnoff import ForceFieldEditor
+from openff.bespokefit.utilities import smirnoff
+from openff.bespokefit.utilities.smirnoff import (
+    ForceFieldEditor,
+    discard_cosmetic_attributes,
+    get_force_field_cache_statistics,
+    load_force_field,
+    merge_parameters,
+)
 
 
 def test_loading_force_fields():
@@ -29,6 +39,46 @@ def test_loading_force_fields():
     assert "Constraints" not in ff.force_field.registered_parameter_handlers
 
 
+def test_load_force_field(monkeypatch):
+    """Make sure force fields are only parsed once and that each caller receives its
+    own copy."""
+
+    monkeypatch.setattr(smirnoff, "_FORCE_FIELD_CACHE", OrderedDict())
+    monkeypatch.setattr(
+        smirnoff, "_FORCE_FIELD_CACHE_STATISTICS", {"hits": 0, "misses": 0}
+    )
+
+    force_field = load_force_field("openff-1.0.0.offxml")
+    force_field.deregister_parameter_handler("Constraints")
+
+    # a force field loaded without cosmetic attributes can be re-used when they are
+    # allowed
+    other_force_field = load_force_field(
+        "openff-1.0.0.offxml", allow_cosmetic_attributes=True
+    )
+    assert other_force_field is not force_field
+    assert "Constraints" in other_force_field.registered_parameter_handlers
+
+    assert get_force_field_cache_statistics() == {
+        "hits": 1,
+        "misses": 1,
+        "hit_rate": 0.5,
+    }
+
+
+def test_discard_cosmetic_attributes():
+    force_field = ForceField("openff-1.0.0.offxml")
+
+    torsion_handler = force_field.get_parameter_handler("ProperTorsions")
+    torsion_handler.add_cosmetic_attribute("source", "bespokefit")
+    torsion_handler.parameters[0].add_cosmetic_attribute("parameterize", "k1")
+
+    expected = force_field.to_string(discard_cosmetic_attributes=True)
+
+    assert discard_cosmetic_attributes(force_field) is force_field
+    assert force_field.to_string(discard_cosmetic_attributes=False) == expected
+
+
 def test_adding_new_smirks_types():
     """Test adding new smirks to a force field."""
 
@@ -60,6 +110,42 @@ def test_adding_new_smirks_types():
     )
 
 
+@pytest.mark.parametrize("update_existing", [True, False])
+def test_merge_parameters(update_existing):
+    force_field = ForceField("openff-1.0.0.offxml")
+    current_parameters = force_field["Bonds"].parameters
+    n_parameters = len(current_parameters)
+
+    existing_parameter = copy.deepcopy(current_parameters["[#6X2:1]#[#6X2:2]"])
+    existing_parameter.k *= 2.0
+    existing_parameter.id = "b-new"
+
+    new_parameter = copy.deepcopy(existing_parameter)
+    new_parameter.smirks = "[#6X2:1]#[#6X2:2]-[#1]"
+
+    duplicate_parameter = copy.deepcopy(new_parameter)
+    duplicate_parameter.k *= 2.0
+
+    merged_parameters = merge_parameters(
+        current_parameters,
+        [existing_parameter, new_parameter, duplicate_parameter],
+        update_existing=update_existing,
+    )
+
+    assert len(current_parameters) == n_parameters + 1
+    assert current_parameters[-1].smirks == new_parameter.smirks
+    assert current_parameters[-1].id == "b-new"
+
+    assert merged_parameters[0] is current_parameters["[#6X2:1]#[#6X2:2]"]
+    assert merged_parameters[1] is current_parameters[-1]
+    assert merged_parameters[2] is current_parameters[-1]
+
+    assert (merged_parameters[0].k == existing_parameter.k) == update_existing
+    assert merged_parameters[0].id != "b-new"
+
+    assert (current_parameters[-1].k == duplicate_parameter.k) == update_existing
+
+
 def test_label_molecule():
     """Test that labeling a molecule with the editor works."""
 
@@ -78,6 +164,51 @@ def test_label_molecule():
         assert param_type in labels
 
 
+def test_label_molecule_memoised(monkeypatch):
+    """Make sure labels are re-used between editors of the same force field and are
+    invalidated when new parameters are added."""
+
+    monkeypatch.setattr(smirnoff, "_LABEL_CACHE", OrderedDict())
+
+    n_calls = 0
+    label_molecules = ForceField.label_molecules
+
+    def mock_label_molecules(self, topology):
+        nonlocal n_calls
+        n_calls += 1
+
+        return label_molecules(self, topology)
+
+    monkeypatch.setattr(ForceField, "label_molecules", mock_label_molecules)
+
+    molecule = Molecule.from_mapped_smiles("[H:1]-[C:2]#[C:3]-[H:4]")
+
+    ff = ForceFieldEditor(force_field="openff-1.0.0.offxml")
+    expected_labels = ff.label_molecule(molecule=molecule)
+
+    other_ff = ForceFieldEditor(force_field="openff-1.0.0.offxml")
+    labels = other_ff.label_molecule(molecule=molecule)
+
+    assert n_calls == 1
+
+    assert {*labels} == {*expected_labels}
+    assert labels["ProperTorsions"][(3, 2, 1, 0)].smirks == "[*:1]-[*:2]#[*:3]-[*:4]"
+    # the labels should reference the parameters of the editor's own force field
+    assert (
+        labels["Bonds"][(1, 2)]
+        is other_ff.force_field["Bonds"].parameters["[#6X2:1]#[#6X2:2]"]
+    )
+
+    new_parameter = copy.deepcopy(labels["Bonds"][(1, 2)])
+    new_parameter.smirks = "[#6X2:1]#[#6X2:2]-[#1]"
+
+    other_ff.add_parameters([new_parameter])
+    labels = other_ff.label_molecule(molecule=molecule)
+
+    assert n_calls == 2
+    assert labels["Bonds"][(1, 2)].smirks == new_parameter.smirks
+
+
 def test_get_parameters():
     ff = ForceFieldEditor(force_field="openff-1.0.0.offxml")
     molecule = Molecule.from_mapped_smiles("[H:1]-[C:2]#[C:3]-[H:4]")
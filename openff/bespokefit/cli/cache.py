@@ -1,8 +1,13 @@
 import datetime
 import hashlib
+import itertools
 import json
+import re
+import sqlite3
 import uuid
-from typing import TYPE_CHECKING, Optional, Union
+import zlib
+from contextlib import closing
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple, Union
 
 import click
 import click.exceptions
@@ -25,6 +30,11 @@ from openff.bespokefit.cli.utilities import (
     print_header,
 )
 from openff.bespokefit.executor.services import current_settings
+from openff.bespokefit.executor.services.coordinator.utils import (
+    get_cached_force_field,
+    migrate_legacy_parameters,
+    set_cached_force_field,
+)
 from openff.bespokefit.executor.services.qcgenerator.cache import _canonicalize_task
 from openff.bespokefit.executor.utilities.redis import (
     connect_to_default_redis,
@@ -35,8 +45,27 @@ from openff.bespokefit.schema.data import LocalQCData
 from openff.bespokefit.schema.tasks import task_from_result
 
 if TYPE_CHECKING:
+    import subprocess
+
     import qcportal
 
+_CACHE_ARCHIVE_VERSION = 1
+_CACHE_ARCHIVE_CHUNK_SIZE = 500
+
+# The cache type stored in an archive and the redis hash which maps a task hash to the
+# corresponding celery task id.
+_TASK_CACHES = {
+    "qcgenerator": "qcgenerator:task-ids",
+    "fragmenter": "fragmenter:task-ids",
+}
+_PARAMETER_CACHE = "coordinator:cached-parameters"
+# Parameters cached by older versions are stored as a single serialized force field
+# under the bare (SHA512) hash of the fitting schema, and are not tracked by the
+# parameter cache index.
+_LEGACY_PARAMETER_KEY = re.compile("[0-9a-f]{128}")
+
+_ArchiveEntry = Tuple[str, str, Optional[str], float, bytes]
+
 
 @click.group("cache")
 def cache_cli():
@@ -164,21 +193,7 @@ def _update(
 
     console.print(Padding("2. connecting to redis cache", (1, 0, 1, 0)))
 
-    settings = current_settings()
-
-    if launch_redis_if_unavailable and not is_redis_available(
-        host=settings.BEFLOW_REDIS_ADDRESS, port=settings.BEFLOW_REDIS_PORT
-    ):
-        redis_log_file = open("redis.log", "w")
-
-        redis_process = launch_redis(
-            port=settings.BEFLOW_REDIS_PORT,
-            stderr_file=redis_log_file,
-            stdout_file=redis_log_file,
-            terminate_at_exit=False,
-        )
-    else:
-        redis_process = None
+    redis_process = _launch_redis_if_unavailable(launch_redis_if_unavailable)
 
     try:
         redis_connection = connect_to_default_redis()
@@ -197,6 +212,28 @@ def _update(
             redis_process.wait()
 
 
+def _launch_redis_if_unavailable(
+    launch_redis_if_unavailable: bool,
+) -> Optional["subprocess.Popen"]:
+    """Launch a redis server if requested and one is not already running."""
+
+    settings = current_settings()
+
+    if not launch_redis_if_unavailable or is_redis_available(
+        host=settings.BEFLOW_REDIS_ADDRESS, port=settings.BEFLOW_REDIS_PORT
+    ):
+        return None
+
+    redis_log_file = open("redis.log", "w")
+
+    return launch_redis(
+        port=settings.BEFLOW_REDIS_PORT,
+        stderr_file=redis_log_file,
+        stdout_file=redis_log_file,
+        terminate_at_exit=False,
+    )
+
+
 def _results_from_file(
     console: "rich.Console", input_file_path: str
 ) -> Union[TorsionDriveResultCollection, OptimizationResultCollection]:
@@ -348,11 +385,434 @@ def _update_from_qcsubmit_result(
     redis_connection.save()
 
 
+def _parse_timestamp(value: str) -> float:
+    """Convert an ISO formatted date, such as the ``date_done`` field stored by celery,
+    into a POSIX timestamp."""
+    return datetime.datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+
+def _chunks(
+    values: List, chunk_size: int = _CACHE_ARCHIVE_CHUNK_SIZE
+) -> Iterator[List]:
+    for i in range(0, len(values), chunk_size):
+        yield values[i : i + chunk_size]
+
+
+def _iter_task_cache(
+    redis_connection: redis.Redis, cache: str, since: Optional[float]
+) -> Iterator[_ArchiveEntry]:
+    """Iterate over the successfully completed tasks stored in a task cache, reading
+    the celery results in chunks."""
+
+    task_ids_by_hash = {
+        task_hash.decode(): task_id.decode()
+        for task_hash, task_id in redis_connection.hgetall(_TASK_CACHES[cache]).items()
+    }
+
+    for task_hashes in _chunks(sorted(task_ids_by_hash)):
+        task_ids = [task_ids_by_hash[task_hash] for task_hash in task_hashes]
+
+        task_metas = redis_connection.mget(
+            [f"celery-task-meta-{task_id}" for task_id in task_ids]
+        )
+        task_types = (
+            redis_connection.hmget("qcgenerator:types", task_ids)
+            if cache == "qcgenerator"
+            else [None] * len(task_ids)
+        )
+
+        for task_hash, task_meta, task_type in zip(task_hashes, task_metas, task_types):
+            if task_meta is None:
+                continue
+
+            task_meta = json.loads(task_meta)
+
+            # only completed results are meaningful outside of this redis instance
+            if task_meta["status"] != "SUCCESS" or task_meta["result"] is None:
+                continue
+
+            modified = (
+                0.0
+                if task_meta.get("date_done") is None
+                else _parse_timestamp(task_meta["date_done"])
+            )
+
+            if since is not None and modified < since:
+                continue
+
+            yield (
+                cache,
+                task_hash,
+                None if task_type is None else task_type.decode(),
+                modified,
+                zlib.compress(task_meta["result"].encode()),
+            )
+
+
+def _iter_parameter_cache(
+    redis_connection: redis.Redis, since: Optional[float]
+) -> Iterator[_ArchiveEntry]:
+    """Iterate over the cached bespoke parameters, collecting the parameters cached
+    for each fitting schema into a force field. Parameters cached by older versions
+    are only included in full exports."""
+
+    modified_by_hash = {
+        schema_hash.decode(): float(modified)
+        for schema_hash, modified in redis_connection.hgetall(_PARAMETER_CACHE).items()
+    }
+
+    if since is None:
+        # when the legacy entries were last changed is unknown, so they are only
+        # included in full exports.
+        for key in redis_connection.scan_iter(match="?" * 128):
+            schema_hash = key.decode()
+
+            if (
+                schema_hash in modified_by_hash
+                or _LEGACY_PARAMETER_KEY.fullmatch(schema_hash) is None
+                or redis_connection.type(key) != b"string"
+            ):
+                continue
+
+            modified_by_hash[schema_hash] = 0.0
+
+    schema_hashes = sorted(
+        schema_hash
+        for schema_hash, modified in modified_by_hash.items()
+        if since is None or modified >= since
+    )
+
+    for schema_hash in schema_hashes:
+        force_field = get_cached_force_field(redis_connection, schema_hash)
+
+        if force_field is None:
+            continue
+
+        yield (
+            "parameters",
+            schema_hash,
+            None,
+            modified_by_hash[schema_hash],
+            zlib.compress(force_field.encode()),
+        )
+
+
+def _export_cache(
+    redis_connection: redis.Redis,
+    output_file_path: str,
+    since: Optional[datetime.datetime] = None,
+) -> int:
+    """Export the QC, fragmentation and parameter caches stored in redis into a single
+    compressed SQLite archive.
+
+    Args:
+        redis_connection: The redis connection to read the caches from.
+        output_file_path: The path to the archive to create or update. Entries
+            already present in an existing archive will be replaced.
+        since: Only export entries that were last changed at or after this time.
+
+    Returns:
+        The number of entries that were exported.
+    """
+
+    since = None if since is None else since.timestamp()
+
+    entries = itertools.chain(
+        *(_iter_task_cache(redis_connection, cache, since) for cache in _TASK_CACHES),
+        _iter_parameter_cache(redis_connection, since),
+    )
+    n_exported = 0
+
+    with closing(sqlite3.connect(output_file_path)) as database:
+        database.execute(
+            "CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value TEXT)"
+        )
+        database.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "cache TEXT NOT NULL, hash TEXT NOT NULL, type TEXT, modified REAL, "
+            "data BLOB NOT NULL, PRIMARY KEY (cache, hash))"
+        )
+        database.executemany(
+            "INSERT OR REPLACE INTO metadata VALUES (?, ?)",
+            [
+                ("version", str(_CACHE_ARCHIVE_VERSION)),
+                ("exported", datetime.datetime.now().isoformat()),
+            ],
+        )
+
+        while True:
+            entry_chunk = [*itertools.islice(entries, _CACHE_ARCHIVE_CHUNK_SIZE)]
+
+            if len(entry_chunk) == 0:
+                break
+
+            database.executemany(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)", entry_chunk
+            )
+            database.commit()
+
+            n_exported += len(entry_chunk)
+
+        database.commit()
+
+    return n_exported
+
+
+def _import_cache(redis_connection: redis.Redis, input_file_path: str) -> int:
+    """Import the entries of a cache archive created by ``_export_cache`` into redis.
+
+    Tasks whose hash is already present in the redis cache are skipped, while any
+    parameters which are not yet cached for a fitting schema are added to it.
+
+    Args:
+        redis_connection: The redis connection to populate.
+        input_file_path: The path to the archive to import.
+
+    Returns:
+        The number of new entries that were imported.
+    """
+
+    with closing(sqlite3.connect(input_file_path)) as database:
+        version = database.execute(
+            "SELECT value FROM metadata WHERE key = 'version'"
+        ).fetchone()
+
+        if version is None or int(version[0]) != _CACHE_ARCHIVE_VERSION:
+            raise ValueError(
+                f"The cache archive {input_file_path} has version "
+                f"{None if version is None else version[0]} while only version "
+                f"{_CACHE_ARCHIVE_VERSION} is supported."
+            )
+
+        cursor = database.execute(
+            "SELECT cache, hash, type, modified, data FROM entries"
+        )
+        n_imported = 0
+
+        while True:
+            entry_chunk: List[_ArchiveEntry] = cursor.fetchmany(
+                _CACHE_ARCHIVE_CHUNK_SIZE
+            )
+
+            if len(entry_chunk) == 0:
+                break
+
+            n_imported += _import_entries(redis_connection, entry_chunk)
+
+    return n_imported
+
+
+def _import_entries(redis_connection: redis.Redis, entries: List[_ArchiveEntry]) -> int:
+    """Store a chunk of archived cache entries in redis, skipping any tasks that are
+    already cached. The archived parameters of a fitting schema are merged into any
+    that are already cached for it, so that parameters added since a previous import
+    are not lost."""
+
+    existing_ids = {}
+
+    for cache in _TASK_CACHES:
+        entry_hashes = [entry[1] for entry in entries if entry[0] == cache]
+
+        if len(entry_hashes) == 0:
+            continue
+
+        existing_ids.update(
+            zip(
+                [(cache, entry_hash) for entry_hash in entry_hashes],
+                redis_connection.hmget(_TASK_CACHES[cache], entry_hashes),
+            )
+        )
+
+    pipeline = redis_connection.pipeline()
+    n_imported = 0
+
+    for cache, entry_hash, entry_type, modified, data in entries:
+        if existing_ids.get((cache, entry_hash)) is not None:
+            continue
+
+        data = zlib.decompress(data).decode()
+
+        if cache == "parameters":
+            # parameters cached by older versions would otherwise be hidden by the
+            # merged parameters
+            migrate_legacy_parameters(redis_connection, entry_hash)
+
+            if (
+                set_cached_force_field(redis_connection, entry_hash, data, modified)
+                == 0
+            ):
+                continue
+
+        elif cache in _TASK_CACHES:
+            task_id = str(uuid.uuid4())
+
+            if cache == "qcgenerator":
+                pipeline.hset("qcgenerator:types", task_id, entry_type)
+            # mock a celery worker result
+            task_meta = {
+                "status": "SUCCESS",
+                "result": data,
+                "traceback": None,
+                "children": [],
+                "date_done": datetime.datetime.fromtimestamp(modified).strftime(
+                    "%Y-%m-%dT%H:%M:%S.%f"
+                ),
+                "task_id": task_id,
+            }
+            pipeline.set(f"celery-task-meta-{task_id}", json.dumps(task_meta))
+            # only set the hash after the result in case the import is interrupted
+            pipeline.hset(_TASK_CACHES[cache], entry_hash, task_id)
+
+        else:
+            raise NotImplementedError()
+
+        n_imported += 1
+
+    pipeline.execute()
+
+    return n_imported
+
+
+def _archive_options(
+    file_option: str, help_text: str, exists: bool, *extra_options
+) -> List:
+    return [
+        optgroup("Archive Configuration"),
+        optgroup.option(
+            file_option,
+            "file_path",
+            type=click.Path(exists=exists, file_okay=True, dir_okay=False),
+            help=help_text,
+            required=True,
+        ),
+        *extra_options,
+        optgroup.group("Storage configuration"),
+        optgroup.option(
+            "--launch-redis/--no-launch-redis",
+            "launch_redis_if_unavailable",
+            help="Whether to launch a redis server if an already running one cannot be "
+            "found.",
+            required=False,
+            default=True,
+            show_default=True,
+        ),
+    ]
+
+
+def _export(
+    file_path: str,
+    since: Optional[datetime.datetime],
+    launch_redis_if_unavailable: bool,
+):
+    """Export the QC, fragmentation and fitted parameter caches to a portable archive
+    which can be imported by another executor using ``cache import``."""
+
+    pretty.install()
+    console = rich.get_console()
+    print_header(console)
+
+    console.print(Padding("1. connecting to redis cache", (0, 0, 1, 0)))
+
+    redis_process = _launch_redis_if_unavailable(launch_redis_if_unavailable)
+
+    try:
+        console.print(Padding("2. exporting cache", (0, 0, 1, 0)))
+
+        with console.status("exporting cache entries"):
+            n_exported = _export_cache(
+                redis_connection=connect_to_default_redis(),
+                output_file_path=file_path,
+                since=since,
+            )
+
+        console.print(
+            f"[[green]✓[/green]] [blue]{n_exported}[/blue] entries exported to "
+            f"[repr.filename]{file_path}[/repr.filename]"
+        )
+    finally:
+        if redis_process is not None:
+            console.print(Padding("3. closing redis", (1, 0, 1, 0)))
+            redis_process.terminate()
+            redis_process.wait()
+
+
+def _import(file_path: str, launch_redis_if_unavailable: bool):
+    """Import a cache archive created by ``cache export`` into the local redis cache."""
+
+    pretty.install()
+    console = rich.get_console()
+    print_header(console)
+
+    console.print(Padding("1. connecting to redis cache", (0, 0, 1, 0)))
+
+    redis_process = _launch_redis_if_unavailable(launch_redis_if_unavailable)
+
+    try:
+        redis_connection = connect_to_default_redis()
+
+        console.print(Padding("2. importing cache", (0, 0, 1, 0)))
+
+        with console.status("importing cache entries"):
+            try:
+                n_imported = _import_cache(
+                    redis_connection=redis_connection, input_file_path=file_path
+                )
+            except (ValueError, sqlite3.DatabaseError) as e:
+                exit_with_messages(
+                    Padding(
+                        f"[[red]ERROR[/red]] The cache archive [repr.filename]"
+                        f"{file_path}[/repr.filename] could not be imported."
+                    ),
+                    Padding(str(e), (1, 1, 1, 1)),
+                    console=console,
+                    exit_code=2,
+                )
+
+        console.print(
+            f"[[green]✓[/green]] [blue]{n_imported}[/blue] new entries imported"
+        )
+
+        console.print(Padding("3. saving local cache", (1, 0, 1, 0)))
+        # block until data is saved
+        redis_connection.save()
+    finally:
+        if redis_process is not None:
+            console.print(Padding("4. closing redis", (0, 0, 1, 0)))
+            redis_process.terminate()
+            redis_process.wait()
+
+
 update_cli = create_command(
     click_command=click.command("update"),
     click_options=update_from_qcsubmit_options(),
     func=_update,
 )
+export_cli = create_command(
+    click_command=click.command("export"),
+    click_options=_archive_options(
+        "--output",
+        "The path to the cache archive to create.",
+        False,
+        optgroup.option(
+            "--since",
+            "since",
+            type=click.DateTime(),
+            help="Only export entries that were last changed at or after this time.",
+            required=False,
+            default=None,
+        ),
+    ),
+    func=_export,
+)
+import_cli = create_command(
+    click_command=click.command("import"),
+    click_options=_archive_options(
+        "--input", "The path to the cache archive to import.", exists=True
+    ),
+    func=_import,
+)
 
 
 cache_cli.add_command(update_cli)
+cache_cli.add_command(export_cli)
+cache_cli.add_command(import_cli)
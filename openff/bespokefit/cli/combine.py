@@ -4,12 +4,12 @@ from typing import List, Optional
 import click
 import rich
 from openff.toolkit import ForceField
-from openff.toolkit.utils.exceptions import ParameterLookupError
 from rich import pretty
 from rich.padding import Padding
 
 from openff.bespokefit.cli.utilities import exit_with_messages, print_header
 from openff.bespokefit.executor.utilities import handle_common_errors
+from openff.bespokefit.utilities.smirnoff import merge_parameters
 
 
 @click.command("combine")
@@ -83,14 +83,15 @@ def combine_cli(
 
     # Now combine all unique torsions
     master_ff = copy.deepcopy(all_force_fields[0])
-    for ff in all_force_fields[1:]:
-        for parameter in ff.get_parameter_handler("ProperTorsions").parameters:
-            try:
-                _ = master_ff.get_parameter_handler("ProperTorsions")[parameter.smirks]
-            except ParameterLookupError:
-                master_ff.get_parameter_handler("ProperTorsions").add_parameter(
-                    parameter=parameter
-                )
+    merge_parameters(
+        master_ff.get_parameter_handler("ProperTorsions").parameters,
+        [
+            parameter
+            for ff in all_force_fields[1:]
+            for parameter in ff.get_parameter_handler("ProperTorsions").parameters
+        ],
+        update_existing=False,
+    )
 
     master_ff.to_file(filename=output_file, discard_cosmetic_attributes=True)
 
@@ -1,3 +1,5 @@
+from typing import Tuple
+
 import click
 
 worker_types = ["fragmenter", "qc-compute", "optimizer"]
@@ -10,7 +12,17 @@ worker_types = ["fragmenter", "qc-compute", "optimizer"]
     help="The type of bespokefit worker to launch",
     required=True,
 )
-def worker_cli(worker_type: str):
+@click.option(
+    "--queue",
+    "queues",
+    type=click.STRING,
+    help="The name of a queue, e.g. `qcgenerator-large` or `large`, that a qc-compute "
+    "worker should take tasks from. This option can be given multiple times. By "
+    "default workers take tasks from every queue.",
+    required=False,
+    multiple=True,
+)
+def worker_cli(worker_type: str, queues: Tuple[str, ...]):
     """
     Launch a single worker of the requested type in the main process.
 
@@ -20,12 +32,23 @@ def worker_cli(worker_type: str):
 
         By default bespokefit will automatically use all cores and memory made available to the worker which should
         be declared in the job submission script. To change these defaults see the settings `BEFLOW_QC_COMPUTE_WORKER_N_CORES` &
-        `BEFLOW_QC_COMPUTE_WORKER_MAX_MEM`.
+        `BEFLOW_QC_COMPUTE_WORKER_MAX_MEM`. Setting `BEFLOW_QC_COMPUTE_WORKER_PACK_TASKS` allows a QC compute worker to
+        run several cheap tasks at once, each using a share of these resources.
 
     Args:
 
         worker_type: The alias name of the worker type which should be started.
+        queues: The names of the queues a qc-compute worker should take tasks from.
+            See the `BEFLOW_QC_COMPUTE_QUEUE_ROUTING` setting for how QC tasks are
+            routed.
     """
+
+    if queues and worker_type != "qc-compute":
+        # only QC tasks are routed to queues other than the default queue of a worker
+        raise click.BadParameter(
+            "queues can only be given for qc-compute workers.", param_hint="--queue"
+        )
+
     import importlib
 
     import rich
@@ -46,20 +69,49 @@ def worker_cli(worker_type: str):
     settings = current_settings()
 
     worker_kwargs = {}
+    concurrency = 1
 
     if worker_type == "fragmenter":
         worker_settings = settings.fragmenter_settings
     elif worker_type == "qc-compute":
+        from qcengine.config import get_global
+
+        from openff.bespokefit.executor.services.qcgenerator.routing import (
+            get_worker_queues,
+        )
+
         worker_settings = settings.qc_compute_settings
         worker_kwargs["pool"] = "solo"
+        worker_kwargs["queues"] = get_worker_queues()
+
+        if settings.BEFLOW_QC_COMPUTE_WORKER_PACK_TASKS:
+            # run tasks in threads of the main process so that they share a single
+            # resource budget, admitting at most one task per core.
+            worker_kwargs["pool"] = "threads"
+            concurrency = worker_settings.n_cores or get_global("ncores")
     else:
         worker_settings = settings.optimizer_settings
+        # run tasks in the main process of the worker so that split stages can be fit
+        # in a pool of child processes.
+        worker_kwargs["pool"] = "solo"
 
     worker_module = importlib.import_module(worker_settings.import_path)
     importlib.reload(worker_module)
     worker_app = getattr(worker_module, "celery_app")
 
+    if queues:
+        worker_kwargs["queues"] = [
+            (
+                queue
+                if queue == worker_app.main or queue.startswith(f"{worker_app.main}-")
+                else f"{worker_app.main}-{queue}"
+            )
+            for queue in queues
+        ]
+
     worker_status.stop()
     console.print(f"[[green]✓[/green]] bespoke {worker_type} worker launched")
 
-    spawn_worker(worker_app, concurrency=1, asynchronous=False, **worker_kwargs)
+    spawn_worker(
+        worker_app, concurrency=concurrency, asynchronous=False, **worker_kwargs
+    )
@@ -16,6 +16,7 @@ from openff.bespokefit.executor.services.coordinator.models import (
 from openff.bespokefit.executor.utilities.typing import Status
 from openff.bespokefit.schema.fitting import BespokeOptimizationSchema
 from openff.bespokefit.schema.results import BespokeOptimizationResults
+from openff.bespokefit.utilities.smirnoff import load_force_field
 
 if TYPE_CHECKING:
     import rich
@@ -62,7 +63,7 @@ class BespokeExecutorOutput(BaseModel):
         if self.results is None or self.results.refit_force_field is None:
             return None
 
-        return ForceField(
+        return load_force_field(
             self.results.refit_force_field, allow_cosmetic_attributes=True
         )
 
@@ -158,6 +158,26 @@ class BespokeExecutor:
                 if n_workers == 0:
                     continue
 
+                worker_kwargs = {}
+
+                if worker_settings.import_path == settings.BEFLOW_QC_COMPUTE_WORKER:
+                    from openff.bespokefit.executor.services.qcgenerator.routing import (
+                        get_worker_queues,
+                    )
+
+                    # local workers should be able to run tasks from any queue
+                    worker_kwargs["queues"] = get_worker_queues()
+
+                elif (
+                    worker_settings.import_path == settings.BEFLOW_OPTIMIZER_WORKER
+                    and n_workers == 1
+                ):
+                    # run tasks in the main process of a non-daemonic worker so that
+                    # split stages can be fit in a pool of child processes. The worker
+                    # is always terminated by `_cleanup_processes`.
+                    worker_kwargs["pool"] = "solo"
+                    worker_kwargs["daemon"] = False
+
                 worker_module = importlib.import_module(worker_settings.import_path)
                 importlib.reload(worker_module)  # Ensure settings are reloaded
 
@@ -168,7 +188,7 @@ class BespokeExecutor:
                 ), "workers must be celery based"
 
                 self._worker_processes.append(
-                    spawn_worker(worker_app, concurrency=n_workers)
+                    spawn_worker(worker_app, concurrency=n_workers, **worker_kwargs)
                 )
 
     def _start(self, asynchronous=False):
@@ -199,7 +219,9 @@ class BespokeExecutor:
                 target=functools.partial(
                     launch_gateway, directory=self._directory, log_file="gateway.log"
                 ),
-                daemon=True,
+                # the gateway is always terminated by `_cleanup_processes`, and must
+                # not be daemonic so that the coordinator can use process pools
+                daemon=False,
             )
             self._gateway_process.start()
 
@@ -3,15 +3,16 @@ import logging
 import os
 import signal
 import urllib.parse
-from typing import Optional
+from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import Response
 from openff.toolkit.topology import Molecule
 
 from openff.bespokefit.executor.services import current_settings
 from openff.bespokefit.executor.services.coordinator import worker
 from openff.bespokefit.executor.services.coordinator.models import (
+    CoordinatorFragmentReport,
     CoordinatorGETPageResponse,
     CoordinatorGETResponse,
     CoordinatorPOSTBody,
@@ -24,8 +25,12 @@ from openff.bespokefit.executor.services.coordinator.storage import (
     get_task,
     get_task_ids,
 )
+from openff.bespokefit.executor.services.fragmenter.registry import (
+    get_fragment_registry_statistics,
+)
 from openff.bespokefit.executor.services.models import Link
 from openff.bespokefit.executor.utilities.depiction import smiles_to_image
+from openff.bespokefit.executor.utilities.redis import connect_to_default_redis
 
 router = APIRouter()
 
@@ -37,6 +42,9 @@ __settings = current_settings()
 __GET_TASK_IMAGE_ENDPOINT = (
     "/" + __settings.BEFLOW_COORDINATOR_PREFIX + "/{optimization_id}/image"
 )
+__GET_FRAGMENT_REPORT_ENDPOINT = (
+    "/" + __settings.BEFLOW_COORDINATOR_PREFIX + "/fragments"
+)
 
 
 @router.get("/" + __settings.BEFLOW_COORDINATOR_PREFIX)
@@ -99,6 +107,25 @@ def get_optimizations(
     )
 
 
+# this must be registered before the endpoint of a single optimization so that the
+# path is not interpreted as an optimization id.
+@router.get(__GET_FRAGMENT_REPORT_ENDPOINT)
+def get_fragment_report(
+    ids: Optional[List[str]] = Query(None),
+) -> CoordinatorFragmentReport:
+    """Reports how many QC calculations were saved by sharing equivalent fragments
+    between the optimizations with the given ids, e.g. those of a series of related
+    molecules, or between all optimizations if no ids are provided."""
+
+    statistics = get_fragment_registry_statistics(connect_to_default_redis(), ids)
+
+    return CoordinatorFragmentReport(
+        n_fragments=statistics["entries"],
+        n_subscriptions=statistics["subscriptions"],
+        n_qc_calculations_saved=statistics["qc_calculations_saved"],
+    )
+
+
 @router.get("/" + __settings.BEFLOW_COORDINATOR_PREFIX + "/{optimization_id}")
 def get_optimization(optimization_id: int) -> CoordinatorGETResponse:
     """Retrieves a bespoke optimization that has been submitted to this server
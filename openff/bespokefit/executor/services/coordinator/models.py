@@ -2,7 +2,10 @@ from typing import Dict, List, Optional
 
 from openff.bespokefit._pydantic import BaseModel, Field
 from openff.bespokefit.executor.services import current_settings
-from openff.bespokefit.executor.services.coordinator.stages import StageType
+from openff.bespokefit.executor.services.coordinator.stages import (
+    QCGenerationProgress,
+    StageType,
+)
 from openff.bespokefit.executor.services.models import Link, PaginatedCollection
 from openff.bespokefit.executor.utilities.typing import Status
 from openff.bespokefit.schema.fitting import BespokeOptimizationSchema
@@ -25,6 +28,10 @@ class CoordinatorGETStageStatus(BaseModel):
         ..., description="Links to the results generated by this stage."
     )
 
+    progress: Optional[QCGenerationProgress] = Field(
+        None, description="A summary of the progress of the stage if available."
+    )
+
     @classmethod
     def from_stage(cls, stage: StageType):
         stage_ids = stage.id if hasattr(stage, "id") else stage.ids
@@ -58,6 +65,7 @@ class CoordinatorGETStageStatus(BaseModel):
             type=stage.type,
             status=stage.status,
             error=stage.error,
+            progress=getattr(stage, "progress", None),
             results=(
                 None
                 if stage_ids is None
@@ -118,6 +126,25 @@ class CoordinatorGETResponse(Link):
         )
 
 
+class CoordinatorFragmentReport(BaseModel):
+    """A summary of the torsion drives shared between bespoke optimizations because
+    they generated equivalent fragments."""
+
+    n_fragments: int = Field(
+        ..., description="The number of unique fragment and QC specification pairs."
+    )
+    n_subscriptions: int = Field(
+        ...,
+        description="The total number of fragments that the optimizations required "
+        "QC data for.",
+    )
+    n_qc_calculations_saved: int = Field(
+        ...,
+        description="The number of QC calculations that were not run because an "
+        "equivalent fragment had already been submitted by another optimization.",
+    )
+
+
 class CoordinatorPOSTBody(BaseModel):
     input_schema: BespokeOptimizationSchema = Field(..., description="")
 
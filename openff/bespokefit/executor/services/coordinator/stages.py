@@ -1,10 +1,12 @@
 import abc
 import json
 from collections import defaultdict
+from multiprocessing import current_process, get_context
 from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 
 import httpx
 from openff.fragmenter.fragment import Fragment, FragmentationResult
+from openff.toolkit.topology import Molecule
 from openff.toolkit.typing.engines.smirnoff import (
     AngleHandler,
     BondHandler,
@@ -26,6 +28,7 @@ from openff.bespokefit.executor.services.fragmenter.models import (
     FragmenterPOSTBody,
     FragmenterPOSTResponse,
 )
+from openff.bespokefit.executor.services.fragmenter.registry import FragmentRegistry
 from openff.bespokefit.executor.services.optimizer.models import (
     OptimizerGETResponse,
     OptimizerPOSTBody,
@@ -33,6 +36,7 @@ from openff.bespokefit.executor.services.optimizer.models import (
 )
 from openff.bespokefit.executor.services.qcgenerator.models import (
     QCGeneratorGETPageResponse,
+    QCGeneratorGETResponse,
     QCGeneratorPOSTBody,
     QCGeneratorPOSTResponse,
 )
@@ -52,7 +56,7 @@ from openff.bespokefit.schema.smirnoff import (
     VdWSMIRKS,
 )
 from openff.bespokefit.schema.targets import TargetSchema
-from openff.bespokefit.schema.tasks import Torsion1DTask
+from openff.bespokefit.schema.tasks import HessianTask, Torsion1DTask
 from openff.bespokefit.utilities.smirks import (
     ForceFieldEditor,
     SMIRKSGenerator,
@@ -64,6 +68,30 @@ if TYPE_CHECKING:
     from openff.bespokefit.executor.services.coordinator.models import CoordinatorTask
 
 
+def _generate_fragment_smirks(
+    job: Tuple[SMIRKSGenerator, Molecule, Molecule, Tuple[int, int]],
+) -> List[ParameterType]:
+    """Generate the bespoke torsion parameters of a single fragment."""
+
+    smirks_gen, parent, fragment, central_bond = job
+
+    return smirks_gen.generate_smirks_from_fragment(
+        parent=parent, fragment=fragment, fragment_map_indices=central_bond
+    )
+
+
+def _n_smirks_processes(n_fragments: int) -> int:
+    """Returns the number of processes to generate the SMIRKS of fragments with."""
+
+    # daemonic processes are not allowed to have child processes
+    if current_process().daemon:
+        return 1
+
+    n_processes = current_settings().BEFLOW_COORDINATOR_SMIRKS_N_PROCESSES
+
+    return max(1, min(n_fragments, n_processes))
+
+
 class _Stage(BaseModel, abc.ABC):
     type: Literal["base-stage"] = "base-stage"
 
@@ -178,11 +206,36 @@ class FragmentationStage(_Stage):
             self.status = get_response.status
 
 
+class QCGenerationProgress(BaseModel):
+    """A summary of the progress of the QC calculations run by a QC generation
+    stage."""
+
+    n_tasks: int = Field(..., description="The number of QC calculations being run.")
+    n_completed_tasks: int = Field(
+        ..., description="The number of QC calculations that have completed."
+    )
+
+    n_grid_points: int = Field(
+        ...,
+        description="The total number of grid points across all torsion drives that "
+        "have started running.",
+    )
+    n_completed_grid_points: int = Field(
+        ...,
+        description="The number of grid points across all torsion drives that have "
+        "at least one completed optimization.",
+    )
+
+
 class QCGenerationStage(_Stage):
     type: Literal["qc-generation"] = "qc-generation"
 
     ids: Optional[Dict[int, List[str]]] = Field(None, description="")
 
+    progress: Optional[QCGenerationProgress] = Field(
+        None, description="A summary of the progress of the QC calculations."
+    )
+
     results: Optional[
         Dict[str, Union[AtomicResult, OptimizationResult, TorsionDriveResult]]
     ] = Field(None, description="")
@@ -201,6 +254,8 @@ class QCGenerationStage(_Stage):
 
         Returns:
             The list of generated smirks patterns including any cached values, and a list of fragments which require torsiondrives.
+            Cached parameters are marked as such so that only the missing parameters
+            are fit.
         """
 
         settings = current_settings()
@@ -212,11 +267,9 @@ class QCGenerationStage(_Stage):
         ):
             redis_connection = connect_to_default_redis()
 
-            cached_force_field = get_cached_parameters(
+            cached_torsions = get_cached_parameters(
                 fitting_schema=input_schema, redis_connection=redis_connection
             )
-            if cached_force_field is not None:
-                cached_torsions = cached_force_field["ProperTorsions"].parameters
 
         parent = fragmentation_result.parent_molecule
         smirks_gen = SMIRKSGenerator(
@@ -226,18 +279,32 @@ class QCGenerationStage(_Stage):
             target_smirks=[SMIRKSType.ProperTorsions],
         )
 
+        fragment_molecules = [
+            fragment_data.molecule for fragment_data in fragmentation_result.fragments
+        ]
+        jobs = [
+            (smirks_gen, parent, fragment_molecule, fragment_data.bond_indices)
+            for fragment_data, fragment_molecule in zip(
+                fragmentation_result.fragments, fragment_molecules
+            )
+        ]
+
+        n_processes = _n_smirks_processes(len(jobs))
+
+        if n_processes < 2:
+            fragment_smirks = [_generate_fragment_smirks(job) for job in jobs]
+        else:
+            # Using fork can hang on our local HPC so pin to use spawn
+            with get_context("spawn").Pool(processes=n_processes) as pool:
+                fragment_smirks = pool.map(_generate_fragment_smirks, jobs)
+
         new_smirks = []
         fragments = []
-        for fragment_data in fragmentation_result.fragments:
-            central_bond = fragment_data.bond_indices
-            fragment_molecule = fragment_data.molecule
-            bespoke_smirks = smirks_gen.generate_smirks_from_fragment(
-                parent=parent,
-                fragment=fragment_molecule,
-                fragment_map_indices=central_bond,
-            )
+        for fragment_data, fragment_molecule, bespoke_smirks in zip(
+            fragmentation_result.fragments, fragment_molecules, fragment_smirks
+        ):
             if cached_torsions is not None:
-                smirks_to_add = []
+                n_missing = 0
                 for smirk in bespoke_smirks:
                     cached_smirk = get_cached_torsion_parameters(
                         molecule=fragment_molecule,
@@ -245,14 +312,14 @@ class QCGenerationStage(_Stage):
                         cached_parameters=cached_torsions,
                     )
                     if cached_smirk is not None:
-                        smirks_to_add.append(cached_smirk)
-                if len(smirks_to_add) == len(bespoke_smirks):
-                    # if we have the same number of parameters we are safe to transfer as they were fit together
-                    new_smirks.extend(smirks_to_add)
-                else:
-                    # the cached parameter was not fit with the correct number of other parameters
-                    # so use new terms not cached
-                    new_smirks.extend(bespoke_smirks)
+                        # cached parameters are held fixed at their cached values
+                        new_smirks.append(cached_smirk)
+                    else:
+                        new_smirks.append(smirk)
+                        n_missing += 1
+                if n_missing > 0:
+                    # only the missing parameters will be fit, but they still need
+                    # a torsiondrive of the fragment to be fit against
                     fragments.append(fragment_data)
 
             else:
@@ -367,18 +434,46 @@ class QCGenerationStage(_Stage):
             target for stage in task.input_schema.stages for target in stage.targets
         ]
 
+        # share the torsion drives of fragments that other tasks, e.g. those of other
+        # molecules in the same series, have already generated.
+        fragment_registry = (
+            FragmentRegistry(connect_to_default_redis())
+            if is_redis_available(
+                host=settings.BEFLOW_REDIS_ADDRESS, port=settings.BEFLOW_REDIS_PORT
+            )
+            else None
+        )
+
         for i, target in enumerate(targets):
             if not isinstance(target.reference_data, BespokeQCData):
                 continue
 
             if target.bespoke_task_type() == "torsion1d":
+                specification = target.calculation_specification.json()
+
+                if fragment_registry is not None:
+                    target_fragments = [
+                        fragment_registry.subscribe(task.id, fragment, specification)
+                        for fragment in fragments
+                    ]
+                else:
+                    target_fragments = fragments
+
                 target_qc_tasks[i].extend(
                     Torsion1DTask(
                         smiles=fragment.smiles,
                         central_bond=fragment.bond_indices,
                         **target.calculation_specification.dict(),
                     )
-                    for fragment in fragments
+                    for fragment in target_fragments
+                )
+
+            elif target.bespoke_task_type() == "hessian":
+                target_qc_tasks[i].append(
+                    HessianTask(
+                        smiles=input_schema.smiles,
+                        **target.calculation_specification.dict(),
+                    )
                 )
 
             else:
@@ -409,6 +504,32 @@ class QCGenerationStage(_Stage):
 
         self.ids = {i: sorted(ids) for i, ids in qc_calc_ids.items()}
 
+    @staticmethod
+    def _summarize_progress(
+        get_responses: List[QCGeneratorGETResponse],
+    ) -> QCGenerationProgress:
+        """Summarize the progress of a set of QC calculations."""
+
+        n_grid_points, n_completed_grid_points = 0, 0
+
+        for get_response in get_responses:
+            if get_response.progress is not None:
+                n_grid_points += get_response.progress.n_grid_points
+                n_completed_grid_points += len(get_response.progress.completed_grid_ids)
+
+            elif isinstance(get_response.result, TorsionDriveResult):
+                n_grid_points += len(get_response.result.final_energies)
+                n_completed_grid_points += len(get_response.result.final_energies)
+
+        return QCGenerationProgress(
+            n_tasks=len(get_responses),
+            n_completed_tasks=sum(
+                1 for get_response in get_responses if get_response.status == "success"
+            ),
+            n_grid_points=n_grid_points,
+            n_completed_grid_points=n_completed_grid_points,
+        )
+
     async def _update(self):
         settings = current_settings()
 
@@ -445,6 +566,8 @@ class QCGenerationStage(_Stage):
 
         get_responses = QCGeneratorGETPageResponse.parse_raw(contents).contents
 
+        self.progress = self._summarize_progress(get_responses)
+
         statuses = {get_response.status for get_response in get_responses}
 
         errors = [
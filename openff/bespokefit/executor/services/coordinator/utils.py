@@ -1,12 +1,24 @@
 import hashlib
+import json
+import time
 from typing import Optional
 
 import redis
-from openff.toolkit.typing.engines.smirnoff import ForceField
-from openff.toolkit.utils.exceptions import ParameterLookupError
+from openff.toolkit.typing.engines.smirnoff import (
+    ForceField,
+    ParameterType,
+    ProperTorsionHandler,
+)
+from openff.units import unit
 
 from openff.bespokefit.schema.fitting import BespokeOptimizationSchema
 from openff.bespokefit.schema.results import BespokeOptimizationResults
+from openff.bespokefit.utilities.smirks import CachedTorsionIndex
+
+# The redis hash which stores when the cached parameters of each fitting schema hash
+# were last changed. The parameters themselves are stored in a redis hash per schema
+# hash, keyed by SMIRKS.
+_CACHED_PARAMETERS_KEY = "coordinator:cached-parameters"
 
 
 def _hash_fitting_schema(fitting_schema: BespokeOptimizationSchema) -> str:
@@ -25,18 +37,173 @@ def _hash_fitting_schema(fitting_schema: BespokeOptimizationSchema) -> str:
     return hash_string
 
 
+def _cached_parameters_key(schema_hash: str) -> str:
+    return f"{_CACHED_PARAMETERS_KEY}:{schema_hash}"
+
+
+def _encode_parameter(parameter: ParameterType) -> str:
+    """Serialize a cached torsion parameter, including its cosmetic attributes."""
+
+    def _encode(value):
+        if isinstance(value, unit.Quantity):
+            return {"magnitude": float(value.m), "unit": str(value.units)}
+
+        return value
+
+    return json.dumps(
+        {
+            key: _encode(value)
+            for key, value in parameter.to_dict(
+                discard_cosmetic_attributes=False
+            ).items()
+        }
+    )
+
+
+def _decode_parameter(record: bytes) -> ProperTorsionHandler.ProperTorsionType:
+    """Load a cached torsion parameter serialized by ``_encode_parameter``."""
+
+    values = {
+        key: (
+            unit.Quantity(value["magnitude"], value["unit"])
+            if isinstance(value, dict)
+            else value
+        )
+        for key, value in json.loads(record).items()
+    }
+
+    return ProperTorsionHandler.ProperTorsionType(
+        allow_cosmetic_attributes=True, **values
+    )
+
+
+def set_cached_force_field(
+    redis_connection: redis.Redis,
+    schema_hash: str,
+    force_field: str,
+    modified: Optional[float] = None,
+) -> int:
+    """
+    Merge the torsion parameters of a serialized force field, e.g. one read from a
+    cache archive, into the cached parameters of a fitting schema hash. Parameters
+    whose SMIRKS are already cached for the schema hash are kept.
+
+    Returns:
+        The number of parameters which were not already cached.
+    """
+
+    torsion_handler = ForceField(
+        force_field, allow_cosmetic_attributes=True
+    ).get_parameter_handler("ProperTorsions")
+
+    pipeline = redis_connection.pipeline()
+
+    for parameter in torsion_handler.parameters:
+        pipeline.hsetnx(
+            _cached_parameters_key(schema_hash),
+            parameter.smirks,
+            _encode_parameter(parameter),
+        )
+
+    n_added = sum(pipeline.execute())
+
+    if n_added > 0:
+        modified = time.time() if modified is None else modified
+        current_modified = redis_connection.hget(_CACHED_PARAMETERS_KEY, schema_hash)
+
+        redis_connection.hset(
+            _CACHED_PARAMETERS_KEY,
+            schema_hash,
+            (
+                modified
+                if current_modified is None
+                else max(modified, float(current_modified))
+            ),
+        )
+
+    return n_added
+
+
+def migrate_legacy_parameters(redis_connection: redis.Redis, schema_hash: str) -> bool:
+    """
+    Convert the parameters cached for a fitting schema hash by older versions, which
+    are stored as a single serialized force field, into the current format.
+
+    Returns:
+        Whether any legacy parameters were found.
+    """
+
+    if redis_connection.exists(_cached_parameters_key(schema_hash)):
+        return False
+
+    legacy_force_field = redis_connection.get(schema_hash)
+
+    if legacy_force_field is None:
+        return False
+
+    set_cached_force_field(redis_connection, schema_hash, legacy_force_field.decode())
+    redis_connection.delete(schema_hash)
+
+    return True
+
+
+def get_cached_force_field(
+    redis_connection: redis.Redis, schema_hash: str
+) -> Optional[str]:
+    """
+    Returns the torsion parameters cached for a fitting schema hash as a serialized
+    force field, e.g. to export them, or ``None`` if none have been cached.
+    """
+
+    records = redis_connection.hgetall(_cached_parameters_key(schema_hash))
+
+    if len(records) == 0:
+        # parameters cached by older versions are stored as a single force field
+        legacy_force_field = redis_connection.get(schema_hash)
+        return None if legacy_force_field is None else legacy_force_field.decode()
+
+    force_field = ForceField()
+    torsion_handler = force_field.get_parameter_handler("ProperTorsions")
+
+    for smirks in sorted(records):
+        torsion_handler.add_parameter(parameter=_decode_parameter(records[smirks]))
+
+    return force_field.to_string(discard_cosmetic_attributes=False)
+
+
+def has_cached_parameters(redis_connection: redis.Redis, schema_hash: str) -> bool:
+    """Returns whether any parameters have been cached for a fitting schema hash,
+    including any stored in the legacy format of a single serialized force field."""
+
+    return bool(
+        redis_connection.exists(_cached_parameters_key(schema_hash), schema_hash)
+    )
+
+
 def get_cached_parameters(
     fitting_schema: BespokeOptimizationSchema, redis_connection: redis.Redis
-) -> Optional[ForceField]:
+) -> Optional[CachedTorsionIndex]:
     """
-    For the given fitting schema create a hash and check for a cached force field which contains a set of fit torsion parameters.
+    For the given fitting schema create a hash and check for any cached torsion
+    parameters.
+
+    Each parameter is stored as a separate record, and only the records of the
+    parameters that are matched by the returned index are loaded.
     """
     hash_string = _hash_fitting_schema(fitting_schema=fitting_schema)
 
-    cached_ff = redis_connection.get(hash_string)
-    if cached_ff is not None:
-        return ForceField(cached_ff, allow_cosmetic_attributes=True)
-    return None
+    # parameters cached by older versions are stored as a single force field
+    migrate_legacy_parameters(redis_connection, hash_string)
+
+    records = redis_connection.hgetall(_cached_parameters_key(hash_string))
+
+    if len(records) == 0:
+        return None
+
+    return CachedTorsionIndex.from_records(
+        {smirks.decode(): record for smirks, record in records.items()},
+        _decode_parameter,
+    )
 
 
 def cache_parameters(
@@ -50,30 +217,23 @@ def cache_parameters(
     """
 
     hash_string = _hash_fitting_schema(fitting_schema=results_schema.input_schema)
-    cached_ff = redis_connection.get(hash_string)
-    if cached_ff is not None:
-        cached_force_field = ForceField(cached_ff)
-    else:
-        # create a new blank FF
-        cached_force_field = ForceField()
-
-    torsion_handler_cache = cached_force_field.get_parameter_handler("ProperTorsions")
+
     refit_force_field = ForceField(results_schema.refit_force_field)
     refit_torsions = refit_force_field.get_parameter_handler("ProperTorsions")
 
+    pipeline = redis_connection.pipeline()
+
     for stage in results_schema.input_schema.stages:
         for parameter in stage.parameters:
-            try:
-                # the parameter maybe be in more than one stage so only save once
-                _ = torsion_handler_cache[parameter.smirks]
-            except ParameterLookupError:
-                # we need to add the parameter to the cache
-                torsion_handler_cache.add_parameter(
-                    parameter=refit_torsions[parameter.smirks]
-                )
-
-    # now set the force field back in the cache
-    redis_connection.set(
-        hash_string, cached_force_field.to_string(discard_cosmetic_attributes=False)
-    )
+            # the parameter maybe be in more than one stage so only save once
+            pipeline.hsetnx(
+                _cached_parameters_key(hash_string),
+                parameter.smirks,
+                _encode_parameter(refit_torsions[parameter.smirks]),
+            )
+
+    # keep track of when each entry was last changed so the cache can be exported
+    pipeline.hset(_CACHED_PARAMETERS_KEY, hash_string, time.time())
+    pipeline.execute()
+
     return hash_string
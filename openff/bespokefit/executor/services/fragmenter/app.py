@@ -1,6 +1,7 @@
 import json
+from typing import List, Optional
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
 from fastapi.responses import Response
 from openff.fragmenter.fragment import FragmentationResult
 from openff.utilities import MissingOptionalDependencyError
@@ -8,14 +9,23 @@ from openff.utilities import MissingOptionalDependencyError
 from openff.bespokefit.executor.services import current_settings
 from openff.bespokefit.executor.services.fragmenter import worker
 from openff.bespokefit.executor.services.fragmenter.cache import (
+    cached_fragmentation_batch_task,
     cached_fragmentation_task,
 )
 from openff.bespokefit.executor.services.fragmenter.models import (
+    FragmenterBatchGETResponse,
+    FragmenterBatchPOSTBody,
+    FragmenterBatchPOSTResponse,
+    FragmenterGETPageResponse,
     FragmenterGETResponse,
     FragmenterPOSTBody,
     FragmenterPOSTResponse,
 )
-from openff.bespokefit.executor.utilities.celery import get_task_information
+from openff.bespokefit.executor.utilities.celery import (
+    TaskInformation,
+    get_task_information,
+    get_task_information_batch,
+)
 from openff.bespokefit.executor.utilities.depiction import IMAGE_UNAVAILABLE_SVG
 from openff.bespokefit.executor.utilities.redis import connect_to_default_redis
 
@@ -24,6 +34,8 @@ router = APIRouter()
 __settings = current_settings()
 
 __GET_ENDPOINT = "/" + __settings.BEFLOW_FRAGMENTER_PREFIX + "/{fragmentation_id}"
+__BATCH_ENDPOINT = "/" + __settings.BEFLOW_FRAGMENTER_PREFIX + "/batches"
+__GET_BATCH_ENDPOINT = __BATCH_ENDPOINT + "/{batch_id}"
 __GET_FRAGMENT_IMAGE_ENDPOINT = (
     "/"
     + __settings.BEFLOW_FRAGMENTER_PREFIX
@@ -31,9 +43,9 @@ __GET_FRAGMENT_IMAGE_ENDPOINT = (
 )
 
 
-@router.get(__GET_ENDPOINT)
-def get_fragment(fragmentation_id: str) -> FragmenterGETResponse:
-    task_info = get_task_information(worker.celery_app, fragmentation_id)
+def _fragmentation_response(
+    fragmentation_id: str, task_info: TaskInformation
+) -> FragmenterGETResponse:
     task_result = task_info["result"]
 
     return FragmenterGETResponse(
@@ -57,6 +69,30 @@ def get_fragment(fragmentation_id: str) -> FragmenterGETResponse:
     )
 
 
+@router.get("/" + __settings.BEFLOW_FRAGMENTER_PREFIX)
+def get_fragments(ids: Optional[List[str]] = Query(None)) -> FragmenterGETPageResponse:
+    if ids is None:
+        raise NotImplementedError()
+
+    task_infos = get_task_information_batch(worker.celery_app, ids)
+
+    return FragmenterGETPageResponse(
+        self="/" + __settings.BEFLOW_FRAGMENTER_PREFIX,
+        prev=None,
+        next=None,
+        contents=[
+            _fragmentation_response(fragmentation_id, task_info)
+            for fragmentation_id, task_info in zip(ids, task_infos)
+        ],
+    )
+
+
+@router.get(__GET_ENDPOINT)
+def get_fragment(fragmentation_id: str) -> FragmenterGETResponse:
+    task_info = get_task_information(worker.celery_app, fragmentation_id)
+    return _fragmentation_response(fragmentation_id, task_info)
+
+
 @router.post("/" + __settings.BEFLOW_FRAGMENTER_PREFIX)
 def post_fragment(body: FragmenterPOSTBody) -> FragmenterPOSTResponse:
     # We use celery delay method in order to enqueue the task with the given
@@ -72,6 +108,40 @@ def post_fragment(body: FragmenterPOSTBody) -> FragmenterPOSTResponse:
     )
 
 
+@router.get(__GET_BATCH_ENDPOINT)
+def get_fragment_batch(batch_id: str) -> FragmenterBatchGETResponse:
+    task_info = get_task_information(worker.celery_app, batch_id)
+
+    return FragmenterBatchGETResponse(
+        id=batch_id,
+        self=__settings.BEFLOW_API_V1_STR
+        + __GET_BATCH_ENDPOINT.format(batch_id=batch_id),
+        status=task_info["status"],
+        result=task_info["result"],
+        error=json.dumps(task_info["error"]),
+    )
+
+
+@router.post(__BATCH_ENDPOINT)
+def post_fragment_batch(body: FragmenterBatchPOSTBody) -> FragmenterBatchPOSTResponse:
+    batch_id, task_ids = cached_fragmentation_batch_task(
+        task=body, redis_connection=connect_to_default_redis()
+    )
+    return FragmenterBatchPOSTResponse(
+        id=batch_id,
+        self=__settings.BEFLOW_API_V1_STR
+        + __GET_BATCH_ENDPOINT.format(batch_id=batch_id),
+        contents=[
+            FragmenterPOSTResponse(
+                id=task_id,
+                self=__settings.BEFLOW_API_V1_STR
+                + __GET_ENDPOINT.format(fragmentation_id=task_id),
+            )
+            for task_id in task_ids
+        ],
+    )
+
+
 @router.get(__GET_FRAGMENT_IMAGE_ENDPOINT)
 def get_fragment_image(fragmentation_id: str, fragment_id: int) -> Response:
     task_info = get_task_information(worker.celery_app, fragmentation_id)
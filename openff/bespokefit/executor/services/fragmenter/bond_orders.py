@@ -0,0 +1,144 @@
+"""Cache the ELF10 AM1 Wiberg bond orders computed while fragmenting molecules so that
+they are shared between fragmenter workers, overlapping parents and retried tasks."""
+
+import copy
+import hashlib
+import json
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Tuple
+
+import redis
+from openff.toolkit.topology import Molecule
+
+_BOND_ORDERS_KEY = "fragmenter:bond-orders"
+_STATISTICS_KEY = "fragmenter:bond-order-statistics"
+
+
+def _canonical_atom_map(molecule: Molecule) -> Tuple[str, Dict[int, int]]:
+    """Returns the canonical isomeric SMILES of a molecule and a map from the index of
+    each atom in the molecule to its index in the canonical SMILES."""
+
+    smiles = molecule.to_smiles(isomeric=True, explicit_hydrogens=True, mapped=False)
+
+    canonical_molecule = Molecule.from_smiles(smiles, allow_undefined_stereo=True)
+
+    _, atom_map = Molecule.are_isomorphic(
+        molecule, canonical_molecule, return_atom_map=True
+    )
+
+    return smiles, atom_map
+
+
+class BondOrderCache:
+    """A redis backed cache of ELF10 AM1 Wiberg bond orders.
+
+    Bond orders are keyed by the canonical isomeric SMILES of the molecule they were
+    computed for and the settings used to generate its conformers, and are stored in
+    the canonical atom order so they can be applied to any ordering of the atoms.
+    """
+
+    def __init__(self, redis_connection: redis.Redis):
+        self._redis_connection = redis_connection
+
+    @staticmethod
+    def _key(smiles: str, settings: Dict[str, Any]) -> str:
+        key_string = smiles + json.dumps(settings, sort_keys=True)
+        return hashlib.sha512(key_string.encode()).hexdigest()
+
+    def get(self, molecule: Molecule, **settings: Any) -> Optional[Molecule]:
+        """Returns a copy of a molecule with its fractional bond orders assigned from
+        the cache, or ``None`` if no bond orders have been cached for it."""
+
+        smiles, atom_map = _canonical_atom_map(molecule)
+
+        bond_orders_json = self._redis_connection.hget(
+            _BOND_ORDERS_KEY, self._key(smiles, settings)
+        )
+
+        self._redis_connection.hincrby(
+            _STATISTICS_KEY, "misses" if bond_orders_json is None else "hits"
+        )
+
+        if bond_orders_json is None:
+            return None
+
+        bond_orders = {
+            (index_a, index_b): bond_order
+            for index_a, index_b, bond_order in json.loads(bond_orders_json)
+        }
+
+        molecule = copy.deepcopy(molecule)
+
+        for bond in molecule.bonds:
+            index_a, index_b = sorted(
+                [atom_map[bond.atom1_index], atom_map[bond.atom2_index]]
+            )
+            bond.fractional_bond_order = bond_orders[(index_a, index_b)]
+
+        return molecule
+
+    def set(self, molecule: Molecule, **settings: Any):
+        """Store the fractional bond orders assigned to a molecule."""
+
+        smiles, atom_map = _canonical_atom_map(molecule)
+
+        bond_orders: List[Tuple[int, int, float]] = [
+            (
+                *sorted([atom_map[bond.atom1_index], atom_map[bond.atom2_index]]),
+                bond.fractional_bond_order,
+            )
+            for bond in molecule.bonds
+        ]
+
+        self._redis_connection.hset(
+            _BOND_ORDERS_KEY, self._key(smiles, settings), json.dumps(bond_orders)
+        )
+
+
+def get_bond_order_cache_statistics(redis_connection: redis.Redis) -> Dict[str, float]:
+    """Returns the number of hits and misses of the bond order cache across all
+    fragmenter workers, and the resulting hit rate."""
+
+    statistics = redis_connection.hgetall(_STATISTICS_KEY)
+
+    n_hits = int(statistics.get(b"hits", 0))
+    n_misses = int(statistics.get(b"misses", 0))
+
+    return {
+        "hits": n_hits,
+        "misses": n_misses,
+        "hit_rate": 0.0 if n_hits + n_misses == 0 else n_hits / (n_hits + n_misses),
+    }
+
+
+@contextmanager
+def cache_bond_orders(redis_connection: redis.Redis):
+    """Re-use any cached ELF10 AM1 bond orders, and cache any newly computed ones, for
+    molecules fragmented with a ``WBOFragmenter`` within this context."""
+
+    from openff.fragmenter import fragment as fragment_module
+
+    assign_bond_orders = fragment_module.assign_elf10_am1_bond_orders
+    bond_order_cache = BondOrderCache(redis_connection)
+
+    def cached_assign_bond_orders(
+        molecule: Molecule, max_confs: int = 800, rms_threshold: float = 1.0
+    ) -> Molecule:
+        settings = {"max_confs": max_confs, "rms_threshold": rms_threshold}
+
+        cached_molecule = bond_order_cache.get(molecule, **settings)
+
+        if cached_molecule is not None:
+            return cached_molecule
+
+        molecule = assign_bond_orders(molecule, **settings)
+        bond_order_cache.set(molecule, **settings)
+
+        return molecule
+
+    fragment_module.assign_elf10_am1_bond_orders = cached_assign_bond_orders
+
+    try:
+        yield
+    finally:
+        fragment_module.assign_elf10_am1_bond_orders = assign_bond_orders
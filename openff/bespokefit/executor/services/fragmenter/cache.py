@@ -1,10 +1,29 @@
 import hashlib
+import json
+import uuid
+from typing import Dict, List, Optional, Tuple
 
 import redis
 from openff.toolkit.topology import Molecule
 
 from openff.bespokefit.executor.services.fragmenter import worker
-from openff.bespokefit.executor.services.fragmenter.models import FragmenterPOSTBody
+from openff.bespokefit.executor.services.fragmenter.models import (
+    FragmenterBatchPOSTBody,
+    FragmenterPOSTBody,
+)
+
+
+def _fragmentation_task_hash(
+    cmiles: str, fragment_string: str, target_bond_smarts: Optional[List[str]]
+) -> str:
+    molecule: Molecule = Molecule.from_mapped_smiles(cmiles)
+    target_bonds_string = str(target_bond_smarts) if target_bond_smarts else "null"
+    task_string = (
+        molecule.to_inchikey(fixed_hydrogens=True)
+        + fragment_string
+        + target_bonds_string
+    )
+    return hashlib.sha512(task_string.encode()).hexdigest()
 
 
 def cached_fragmentation_task(
@@ -13,17 +32,10 @@ def cached_fragmentation_task(
     """
     Check if the fragmentation has been done before if not send it to a worker.
     """
-    molecule: Molecule = Molecule.from_mapped_smiles(task.cmiles)
     fragment_string = task.fragmenter.json() if task.fragmenter else "null"
-    target_bonds_string = (
-        str(task.target_bond_smarts) if task.target_bond_smarts else "null"
+    task_hash = _fragmentation_task_hash(
+        task.cmiles, fragment_string, task.target_bond_smarts
     )
-    task_string = (
-        molecule.to_inchikey(fixed_hydrogens=True)
-        + fragment_string
-        + target_bonds_string
-    )
-    task_hash = hashlib.sha512(task_string.encode()).hexdigest()
     task_id = redis_connection.hget("fragmenter:task-ids", task_hash)
 
     if task_id is not None:
@@ -38,3 +50,62 @@ def cached_fragmentation_task(
     # store the result
     redis_connection.hset("fragmenter:task-ids", task_hash, task_id)
     return task_id
+
+
+def cached_fragmentation_batch_task(
+    task: FragmenterBatchPOSTBody, redis_connection: redis.Redis
+) -> Tuple[str, List[str]]:
+    """
+    Send a batch of molecules to a worker to be fragmented, re-using any previous
+    fragmentation of the same molecule.
+
+    Returns:
+        The id of the batch task and the id of the fragmentation of each molecule. The
+        fragmentation of each molecule is cached in the same way as if it had been
+        submitted individually.
+    """
+    fragment_string = task.fragmenter.json() if task.fragmenter else "null"
+
+    task_hashes = [
+        _fragmentation_task_hash(cmiles, fragment_string, task.target_bond_smarts)
+        for cmiles in task.cmiles
+    ]
+    cached_ids = redis_connection.hmget("fragmenter:task-ids", task_hashes)
+
+    task_ids_by_hash: Dict[str, str] = {}
+    parents: Dict[str, str] = {}
+
+    for cmiles, task_hash, cached_id in zip(task.cmiles, task_hashes, cached_ids):
+        if task_hash in task_ids_by_hash:
+            continue
+
+        if cached_id is not None:
+            task_ids_by_hash[task_hash] = cached_id.decode()
+            continue
+
+        # the per-molecule results are stored by the batch task under these ids
+        task_id = str(uuid.uuid4())
+
+        task_ids_by_hash[task_hash] = task_id
+        parents[task_id] = cmiles
+
+    task_ids = [task_ids_by_hash[task_hash] for task_hash in task_hashes]
+
+    batch_id = worker.fragment_batch.delay(
+        parents_json=json.dumps(parents),
+        fragmentation_ids=task_ids,
+        fragmenter_json=fragment_string,
+        target_bond_smarts=task.target_bond_smarts,
+    ).id
+
+    # store the result
+    new_task_ids = {
+        task_hash: task_id
+        for task_hash, task_id in task_ids_by_hash.items()
+        if task_id in parents
+    }
+
+    if len(new_task_ids) > 0:
+        redis_connection.hset("fragmenter:task-ids", mapping=new_task_ids)
+
+    return batch_id, task_ids
@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from openff.fragmenter.fragment import (
     FragmentationResult,
@@ -7,7 +7,7 @@ from openff.fragmenter.fragment import (
 )
 
 from openff.bespokefit._pydantic import BaseModel, Field
-from openff.bespokefit.executor.services.models import Link
+from openff.bespokefit.executor.services.models import Link, PaginatedCollection
 from openff.bespokefit.executor.utilities.typing import Status
 
 
@@ -29,6 +29,10 @@ class FragmenterGETResponse(Link):
     )
 
 
+class FragmenterGETPageResponse(PaginatedCollection[FragmenterGETResponse]):
+    """"""
+
+
 class FragmenterPOSTBody(BaseModel):
     """The object model expected by a POST request."""
 
@@ -50,3 +54,75 @@ class FragmenterPOSTBody(BaseModel):
 
 class FragmenterPOSTResponse(Link):
     """The object model returned by a POST request."""
+
+
+class FragmenterBatchPOSTBody(BaseModel):
+    """The object model expected by a POST request to fragment a batch of molecules."""
+
+    cmiles: List[str] = Field(
+        ..., description="The CMILES representations of the molecules to fragment."
+    )
+    fragmenter: Optional[Union[PfizerFragmenter, WBOFragmenter]] = Field(
+        ..., description="The fragmentation engine to use."
+    )
+
+    target_bond_smarts: Optional[List[str]] = Field(
+        ...,
+        description="A list of SMARTS patterns that should be used to identify the "
+        "bonds within each parent molecule to grow fragments around.",
+    )
+
+
+class FragmenterBatchFragment(BaseModel):
+    """A fragment that was produced by one or more of the parents in a batch."""
+
+    smiles: str = Field(..., description="The canonical SMILES of the fragment.")
+    central_bond_symmetry: Tuple[int, int] = Field(
+        ...,
+        description="The symmetry classes of the two atoms in the central bond of the "
+        "fragment.",
+    )
+
+    occurrences: List[Tuple[str, int]] = Field(
+        ...,
+        description="The id of the fragmentation of each parent which produced this "
+        "fragment, and the index of the fragment in that fragmentation.",
+    )
+
+
+class FragmenterBatchResult(BaseModel):
+    """The result of fragmenting a batch of molecules."""
+
+    fragmentation_ids: List[str] = Field(
+        ...,
+        description="The ids of the fragmentation of each parent in the batch. The "
+        "result of each can be retrieved in the same way as a single fragmentation.",
+    )
+
+    fragments: List[FragmenterBatchFragment] = Field(
+        ..., description="The unique fragments produced across all of the parents."
+    )
+
+
+class FragmenterBatchGETResponse(Link):
+    """The object model returned by a GET request for a batch of fragmentations."""
+
+    status: Status = Field("waiting", description="The status of the batch.")
+
+    result: Optional[FragmenterBatchResult] = Field(
+        ..., description="The result of the batch if any was produced."
+    )
+
+    error: Optional[str] = Field(
+        ..., description="The error raised while fragmenting the batch if any."
+    )
+
+
+class FragmenterBatchPOSTResponse(Link):
+    """The object model returned by a POST request to fragment a batch of molecules."""
+
+    contents: List[FragmenterPOSTResponse] = Field(
+        ...,
+        description="Links to the fragmentation of each parent in the same order as "
+        "they were submitted.",
+    )
@@ -0,0 +1,189 @@
+"""A registry of the fragments generated across all parents so that coordinator tasks
+which produce the same fragment and central bond share a single QC calculation."""
+
+import functools
+import hashlib
+import json
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import redis
+from openff.fragmenter.fragment import Fragment, get_atom_index
+from openff.toolkit.topology import Molecule
+
+from openff.bespokefit.utilities.molecule import get_atom_symmetries
+
+_ENTRIES_KEY = "fragmenter:fragment-registry"
+_STATISTICS_KEY = "fragmenter:fragment-registry-statistics"
+
+
+def _subscribers_key(entry_key: str) -> str:
+    return f"fragmenter:fragment-registry:subscribers:{entry_key}"
+
+
+def _subscriptions_key(task_id: str) -> str:
+    return f"fragmenter:fragment-registry:task:{task_id}"
+
+
+class FragmentAnalysis:
+    """The canonical SMILES and atom symmetry classes of a fragment.
+
+    Each is computed at most once, when first needed, so that they can be shared
+    between every comparison the fragment takes part in without re-parsing the
+    fragment or repeating any calls to the cheminformatics toolkits.
+    """
+
+    def __init__(self, fragment: Fragment):
+        self.fragment = fragment
+
+    @functools.cached_property
+    def molecule(self) -> Molecule:
+        return self.fragment.molecule
+
+    @functools.cached_property
+    def smiles(self) -> str:
+        return self.molecule.to_smiles(explicit_hydrogens=False)
+
+    @functools.cached_property
+    def symmetry_classes(self) -> List[int]:
+        return get_atom_symmetries(self.molecule)
+
+    @property
+    def central_bond_symmetry(self) -> Tuple[int, int]:
+        """The sorted symmetry classes of the two atoms in the central bond."""
+
+        atom_index_a, atom_index_b = (
+            get_atom_index(self.molecule, map_index)
+            for map_index in self.fragment.bond_indices
+        )
+
+        return tuple(
+            sorted(
+                [
+                    self.symmetry_classes[atom_index_a],
+                    self.symmetry_classes[atom_index_b],
+                ]
+            )
+        )
+
+
+def get_fragment_key(
+    fragment: Union[Fragment, FragmentAnalysis],
+) -> Tuple[str, Tuple[int, int]]:
+    """Returns the canonical SMILES of a fragment and the symmetry classes of the atoms
+    in its central bond, which together identify equivalent fragments."""
+
+    analysis = (
+        fragment
+        if isinstance(fragment, FragmentAnalysis)
+        else FragmentAnalysis(fragment)
+    )
+
+    return analysis.smiles, analysis.central_bond_symmetry
+
+
+class FragmentRegistry:
+    """A redis backed registry of fragments shared between coordinator tasks.
+
+    Each entry is keyed by the canonical SMILES of a fragment, the symmetry classes of
+    its central bond and the specification of the QC calculation that will be run on
+    it. The first task to subscribe to an entry stores its fragment as the
+    representative of the entry, and every later subscriber is handed this
+    representative so that their QC tasks are identical and only computed once.
+    """
+
+    def __init__(self, redis_connection: redis.Redis):
+        self._redis_connection = redis_connection
+
+    @staticmethod
+    def _entry_key(fragment: Fragment, specification: str) -> str:
+        key_string = json.dumps([*get_fragment_key(fragment), specification])
+        return hashlib.sha512(key_string.encode()).hexdigest()
+
+    def subscribe(
+        self, task_id: str, fragment: Fragment, specification: str
+    ) -> Fragment:
+        """Subscribe a coordinator task to the registry entry of a fragment, creating
+        the entry if needed.
+
+        Args:
+            task_id: The id of the coordinator task that generated the fragment.
+            fragment: The fragment to subscribe to.
+            specification: A string representation of the QC calculation that will be
+                run on the fragment.
+
+        Returns:
+            The fragment that represents the entry and which the QC calculation should
+            be run on.
+        """
+
+        entry_key = self._entry_key(fragment, specification)
+
+        is_new_entry = self._redis_connection.hsetnx(
+            _ENTRIES_KEY, entry_key, fragment.json()
+        )
+        is_new_subscription = self._redis_connection.sadd(
+            _subscribers_key(entry_key), task_id
+        )
+        self._redis_connection.sadd(_subscriptions_key(task_id), entry_key)
+
+        if is_new_entry:
+            self._redis_connection.hincrby(_STATISTICS_KEY, "entries")
+        if is_new_subscription:
+            self._redis_connection.hincrby(_STATISTICS_KEY, "subscriptions")
+
+        if is_new_entry:
+            return fragment
+
+        return Fragment.parse_raw(self._redis_connection.hget(_ENTRIES_KEY, entry_key))
+
+    def subscribers(self, fragment: Fragment, specification: str) -> List[str]:
+        """Returns the ids of the coordinator tasks subscribed to the entry of a
+        fragment."""
+
+        entry_key = self._entry_key(fragment, specification)
+
+        return sorted(
+            task_id.decode()
+            for task_id in self._redis_connection.smembers(_subscribers_key(entry_key))
+        )
+
+
+def get_fragment_registry_statistics(
+    redis_connection: redis.Redis, task_ids: Optional[Iterable[str]] = None
+) -> Dict[str, int]:
+    """Returns the number of fragment entries in the registry, the number of
+    subscriptions to them and so the number of QC calculations that sharing the
+    entries saved.
+
+    Args:
+        redis_connection: The connection to the redis instance storing the registry.
+        task_ids: The ids of the coordinator tasks, e.g. those of a series of related
+            molecules, to restrict the statistics to. By default all tasks are included.
+    """
+
+    if task_ids is None:
+        statistics = redis_connection.hgetall(_STATISTICS_KEY)
+
+        n_entries = int(statistics.get(b"entries", 0))
+        n_subscriptions = int(statistics.get(b"subscriptions", 0))
+
+    else:
+        subscription_keys = [_subscriptions_key(task_id) for task_id in task_ids]
+
+        pipeline = redis_connection.pipeline()
+
+        for subscription_key in subscription_keys:
+            pipeline.scard(subscription_key)
+
+        n_subscriptions = sum(pipeline.execute())
+        n_entries = (
+            0
+            if len(subscription_keys) == 0
+            else len(redis_connection.sunion(subscription_keys))
+        )
+
+    return {
+        "entries": n_entries,
+        "subscriptions": n_subscriptions,
+        "qc_calculations_saved": n_subscriptions - n_entries,
+    }
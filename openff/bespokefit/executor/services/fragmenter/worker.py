@@ -1,27 +1,56 @@
-from typing import List, Optional, Union
-
+import json
+import logging
+import traceback
+from collections import defaultdict
+from multiprocessing import cpu_count, current_process, get_context
+from typing import Dict, List, Optional, Tuple, Union
+
+from celery import states
+from celery.utils.log import get_task_logger
 from openff.fragmenter.fragment import (
     Fragment,
     FragmentationResult,
     PfizerFragmenter,
     WBOFragmenter,
-    get_atom_index,
 )
 
 import openff.bespokefit
 from openff.bespokefit._pydantic import parse_raw_as
-from openff.bespokefit.executor.utilities.celery import configure_celery_app
+from openff.bespokefit.executor.services import current_settings
+from openff.bespokefit.executor.services.fragmenter.bond_orders import (
+    cache_bond_orders,
+    get_bond_order_cache_statistics,
+)
+from openff.bespokefit.executor.services.fragmenter.models import (
+    FragmenterBatchFragment,
+    FragmenterBatchResult,
+)
+from openff.bespokefit.executor.services.fragmenter.registry import (
+    FragmentAnalysis,
+    get_fragment_key,
+)
+from openff.bespokefit.executor.utilities.celery import (
+    configure_celery_app,
+    get_task_information_batch,
+)
 from openff.bespokefit.executor.utilities.redis import connect_to_default_redis
-from openff.bespokefit.utilities.molecule import get_atom_symmetries
 
 celery_app = configure_celery_app(
     "fragmenter", connect_to_default_redis(validate=False)
 )
 
+_task_logger: logging.Logger = get_task_logger(__name__)
+
 
 @celery_app.task(acks_late=True)
 def fragment(
     cmiles: str, fragmenter_json: str, target_bond_smarts: Optional[List[str]]
+) -> str:
+    return _fragment(cmiles, fragmenter_json, target_bond_smarts)
+
+
+def _fragment(
+    cmiles: str, fragmenter_json: str, target_bond_smarts: Optional[List[str]]
 ) -> str:
     from openff.toolkit.topology import Molecule
 
@@ -32,9 +61,26 @@ def fragment(
         fragmenter = parse_raw_as(
             Union[PfizerFragmenter, WBOFragmenter], fragmenter_json
         )
-        return _deduplicate_fragments(
-            fragmenter.fragment(molecule, target_bond_smarts=target_bond_smarts)
-        ).json()
+
+        if not isinstance(fragmenter, WBOFragmenter):
+            fragmentation_result = fragmenter.fragment(
+                molecule, target_bond_smarts=target_bond_smarts
+            )
+        else:
+            redis_connection = connect_to_default_redis()
+
+            with cache_bond_orders(redis_connection):
+                fragmentation_result = fragmenter.fragment(
+                    molecule, target_bond_smarts=target_bond_smarts
+                )
+
+            statistics = get_bond_order_cache_statistics(redis_connection)
+            _task_logger.info(
+                f"bond order cache hit rate {statistics['hit_rate']:.2%} "
+                f"({statistics['hits']} hits, {statistics['misses']} misses)"
+            )
+
+        return _deduplicate_fragments(fragmentation_result).json()
 
     elif fragmenter_json == "null" and target_bond_smarts:
         # no fragmentation and mock fragments
@@ -69,41 +115,132 @@ def fragment(
         return "null"
 
 
+def _fragment_parent(job: Tuple[str, str, str, Optional[List[str]]]) -> str:
+    """Fragment one parent of a batch and store its result, or any error raised while
+    fragmenting it, in the result backend under the id of the parent."""
+
+    parent_id, cmiles, fragmenter_json, target_bond_smarts = job
+
+    try:
+        result_json = _fragment(cmiles, fragmenter_json, target_bond_smarts)
+    except Exception as e:
+        celery_app.backend.mark_as_failure(
+            parent_id, e, traceback=traceback.format_exc()
+        )
+    else:
+        celery_app.backend.mark_as_done(parent_id, result_json)
+
+    return parent_id
+
+
+def _n_batch_processes(n_parents: int) -> int:
+    """Returns the number of processes to fragment a batch of parents with."""
+
+    # we can only spawn child processes if the celery worker is the main process
+    if current_process().name != "MainProcess":
+        return 1
+
+    n_cores = current_settings().fragmenter_settings.n_cores
+
+    return max(1, min(n_parents, cpu_count() if not n_cores else n_cores))
+
+
+@celery_app.task(acks_late=True)
+def fragment_batch(
+    parents_json: str,
+    fragmentation_ids: List[str],
+    fragmenter_json: str,
+    target_bond_smarts: Optional[List[str]],
+) -> str:
+    """Fragment a batch of parent molecules using a pool of processes.
+
+    The result of each parent is stored in the result backend under its own id so that
+    it can be retrieved in the same way as the result of the ``fragment`` task. The
+    result of the batch itself collects the fragments which repeat across the parents.
+
+    Args:
+        parents_json: A JSON dictionary of the CMILES of each parent to fragment keyed
+            by the id to store its result under.
+        fragmentation_ids: The ids of the fragmentations of all parents in the batch,
+            including any which had been fragmented previously.
+        fragmenter_json: The fragmentation engine to use.
+        target_bond_smarts: The SMARTS patterns of the bonds to fragment around.
+    """
+
+    parents: Dict[str, str] = json.loads(parents_json)
+
+    backend = celery_app.backend
+
+    for parent_id in parents:
+        backend.store_result(parent_id, None, states.STARTED)
+
+    jobs = [
+        (parent_id, cmiles, fragmenter_json, target_bond_smarts)
+        for parent_id, cmiles in parents.items()
+    ]
+
+    n_processes = _n_batch_processes(len(jobs))
+    _task_logger.info(f"fragmenting {len(jobs)} parents with {n_processes} processes")
+
+    if n_processes < 2:
+        for job in jobs:
+            _fragment_parent(job)
+    else:
+        # Using fork can hang on our local HPC so pin to use spawn
+        with get_context("spawn").Pool(processes=n_processes) as pool:
+            for _ in pool.imap_unordered(_fragment_parent, jobs):
+                pass
+
+    # group the fragments of every parent which are equivalent
+    fragments = defaultdict(list)
+
+    for task_info in get_task_information_batch(celery_app, fragmentation_ids):
+        if task_info["status"] != "success" or task_info["result"] is None:
+            continue
+
+        fragmentation_result = FragmentationResult.parse_obj(task_info["result"])
+
+        for i, fragment_result in enumerate(fragmentation_result.fragments):
+            fragments[get_fragment_key(fragment_result)].append((task_info["id"], i))
+
+    return FragmenterBatchResult(
+        fragmentation_ids=fragmentation_ids,
+        fragments=[
+            FragmenterBatchFragment(
+                smiles=smiles,
+                central_bond_symmetry=central_bond_symmetry,
+                occurrences=occurrences,
+            )
+            for (smiles, central_bond_symmetry), occurrences in fragments.items()
+        ],
+    ).json()
+
+
 def _deduplicate_fragments(
     fragmentation_result: FragmentationResult,
 ) -> FragmentationResult:
     """Remove symmetry equivalent fragments from the results."""
-    from collections import defaultdict
 
-    # group fragments which are the same
+    # group fragments which are the same, parsing each fragment only once
     fragments_by_smiles = defaultdict(list)
     for fragment_result in fragmentation_result.fragments:
-        fragments_by_smiles[
-            fragment_result.molecule.to_smiles(explicit_hydrogens=False)
-        ].append(fragment_result)
+        analysis = FragmentAnalysis(fragment_result)
+        fragments_by_smiles[analysis.smiles].append(analysis)
 
     unique_fragments = []
     # remove duplicated symmetry equivalent fragments
     for fragments in fragments_by_smiles.values():
         if len(fragments) == 1:
-            unique_fragments.extend(fragments)
+            unique_fragments.append(fragments[0].fragment)
             continue
 
         symmetry_groups = set()
         for fragment in fragments:
-            bond_map = fragment.bond_indices
-            fragment_mol = fragment.molecule
-            # get the index of the atoms in the fragment
-            atom1, atom2 = get_atom_index(fragment_mol, bond_map[0]), get_atom_index(
-                fragment_mol, bond_map[1]
-            )
-            symmetry_classes = get_atom_symmetries(fragment_mol)
-            symmetry_group = tuple(
-                sorted([symmetry_classes[atom1], symmetry_classes[atom2]])
-            )
+            symmetry_group = fragment.central_bond_symmetry
+
             if symmetry_group not in symmetry_groups:
                 symmetry_groups.add(symmetry_group)
-                unique_fragments.append(fragment)
+                unique_fragments.append(fragment.fragment)
 
     fragmentation_result.fragments = unique_fragments
 
@@ -0,0 +1,99 @@
+"""Cache the results of optimization stages so that a stage which is submitted again
+with identical inputs, e.g. by a retried or re-submitted task, is not re-fit."""
+
+import hashlib
+import json
+import zlib
+from typing import Dict, Optional
+
+import redis
+from openff.toolkit.typing.engines.smirnoff import ForceField
+
+from openff.bespokefit.schema.fitting import OptimizationStageSchema
+from openff.bespokefit.schema.results import OptimizationStageResults
+
+_RESULTS_KEY = "optimizer:stage-results"
+_STATISTICS_KEY = "optimizer:stage-result-statistics"
+
+
+def _hash_stage(stage: OptimizationStageSchema, initial_force_field: ForceField) -> str:
+    """Create a hash of everything that determines the result of fitting a stage,
+    namely the initial force field, the parameters to fit and their hyperparameters,
+    the targets including their reference data, and the optimizer settings."""
+
+    stage_dictionary = json.loads(stage.json())
+
+    # the attributes are stored as sets whose order is not stable between processes
+    for parameter in stage_dictionary["parameters"]:
+        parameter["attributes"] = sorted(parameter["attributes"])
+
+    hash_string = initial_force_field.to_string() + json.dumps(
+        stage_dictionary, sort_keys=True
+    )
+
+    return hashlib.sha512(hash_string.encode()).hexdigest()
+
+
+class StageResultCache:
+    """A redis backed cache of the results of successful optimization stages.
+
+    Results are keyed by a hash of the full inputs to the stage, including the
+    reference data of its targets, and are stored as compressed JSON.
+    """
+
+    def __init__(self, redis_connection: redis.Redis):
+        self._redis_connection = redis_connection
+
+    def get(
+        self, stage: OptimizationStageSchema, initial_force_field: ForceField
+    ) -> Optional[OptimizationStageResults]:
+        """Returns the cached results of a stage, or ``None`` if the stage has not
+        been fit with the same inputs before."""
+
+        result_data = self._redis_connection.hget(
+            _RESULTS_KEY, _hash_stage(stage, initial_force_field)
+        )
+
+        self._redis_connection.hincrby(
+            _STATISTICS_KEY, "misses" if result_data is None else "hits"
+        )
+
+        if result_data is None:
+            return None
+
+        return OptimizationStageResults.parse_raw(zlib.decompress(result_data))
+
+    def set(
+        self,
+        stage: OptimizationStageSchema,
+        initial_force_field: ForceField,
+        result: OptimizationStageResults,
+    ):
+        """Store the results of a stage if it was successful."""
+
+        if result.status != "success":
+            return
+
+        self._redis_connection.hset(
+            _RESULTS_KEY,
+            _hash_stage(stage, initial_force_field),
+            zlib.compress(result.json().encode()),
+        )
+
+
+def get_stage_result_cache_statistics(
+    redis_connection: redis.Redis,
+) -> Dict[str, float]:
+    """Returns the number of hits and misses of the stage result cache across all
+    optimizer workers, and the resulting hit rate."""
+
+    statistics = redis_connection.hgetall(_STATISTICS_KEY)
+
+    n_hits = int(statistics.get(b"hits", 0))
+    n_misses = int(statistics.get(b"misses", 0))
+
+    return {
+        "hits": n_hits,
+        "misses": n_misses,
+        "hit_rate": 0.0 if n_hits + n_misses == 0 else n_hits / (n_hits + n_misses),
+    }
@@ -1,30 +1,145 @@
-from typing import Union
+import logging
+import os
+from multiprocessing import cpu_count, current_process, get_context
+from typing import List, Tuple, Union
 
+from celery.signals import worker_process_init
+from celery.utils.log import get_task_logger
+from openff.toolkit.typing.engines.smirnoff import ForceField
 from qcelemental.util import serialize
 
 from openff.bespokefit._pydantic import parse_raw_as
 from openff.bespokefit.executor.services import current_settings
 from openff.bespokefit.executor.services.coordinator.utils import cache_parameters
+from openff.bespokefit.executor.services.optimizer.cache import (
+    StageResultCache,
+    get_stage_result_cache_statistics,
+)
 from openff.bespokefit.executor.utilities.celery import configure_celery_app
 from openff.bespokefit.executor.utilities.redis import (
     connect_to_default_redis,
     is_redis_available,
 )
 from openff.bespokefit.optimizers import get_optimizer
-from openff.bespokefit.schema.fitting import BespokeOptimizationSchema
+from openff.bespokefit.optimizers.decomposition import (
+    merge_stage_results,
+    split_optimization_stage,
+)
+from openff.bespokefit.optimizers.forcebalance.runner import get_force_balance_runner
+from openff.bespokefit.schema.fitting import (
+    BespokeOptimizationSchema,
+    OptimizationStageSchema,
+)
 from openff.bespokefit.schema.results import (
     BespokeOptimizationResults,
     OptimizationStageResults,
 )
+from openff.bespokefit.utilities.smirnoff import (
+    discard_cosmetic_attributes,
+    get_force_field_cache_statistics,
+    load_force_field,
+)
 from openff.bespokefit.utilities.tempcd import temporary_cd
 
 celery_app = configure_celery_app("optimizer", connect_to_default_redis(validate=False))
 
+_task_logger: logging.Logger = get_task_logger(__name__)
+
+
+@worker_process_init.connect
+def start_force_balance_runner(**_):
+    """Start, and so pre-warm, the ForceBalance runner of each worker process if fits
+    should be run in-process.
+
+    This signal is sent by each child of a prefork pool, and by a ``solo`` pool (as
+    optimizer workers use) in the main process of the worker when it is created.
+    """
+
+    if current_settings().BEFLOW_OPTIMIZER_FORCEBALANCE_MODE == "in-process":
+        get_force_balance_runner().start()
+
+
+def _optimize_stage(job: Tuple[str, str, str]) -> str:
+    """Optimize a single stage, or sub-stage, of a bespoke optimization."""
+
+    stage_json, force_field_xml, root_directory = job
+
+    stage = OptimizationStageSchema.parse_raw(stage_json)
+    optimizer = get_optimizer(stage.optimizer.type)
+
+    result = optimizer.optimize(
+        schema=stage,
+        initial_force_field=load_force_field(
+            force_field_xml, allow_cosmetic_attributes=True
+        ),
+        root_directory=root_directory,
+    )
+
+    return result.json()
+
+
+def _n_stage_processes(n_sub_stages: int) -> int:
+    """Returns the number of processes to fit the sub-stages of a stage with."""
+
+    # daemonic processes, such as the children of a prefork celery pool or a worker
+    # launched by the executor in the background, are not allowed to have children.
+    # Optimizer workers are therefore launched with a ``solo`` pool so that tasks run
+    # in the (non-daemonic) main process of the worker.
+    if current_process().daemon:
+        return 1
+
+    n_cores = current_settings().optimizer_settings.n_cores
+
+    return max(1, min(n_sub_stages, cpu_count() if not n_cores else n_cores))
+
+
+def _optimize_split_stage(
+    stage: OptimizationStageSchema, initial_force_field, root_directory: str
+) -> OptimizationStageResults:
+    """Optimize a stage by splitting it into independent sub-stages which are fit in
+    parallel, before merging the results of each back into a single force field."""
+
+    sub_stages = split_optimization_stage(stage, initial_force_field)
+
+    if len(sub_stages) < 2:
+        return get_optimizer(stage.optimizer.type).optimize(
+            schema=stage,
+            initial_force_field=initial_force_field,
+            root_directory=root_directory,
+        )
+
+    force_field_xml = initial_force_field.to_string()
+
+    jobs: List[Tuple[str, str, str]] = [
+        (
+            sub_stage.json(),
+            force_field_xml,
+            os.path.abspath(os.path.join(root_directory, f"sub_fit_{i}")),
+        )
+        for i, sub_stage in enumerate(sub_stages)
+    ]
+
+    n_processes = _n_stage_processes(len(jobs))
+
+    if n_processes < 2:
+        sub_results_json = [_optimize_stage(job) for job in jobs]
+    else:
+        # Using fork can hang on our local HPC so pin to use spawn
+        with get_context("spawn").Pool(processes=n_processes) as pool:
+            sub_results_json = pool.map(_optimize_stage, jobs)
+
+    return merge_stage_results(
+        initial_force_field,
+        sub_stages,
+        [
+            OptimizationStageResults.parse_raw(sub_result_json)
+            for sub_result_json in sub_results_json
+        ],
+    )
+
 
 @celery_app.task(bind=True, acks_late=True)
 def optimize(self, optimization_input_json: str) -> str:
-    from openff.toolkit.typing.engines.smirnoff import ForceField
-
     settings = current_settings()
 
     input_schema = parse_raw_as(
@@ -33,15 +148,31 @@ def optimize(self, optimization_input_json: str) -> str:
     input_schema.id = self.request.id or input_schema.id
 
     # some parameters have a cached attribute
-    input_force_field = ForceField(
+    input_force_field = load_force_field(
         input_schema.initial_force_field, allow_cosmetic_attributes=True
     )
 
+    redis_available = is_redis_available(
+        host=settings.BEFLOW_REDIS_ADDRESS,
+        port=settings.BEFLOW_REDIS_PORT,
+        password=settings.BEFLOW_REDIS_PASSWORD,
+    )
+    stage_cache = (
+        None if not redis_available else StageResultCache(connect_to_default_redis())
+    )
+
     stage_results = []
 
     with temporary_cd(input_schema.id):
         for i, stage in enumerate(input_schema.stages):
             optimizer = get_optimizer(stage.optimizer.type)
+
+            cached_result = (
+                None
+                if stage_cache is None or not stage.parameters
+                else stage_cache.get(stage, input_force_field)
+            )
+
             # If there are no parameters to optimise as they have all been cached mock
             # the result
             if not stage.parameters:
@@ -53,6 +184,13 @@ def optimize(self, optimization_input_json: str) -> str:
                         discard_cosmetic_attributes=True
                     ),
                 )
+            elif cached_result is not None:
+                _task_logger.info(f"re-using the cached result of stage {i}")
+                result = cached_result
+            elif settings.BEFLOW_OPTIMIZER_SPLIT_STAGES:
+                result = _optimize_split_stage(
+                    stage, input_force_field, root_directory=f"stage_{i}"
+                )
             else:
                 result = optimizer.optimize(
                     schema=stage,
@@ -60,6 +198,9 @@ def optimize(self, optimization_input_json: str) -> str:
                     root_directory=f"stage_{i}",
                 )
 
+            if stage_cache is not None and stage.parameters and cached_result is None:
+                stage_cache.set(stage, input_force_field, result)
+
             stage_results.append(result)
 
             if result.status != "success":
@@ -72,26 +213,31 @@ def optimize(self, optimization_input_json: str) -> str:
                     )
                 )
 
-            input_force_field = ForceField(
-                ForceField(
-                    result.refit_force_field, allow_cosmetic_attributes=True
-                ).to_string(discard_cosmetic_attributes=True)
+            # every refit force field is new, so parse it once without going through
+            # the in-memory force field cache.
+            input_force_field = discard_cosmetic_attributes(
+                ForceField(result.refit_force_field, allow_cosmetic_attributes=True)
             )
 
     result = BespokeOptimizationResults(input_schema=input_schema, stages=stage_results)
     # cache the final parameters
-    if (
-        is_redis_available(
-            host=settings.BEFLOW_REDIS_ADDRESS,
-            port=settings.BEFLOW_REDIS_PORT,
-            password=settings.BEFLOW_REDIS_PASSWORD,
-        )
-        and result.refit_force_field is not None
-    ):
+    if redis_available and result.refit_force_field is not None:
         cache_parameters(
             results_schema=result, redis_connection=connect_to_default_redis()
         )
 
+        statistics = get_stage_result_cache_statistics(connect_to_default_redis())
+        _task_logger.info(
+            f"stage result cache hit rate {statistics['hit_rate']:.2%} "
+            f"({statistics['hits']} hits, {statistics['misses']} misses)"
+        )
+
+    statistics = get_force_field_cache_statistics()
+    _task_logger.info(
+        f"force field cache hit rate {statistics['hit_rate']:.2%} "
+        f"({statistics['hits']} hits, {statistics['misses']} misses)"
+    )
+
     return serialize(
         result,
         encoding="json",
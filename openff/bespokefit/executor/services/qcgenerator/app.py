@@ -1,5 +1,5 @@
 import json
-from typing import List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from fastapi import APIRouter, Query
 from fastapi.responses import Response
@@ -9,14 +9,24 @@ from qcengine.procedures.torsiondrive import TorsionDriveResult
 from openff.bespokefit._pydantic import parse_obj_as
 from openff.bespokefit.executor.services import current_settings
 from openff.bespokefit.executor.services.qcgenerator import worker
-from openff.bespokefit.executor.services.qcgenerator.cache import cached_compute_task
+from openff.bespokefit.executor.services.qcgenerator.cache import (
+    cached_compute_task,
+    canonicalize_task,
+)
 from openff.bespokefit.executor.services.qcgenerator.models import (
     QCGeneratorGETPageResponse,
     QCGeneratorGETResponse,
     QCGeneratorPOSTBody,
     QCGeneratorPOSTResponse,
 )
-from openff.bespokefit.executor.utilities.celery import get_task_information
+from openff.bespokefit.executor.services.qcgenerator.qcengine import (
+    TorsionDriveProgress,
+)
+from openff.bespokefit.executor.utilities.celery import (
+    TaskInformation,
+    get_task_information,
+    get_task_information_batch,
+)
 from openff.bespokefit.executor.utilities.depiction import (
     IMAGE_UNAVAILABLE_SVG,
     smiles_to_image,
@@ -33,12 +43,13 @@ __GET_IMAGE_ENDPOINT = (
 )
 
 
-def _retrieve_qc_result(qc_calc_id: str, results: bool) -> QCGeneratorGETResponse:
-    redis_connection = connect_to_default_redis()
-
-    qc_task_info = get_task_information(worker.celery_app, qc_calc_id)
-    qc_calc_type = redis_connection.hget("qcgenerator:types", qc_calc_id)
-
+def _qc_result_response(
+    qc_calc_id: str,
+    qc_task_info: TaskInformation,
+    qc_calc_type: str,
+    qc_calc_progress: Optional[Dict[str, Any]],
+    results: bool,
+) -> QCGeneratorGETResponse:
     # Because QCElemental models contain numpy arrays that aren't natively JSON
     # serializable we need to work with plain dicts of primitive types here.
     # noinspection PyTypeChecker
@@ -47,9 +58,10 @@ def _retrieve_qc_result(qc_calc_id: str, results: bool) -> QCGeneratorGETRespons
         "self": __settings.BEFLOW_API_V1_STR
         + __GET_ENDPOINT.format(qc_calc_id=qc_calc_id),
         "status": qc_task_info["status"],
-        "type": qc_calc_type.decode(),
+        "type": qc_calc_type,
         "result": None if not results else qc_task_info["result"],
         "error": json.dumps(qc_task_info["error"]),
+        "progress": qc_calc_progress,
         "_links": {
             "image": (
                 __settings.BEFLOW_API_V1_STR
@@ -59,6 +71,66 @@ def _retrieve_qc_result(qc_calc_id: str, results: bool) -> QCGeneratorGETRespons
     }
 
 
+def _is_running_torsion_drive(qc_task_info: TaskInformation, qc_calc_type: str):
+    return qc_calc_type == "torsion1d" and qc_task_info["status"] == "running"
+
+
+def _retrieve_qc_result(qc_calc_id: str, results: bool) -> QCGeneratorGETResponse:
+    redis_connection = connect_to_default_redis()
+
+    qc_task_info = get_task_information(worker.celery_app, qc_calc_id)
+    qc_calc_type = redis_connection.hget("qcgenerator:types", qc_calc_id).decode()
+
+    qc_calc_progress = (
+        None
+        if not _is_running_torsion_drive(qc_task_info, qc_calc_type)
+        else TorsionDriveProgress.load(redis_connection, qc_calc_id)
+    )
+
+    return _qc_result_response(
+        qc_calc_id, qc_task_info, qc_calc_type, qc_calc_progress, results
+    )
+
+
+def _retrieve_qc_results(
+    qc_calc_ids: List[str], results: bool
+) -> List[QCGeneratorGETResponse]:
+    """Retrieve a set of QC results using a fixed number of round trips to redis
+    rather than several per result."""
+
+    redis_connection = connect_to_default_redis()
+
+    qc_task_infos = get_task_information_batch(worker.celery_app, qc_calc_ids)
+    qc_calc_types = [
+        qc_calc_type.decode()
+        for qc_calc_type in redis_connection.hmget("qcgenerator:types", qc_calc_ids)
+    ]
+
+    running_ids = [
+        qc_calc_id
+        for qc_calc_id, qc_task_info, qc_calc_type in zip(
+            qc_calc_ids, qc_task_infos, qc_calc_types
+        )
+        if _is_running_torsion_drive(qc_task_info, qc_calc_type)
+    ]
+    qc_calc_progress = dict(
+        zip(running_ids, TorsionDriveProgress.load_many(redis_connection, running_ids))
+    )
+
+    return [
+        _qc_result_response(
+            qc_calc_id,
+            qc_task_info,
+            qc_calc_type,
+            qc_calc_progress.get(qc_calc_id),
+            results,
+        )
+        for qc_calc_id, qc_task_info, qc_calc_type in zip(
+            qc_calc_ids, qc_task_infos, qc_calc_types
+        )
+    ]
+
+
 @router.get("/" + __settings.BEFLOW_QC_COMPUTE_PREFIX)
 def get_qc_results(
     ids: Optional[List[str]] = Query(None), results: bool = True
@@ -70,7 +142,7 @@ def get_qc_results(
         self="/" + __settings.BEFLOW_QC_COMPUTE_PREFIX,
         prev=None,
         next=None,
-        contents=[_retrieve_qc_result(qc_calc_id, results) for qc_calc_id in ids],
+        contents=_retrieve_qc_results(ids, results),
     )
 
     return response
@@ -85,11 +157,14 @@ def get_qc_result(qc_calc_id: str, results: bool = True) -> QCGeneratorGETRespon
 @router.post("/" + __settings.BEFLOW_QC_COMPUTE_PREFIX)
 def post_qc_result(body: QCGeneratorPOSTBody) -> QCGeneratorPOSTResponse:
     redis_connection = connect_to_default_redis()
-    task_id = cached_compute_task(body.input_schema, redis_connection)
+
+    canonical_task = canonicalize_task(body.input_schema, redis_connection)
+    task_id = cached_compute_task(canonical_task, redis_connection)
 
     return QCGeneratorPOSTResponse(
         id=task_id,
         self=__settings.BEFLOW_API_V1_STR + __GET_ENDPOINT.format(qc_calc_id=task_id),
+        input_schema=canonical_task,
     )
 
 
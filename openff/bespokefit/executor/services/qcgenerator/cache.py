@@ -1,10 +1,13 @@
+import functools
 import hashlib
-from typing import TypeVar, Union
+from typing import Optional, TypeVar, Union
 
 import redis
 from openff.toolkit.topology import Molecule
 
+from openff.bespokefit._pydantic import parse_raw_as
 from openff.bespokefit.executor.services.qcgenerator import worker
+from openff.bespokefit.executor.services.qcgenerator.routing import get_task_queue
 from openff.bespokefit.schema.tasks import HessianTask, OptimizationTask, Torsion1DTask
 from openff.bespokefit.utilities.molecule import canonical_order_atoms
 
@@ -47,6 +50,55 @@ def _canonicalize_task(task: _T) -> _T:
     return task
 
 
+@functools.lru_cache(4096)
+def _canonical_task_json(
+    task_json: str, redis_connection: Optional[redis.Redis] = None
+) -> str:
+    """Returns the JSON representation of the canonical form of a serialized task,
+    re-using any canonical form previously stored in redis."""
+
+    task_hash = hashlib.sha512(task_json.encode()).hexdigest()
+
+    canonical_json = (
+        None
+        if redis_connection is None
+        else redis_connection.hget("qcgenerator:canonical-tasks", task_hash)
+    )
+
+    if canonical_json is not None:
+        return canonical_json.decode()
+
+    task = parse_raw_as(Union[HessianTask, OptimizationTask, Torsion1DTask], task_json)
+    canonical_json = _canonicalize_task(task).json()
+
+    if redis_connection is not None:
+        canonical_hash = hashlib.sha512(canonical_json.encode()).hexdigest()
+        # canonicalizing an already canonical task is a no-op so store this as well
+        # so callers re-submitting the canonical form also skip the toolkit calls.
+        redis_connection.hset(
+            "qcgenerator:canonical-tasks",
+            mapping={task_hash: canonical_json, canonical_hash: canonical_json},
+        )
+
+    return canonical_json
+
+
+def canonicalize_task(task: _T, redis_connection: Optional[redis.Redis] = None) -> _T:
+    """Canonicalize a QC task, memoising the result both in memory and, if a redis
+    connection is provided, in redis so that repeat lookups do not require re-parsing
+    the task SMILES with the cheminformatics toolkits.
+
+    Args:
+        task: The task to canonicalize.
+        redis_connection: An optional connection to use to persist canonical forms.
+
+    Returns:
+        The canonical form of the task.
+    """
+
+    return task.__class__.parse_raw(_canonical_task_json(task.json(), redis_connection))
+
+
 def cached_compute_task(
     task: Union[HessianTask, OptimizationTask, Torsion1DTask],
     redis_connection: redis.Redis,
@@ -65,7 +117,7 @@ def cached_compute_task(
         raise NotImplementedError()
 
     # Canonicalize the task to improve the cache hit rate.
-    task = _canonicalize_task(task)
+    task = canonicalize_task(task, redis_connection)
 
     task_hash = hashlib.sha512(task.json().encode()).hexdigest()
     task_id = redis_connection.hget("qcgenerator:task-ids", task_hash)
@@ -73,7 +125,9 @@ def cached_compute_task(
     if task_id is not None:
         return task_id.decode()
 
-    task_id = compute.delay(task_json=task.json()).id
+    task_id = compute.apply_async(
+        kwargs={"task_json": task.json()}, queue=get_task_queue(task)
+    ).id
 
     redis_connection.hset("qcgenerator:types", task_id, task.type)
     # Make sure to only set the hash after the type is set in case the connection
@@ -0,0 +1,165 @@
+"""Compute hessians by the finite difference of analytic gradients for programs which
+cannot compute them directly."""
+
+from multiprocessing import get_context
+from typing import Any, Dict, List, Optional
+
+import numpy
+import qcengine
+from qcelemental.models import (
+    AtomicInput,
+    AtomicResult,
+    AtomicResultProperties,
+    DriverEnum,
+)
+from qcelemental.models import Molecule as QCMolecule
+from qcelemental.models.common_models import Model, Provenance
+from qcengine.config import TaskConfig
+
+import openff.bespokefit
+from openff.bespokefit.executor.services.qcgenerator.qcengine import (
+    _divide_config,
+    get_n_parallel_workers,
+)
+
+# The programs that are able to compute hessians themselves.
+ANALYTIC_HESSIAN_PROGRAMS = {"psi4"}
+
+# The size [bohr] of the displacement applied to each cartesian coordinate.
+_DISPLACEMENT_SIZE = 0.005
+
+
+def _with_geometry(molecule: QCMolecule, geometry: numpy.ndarray) -> QCMolecule:
+    """Returns a copy of a molecule with a new geometry [bohr] which is fixed in place
+    so that any gradients are returned in the same frame."""
+
+    return QCMolecule(
+        **{
+            **molecule.dict(),
+            "geometry": geometry.reshape(-1, 3),
+            "fix_com": True,
+            "fix_orientation": True,
+        }
+    )
+
+
+def _displaced_molecules(molecule: QCMolecule, step: float) -> List[QCMolecule]:
+    """Returns the molecules obtained by displacing each cartesian coordinate of a
+    molecule forwards and then backwards by ``step``."""
+
+    geometry = numpy.asarray(molecule.geometry, dtype=float).reshape(-1)
+
+    displaced_molecules = []
+
+    for i in range(len(geometry)):
+        for sign in (1.0, -1.0):
+            displaced_geometry = geometry.copy()
+            displaced_geometry[i] += sign * step
+
+            displaced_molecules.append(_with_geometry(molecule, displaced_geometry))
+
+    return displaced_molecules
+
+
+def _compute_gradient(
+    atomic_input: AtomicInput, program: str, config: TaskConfig
+) -> AtomicResult:
+    return qcengine.compute(
+        atomic_input, program, raise_error=True, task_config=config.dict()
+    )
+
+
+def compute_finite_difference_hessian(
+    molecule: QCMolecule,
+    model: Model,
+    program: str,
+    config: TaskConfig,
+    keywords: Optional[Dict[str, Any]] = None,
+    step: float = _DISPLACEMENT_SIZE,
+) -> AtomicResult:
+    """Compute the hessian of a molecule by the central finite difference of the
+    gradients at the 6N geometries obtained by displacing each cartesian coordinate.
+
+    The displaced gradients are independent of each other and so are split between
+    parallel processes in the same way as the optimizations of a torsion drive.
+
+    Args:
+        molecule: The (ideally minimized) molecule to compute the hessian of.
+        model: The model to evaluate the gradients with.
+        program: The program to evaluate the gradients with.
+        config: The resources available to compute the hessian with.
+        keywords: Any program specific keywords.
+        step: The size [bohr] of the displacement to apply to each coordinate.
+
+    Returns:
+        The result containing the hessian [Eh / bohr^2] as well as the energy and
+        gradient of the undisplaced molecule.
+    """
+
+    keywords = {} if keywords is None else keywords
+
+    molecule = _with_geometry(molecule, numpy.asarray(molecule.geometry, dtype=float))
+
+    atomic_inputs = [
+        AtomicInput(
+            molecule=input_molecule,
+            driver=DriverEnum.gradient,
+            model=model,
+            keywords=keywords,
+        )
+        for input_molecule in [molecule, *_displaced_molecules(molecule, step)]
+    ]
+
+    n_workers = get_n_parallel_workers(program, config, len(atomic_inputs))
+
+    if n_workers > 1:
+        gradient_config = _divide_config(config=config, n_workers=n_workers)
+
+        # Using fork can hang on our local HPC so pin to use spawn
+        with get_context("spawn").Pool(processes=n_workers) as pool:
+            results = pool.starmap(
+                _compute_gradient,
+                [
+                    (atomic_input, program, gradient_config)
+                    for atomic_input in atomic_inputs
+                ],
+            )
+
+    else:
+        results = [
+            _compute_gradient(atomic_input, program, config)
+            for atomic_input in atomic_inputs
+        ]
+
+    reference_result, displaced_results = results[0], results[1:]
+
+    gradients = numpy.array(
+        [
+            numpy.asarray(result.return_result, dtype=float).reshape(-1)
+            for result in displaced_results
+        ]
+    )
+    hessian = (gradients[0::2] - gradients[1::2]) / (2.0 * step)
+    # remove the (small) asymmetry introduced by the finite difference
+    hessian = 0.5 * (hessian + hessian.T)
+
+    return AtomicResult(
+        molecule=molecule,
+        driver=DriverEnum.hessian,
+        model=model,
+        keywords=keywords,
+        return_result=hessian,
+        properties=AtomicResultProperties(
+            calcinfo_natom=len(molecule.symbols),
+            return_energy=reference_result.properties.return_energy,
+            return_gradient=reference_result.return_result,
+            return_hessian=hessian,
+        ),
+        extras={"n_gradient_evaluations": len(atomic_inputs)},
+        success=True,
+        provenance=Provenance(
+            creator="openff-bespokefit",
+            version=openff.bespokefit.__version__,
+            routine=f"{__name__}.compute_finite_difference_hessian",
+        ),
+    )
@@ -1,4 +1,4 @@
-from typing import Dict, Optional, Union
+from typing import Dict, List, Optional, Union
 
 from qcelemental.models import AtomicResult, FailedOperation, OptimizationResult
 from qcengine.procedures.torsiondrive import TorsionDriveResult
@@ -10,6 +10,28 @@ from openff.bespokefit.executor.utilities.typing import Status
 from openff.bespokefit.schema.tasks import HessianTask, OptimizationTask, Torsion1DTask
 
 
+class QCGeneratorProgress(BaseModel):
+    """The live progress of a running torsion drive."""
+
+    iteration: int = Field(
+        ..., description="The number of wavefront iterations completed so far."
+    )
+    n_grid_points: int = Field(
+        ..., description="The total number of grid points that will be scanned."
+    )
+
+    completed_grid_ids: List[str] = Field(
+        ...,
+        description="The ids of the grid points with at least one completed "
+        "optimization.",
+    )
+    energies: Dict[str, float] = Field(
+        ...,
+        description="The lowest energy [Hartree] found so far at each completed grid "
+        "point.",
+    )
+
+
 class QCGeneratorGETResponse(Link):
     """The object model returned by a GET request."""
 
@@ -27,6 +49,12 @@ class QCGeneratorGETResponse(Link):
         ..., description="The error raised while running the QC calculation if any."
     )
 
+    progress: Optional[QCGeneratorProgress] = Field(
+        None,
+        description="The live progress of the QC calculation if it is a running "
+        "torsion drive.",
+    )
+
     links: Dict[str, str] = Field(
         {}, description="Links to resources associated with the model.", alias="_links"
     )
@@ -44,3 +72,9 @@ class QCGeneratorPOSTBody(BaseModel):
 
 class QCGeneratorPOSTResponse(Link):
     """The object model returned by a POST request."""
+
+    input_schema: Optional[Union[HessianTask, OptimizationTask, Torsion1DTask]] = Field(
+        None,
+        description="The canonical form of the submitted schema. Submitting this form "
+        "rather than the original schema avoids the need to re-canonicalize it.",
+    )
@@ -1,8 +1,18 @@
+import hashlib
+import json
+from contextlib import contextmanager
+from contextvars import ContextVar
 from multiprocessing import current_process, get_context
-from typing import Dict, List, Union
+from typing import Dict, List, Optional, Union
 
+import numpy
+import redis
 from qcelemental.models import FailedOperation
-from qcelemental.models.procedures import OptimizationResult, TorsionDriveInput
+from qcelemental.models.procedures import (
+    OptimizationResult,
+    TDKeywords,
+    TorsionDriveInput,
+)
 from qcengine.config import TaskConfig
 from qcengine.procedures import register_procedure
 from qcengine.procedures.torsiondrive import TorsionDriveProcedure
@@ -22,6 +32,246 @@ def _divide_config(config: TaskConfig, n_workers: int) -> TaskConfig:
     )
 
 
+def get_n_parallel_workers(program: str, config: TaskConfig, n_jobs: int) -> int:
+    """
+    Returns the number of processes to split a set of independent calculations between.
+    """
+
+    settings = current_settings()
+    tasks_per_worker = settings.BEFLOW_QC_COMPUTE_WORKER_N_TASKS
+    # we can only split the tasks if the celery worker is the main process so if not set back to 1
+    if current_process().name != "MainProcess":
+        tasks_per_worker = 1
+
+    if program == "psi4" and tasks_per_worker == "auto":
+        # we recommend 8 cores per worker for psi4 from our qcfractal jobs
+        tasks_per_worker = max([int(config.ncores / 8), 1])
+    elif tasks_per_worker == "auto":
+        # for low cost methods like ani or xtb its often faster to not split the jobs
+        tasks_per_worker = 1
+
+    if tasks_per_worker > 1 and n_jobs > 1:
+        return int(min([n_jobs, tasks_per_worker]))
+
+    return 1
+
+
+class TorsionDriveCheckpoint:
+    """Persist the input and completed constrained optimizations of a torsion drive in
+    redis so that the drive can resume after the worker running it is lost.
+
+    Torsion drives are deterministic given their input and the results of each
+    optimization, so a re-delivered drive is resumed by replaying the stored results
+    of each completed wavefront iteration rather than re-running them.
+    """
+
+    def __init__(self, redis_connection: redis.Redis, task_hash: str):
+        self._redis_connection = redis_connection
+        self._key = f"qcgenerator:torsiondrive-checkpoint:{task_hash}"
+
+    @staticmethod
+    def _job_key(grid_point: str, job: List[float]) -> str:
+        job_string = json.dumps(
+            [grid_point, numpy.round(numpy.array(job, dtype=float), 6).tolist()]
+        )
+        return hashlib.sha1(job_string.encode()).hexdigest()
+
+    def load_input(self) -> Optional[TorsionDriveInput]:
+        """Returns the input of the checkpointed torsion drive if one was stored."""
+
+        input_json = self._redis_connection.hget(self._key, "input")
+        return None if input_json is None else TorsionDriveInput.parse_raw(input_json)
+
+    def save_input(self, input_model: TorsionDriveInput):
+        self._redis_connection.hset(self._key, "input", input_model.json())
+
+    def load_results(
+        self, next_jobs: Dict[str, List[List[float]]]
+    ) -> Dict[str, List[Optional[OptimizationResult]]]:
+        """Returns any stored results for a set of jobs, with ``None`` in place of the
+        jobs that have not yet been completed."""
+
+        job_keys = [
+            self._job_key(grid_point, job)
+            for grid_point, jobs in next_jobs.items()
+            for job in jobs
+        ]
+        stored_results = iter(
+            []
+            if len(job_keys) == 0
+            else self._redis_connection.hmget(self._key, job_keys)
+        )
+
+        return {
+            grid_point: [
+                (
+                    None
+                    if stored_result is None
+                    else OptimizationResult.parse_raw(stored_result)
+                )
+                for stored_result in (next(stored_results) for _ in jobs)
+            ]
+            for grid_point, jobs in next_jobs.items()
+        }
+
+    def save_results(
+        self,
+        next_jobs: Dict[str, List[List[float]]],
+        results: Dict[str, List[Union[FailedOperation, OptimizationResult]]],
+    ):
+        """Store the successful results of a wavefront iteration."""
+
+        stored_results = {
+            self._job_key(grid_point, job): OptimizationResult(
+                **result.dict(exclude={"trajectory", "stdout", "stderr"}),
+                trajectory=[],
+            ).json()
+            for grid_point, jobs in next_jobs.items()
+            for job, result in zip(jobs, results[grid_point])
+            if isinstance(result, OptimizationResult) and result.success
+        }
+
+        if len(stored_results) > 0:
+            self._redis_connection.hset(self._key, mapping=stored_results)
+
+    def clear(self):
+        self._redis_connection.delete(self._key)
+
+
+_active_checkpoint: ContextVar[Optional[TorsionDriveCheckpoint]] = ContextVar(
+    "_active_checkpoint", default=None
+)
+
+
+@contextmanager
+def activate_checkpoint(checkpoint: TorsionDriveCheckpoint):
+    """Checkpoint any torsion drive run with the ``TorsionDriveParallel`` procedure
+    within this context."""
+
+    token = _active_checkpoint.set(checkpoint)
+
+    try:
+        yield
+    finally:
+        _active_checkpoint.reset(token)
+
+
+class TorsionDriveProgress:
+    """Publish compact, live progress updates of a running torsion drive to redis
+    after each wavefront iteration.
+
+    The update stores the current iteration, the grid points that have at least one
+    completed optimization and the lowest energy found at each of them so far.
+    """
+
+    def __init__(self, redis_connection: redis.Redis, task_id: str):
+        self._redis_connection = redis_connection
+        self._key = self.redis_key(task_id)
+
+        self._iteration = 0
+        self._energies: Dict[str, float] = {}
+
+    @staticmethod
+    def redis_key(task_id: str) -> str:
+        return f"qcgenerator:progress:{task_id}"
+
+    @staticmethod
+    def _n_grid_points(keywords: TDKeywords) -> int:
+        """Returns the total number of grid points that will be scanned."""
+
+        n_grid_points = 1
+
+        for i, grid_spacing in enumerate(keywords.grid_spacing):
+            if keywords.dihedral_ranges is None:
+                n_grid_points *= 360 // grid_spacing
+                continue
+
+            lower, upper = keywords.dihedral_ranges[i]
+            n_grid_points *= (upper - lower) // grid_spacing + 1
+
+        return n_grid_points
+
+    def update(
+        self,
+        input_model: TorsionDriveInput,
+        results: Dict[str, List[Union[FailedOperation, OptimizationResult]]],
+    ):
+        """Record the results of a wavefront iteration and publish the update."""
+
+        self._iteration += 1
+
+        for grid_point, grid_results in results.items():
+            energies = [
+                result.energies[-1]
+                for result in grid_results
+                if isinstance(result, OptimizationResult)
+                and result.success
+                and len(result.energies) > 0
+            ]
+
+            if grid_point in self._energies:
+                energies.append(self._energies[grid_point])
+
+            if len(energies) > 0:
+                self._energies[grid_point] = min(energies)
+
+        self._redis_connection.set(
+            self._key,
+            json.dumps(
+                {
+                    "iteration": self._iteration,
+                    "n_grid_points": self._n_grid_points(input_model.keywords),
+                    "completed_grid_ids": sorted(self._energies),
+                    "energies": self._energies,
+                }
+            ),
+        )
+
+    @classmethod
+    def load(cls, redis_connection: redis.Redis, task_id: str) -> Optional[Dict]:
+        """Returns the last progress update published for a task if there was one."""
+
+        progress_json = redis_connection.get(cls.redis_key(task_id))
+        return None if progress_json is None else json.loads(progress_json)
+
+    @classmethod
+    def load_many(
+        cls, redis_connection: redis.Redis, task_ids: List[str]
+    ) -> List[Optional[Dict]]:
+        """Returns the last progress update published for each of a set of tasks."""
+
+        if len(task_ids) == 0:
+            return []
+
+        return [
+            None if progress_json is None else json.loads(progress_json)
+            for progress_json in redis_connection.mget(
+                [cls.redis_key(task_id) for task_id in task_ids]
+            )
+        ]
+
+    def clear(self):
+        self._redis_connection.delete(self._key)
+
+
+_active_progress: ContextVar[Optional[TorsionDriveProgress]] = ContextVar(
+    "_active_progress", default=None
+)
+
+
+@contextmanager
+def activate_progress(progress: TorsionDriveProgress):
+    """Publish the progress of any torsion drive run with the ``TorsionDriveParallel``
+    procedure within this context."""
+
+    token = _active_progress.set(progress)
+
+    try:
+        yield
+    finally:
+        _active_progress.reset(token)
+
+
 class TorsionDriveProcedureParallel(TorsionDriveProcedure):
     """
     Override the _spawn_optimizations method of the basic torsiondrive procedure to allow for parallel optimizations
@@ -35,29 +285,93 @@ class TorsionDriveProcedureParallel(TorsionDriveProcedure):
         next_jobs: Dict[str, List[List[float]]],
         input_model: TorsionDriveInput,
         config: TaskConfig,
+    ) -> Dict[str, List[Union[FailedOperation, OptimizationResult]]]:
+        """
+        Spawn the optimizations of the next wavefront iteration, re-using the results of
+        any optimizations stored in an active checkpoint and publishing the progress of
+        the drive if requested.
+        """
+
+        checkpoint = _active_checkpoint.get()
+
+        results = (
+            self._spawn_parallel_optimizations(next_jobs, input_model, config)
+            if checkpoint is None
+            else self._spawn_checkpointed_optimizations(
+                checkpoint, next_jobs, input_model, config
+            )
+        )
+
+        progress = _active_progress.get()
+
+        if progress is not None:
+            progress.update(input_model, results)
+
+        return results
+
+    def _spawn_checkpointed_optimizations(
+        self,
+        checkpoint: TorsionDriveCheckpoint,
+        next_jobs: Dict[str, List[List[float]]],
+        input_model: TorsionDriveInput,
+        config: TaskConfig,
+    ) -> Dict[str, List[Union[FailedOperation, OptimizationResult]]]:
+        """
+        Spawn only those optimizations whose results are not already stored in a
+        checkpoint, and store the results of those that are.
+        """
+
+        stored_results = checkpoint.load_results(next_jobs)
+
+        jobs_to_run = {
+            grid_point: [
+                job
+                for job, result in zip(jobs, stored_results[grid_point])
+                if result is None
+            ]
+            for grid_point, jobs in next_jobs.items()
+        }
+        jobs_to_run = {
+            grid_point: jobs
+            for grid_point, jobs in jobs_to_run.items()
+            if len(jobs) > 0
+        }
+
+        new_results = (
+            {}
+            if len(jobs_to_run) == 0
+            else self._spawn_parallel_optimizations(jobs_to_run, input_model, config)
+        )
+        checkpoint.save_results(jobs_to_run, new_results)
+
+        results = {}
+
+        for grid_point, grid_results in stored_results.items():
+            grid_new_results = iter(new_results.get(grid_point, []))
+            results[grid_point] = [
+                next(grid_new_results) if result is None else result
+                for result in grid_results
+            ]
+
+        return results
+
+    def _spawn_parallel_optimizations(
+        self,
+        next_jobs: Dict[str, List[List[float]]],
+        input_model: TorsionDriveInput,
+        config: TaskConfig,
     ) -> Dict[str, List[Union[FailedOperation, OptimizationResult]]]:
         """
         Spawn parallel optimizations based on the number of next jobs and available workers.
         """
 
-        settings = current_settings()
         program = input_model.optimization_spec.keywords["program"]
-        opts_per_worker = settings.BEFLOW_QC_COMPUTE_WORKER_N_TASKS
-        # we can only split the tasks if the celery worker is the main process so if not set back to 1
-        if current_process().name != "MainProcess":
-            opts_per_worker = 1
-
-        if program == "psi4" and opts_per_worker == "auto":
-            # we recommend 8 cores per worker for psi4 from our qcfractal jobs
-            opts_per_worker = max([int(config.ncores / 8), 1])
-        elif opts_per_worker == "auto":
-            # for low cost methods like ani or xtb its often faster to not split the jobs
-            opts_per_worker = 1
 
         n_jobs = sum([len(value) for value in next_jobs.values()])
-        if opts_per_worker > 1 and n_jobs > 1:
+        n_workers = get_n_parallel_workers(program, config, n_jobs)
+
+        if n_workers > 1:
             # split the resources based on the number of tasks
-            n_workers = int(min([n_jobs, opts_per_worker]))
             opt_config = _divide_config(config=config, n_workers=n_workers)
 
             # Using fork can hang on our local HPC so pin to use spawn
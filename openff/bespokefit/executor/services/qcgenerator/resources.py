@@ -0,0 +1,103 @@
+"""Track the cores and memory used by QC tasks running concurrently on a worker."""
+
+import json
+import os
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+import redis
+
+
+class ResourceBudget:
+    """A thread safe budget of the cores and memory available to a worker, which QC
+    tasks must acquire a share of before running."""
+
+    def __init__(self, n_cores: int, memory: float):
+        """
+
+        Args:
+            n_cores: The total number of cores available to the worker.
+            memory: The total memory [GiB] available to the worker.
+        """
+
+        self.n_cores = n_cores
+        self.memory = memory
+
+        self._n_cores_used = 0
+        self._memory_used = 0.0
+        self._n_tasks = 0
+
+        self._condition = threading.Condition()
+
+    def _can_admit(self, n_cores: int, memory: float) -> bool:
+        # always admit a task into an idle worker, even if it requests more than the
+        # total budget, so that it cannot be blocked forever.
+        return self._n_tasks == 0 or (
+            self._n_cores_used + n_cores <= self.n_cores
+            and self._memory_used + memory <= self.memory
+        )
+
+    @contextmanager
+    def acquire(self, n_cores: int, memory: float):
+        """Block until the requested cores and memory are available and reserve them
+        for the duration of the context."""
+
+        with self._condition:
+            self._condition.wait_for(lambda: self._can_admit(n_cores, memory))
+
+            self._n_cores_used += n_cores
+            self._memory_used += memory
+            self._n_tasks += 1
+
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._n_cores_used -= n_cores
+                self._memory_used -= memory
+                self._n_tasks -= 1
+
+                self._condition.notify_all()
+
+    def utilisation(self) -> Dict[str, float]:
+        """Returns a summary of the resources currently in use."""
+
+        with self._condition:
+            return {
+                "n_tasks": self._n_tasks,
+                "n_cores": self.n_cores,
+                "n_cores_used": self._n_cores_used,
+                "memory": self.memory,
+                "memory_used": round(self._memory_used, 3),
+            }
+
+
+def worker_name() -> str:
+    """Returns a name that uniquely identifies the current worker process."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def publish_utilisation(
+    budget: ResourceBudget, redis_connection: redis.Redis, name: Optional[str] = None
+):
+    """Store the current utilisation of a worker's resources in redis."""
+
+    redis_connection.hset(
+        "qcgenerator:worker-utilisation",
+        worker_name() if name is None else name,
+        json.dumps({**budget.utilisation(), "time": time.time()}),
+    )
+
+
+def get_worker_utilisation(redis_connection: redis.Redis) -> Dict[str, Dict]:
+    """Returns the most recently published resource utilisation of each QC worker."""
+
+    return {
+        name.decode(): json.loads(utilisation)
+        for name, utilisation in redis_connection.hgetall(
+            "qcgenerator:worker-utilisation"
+        ).items()
+    }
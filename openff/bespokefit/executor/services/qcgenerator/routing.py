@@ -0,0 +1,150 @@
+"""Estimate the cost of QC tasks and route them to appropriately sized worker
+queues."""
+
+from typing import Dict, List, Tuple, Union
+
+from openff.toolkit.topology import Molecule
+
+from openff.bespokefit.executor.services import current_settings
+from openff.bespokefit.schema.tasks import HessianTask, OptimizationTask, Torsion1DTask
+
+_DEFAULT_QUEUE = "qcgenerator"
+
+# The (prefactor, exponent) used to estimate the relative cost of a single gradient
+# evaluation with a given program as ``prefactor * n_effective_atoms ** exponent``.
+_PROGRAM_SCALING: Dict[str, Tuple[float, float]] = {
+    "psi4": (1.0, 3.0),
+    "xtb": (1.0e-3, 2.0),
+    "torchani": (1.0e-4, 1.0),
+    "openmm": (1.0e-5, 1.0),
+    "rdkit": (1.0e-5, 1.0),
+}
+# The exponent used for methods whose formal scaling exceeds that of DFT.
+_CORRELATED_METHOD_EXPONENT = 5.0
+
+_SIZE_QUEUES = ("small", "medium", "large")
+
+
+def _basis_factor(basis: Union[str, None]) -> float:
+    """Returns a rough multiplier for the cost of a calculation with a given basis
+    relative to a double zeta basis."""
+
+    if not basis:
+        return 1.0
+
+    basis = basis.lower()
+
+    factor = 9.0 if "qz" in basis else 3.0 if "tz" in basis else 1.0
+
+    if "aug" in basis or "+" in basis:
+        factor *= 1.5
+
+    return factor
+
+
+def _n_gradients(task: Union[HessianTask, OptimizationTask, Torsion1DTask]) -> float:
+    """Returns a rough estimate of the number of constrained or unconstrained
+    optimizations that will be performed by a task."""
+
+    if isinstance(task, Torsion1DTask):
+        scan_range = (-165, 180) if task.scan_range is None else task.scan_range
+        n_grid_points = (scan_range[1] - scan_range[0]) // task.grid_spacing + 1
+
+        return n_grid_points * task.n_conformers
+
+    return task.n_conformers
+
+
+def estimate_task_cost(
+    task: Union[HessianTask, OptimizationTask, Torsion1DTask],
+) -> float:
+    """Estimate the relative cost of running a QC task.
+
+    The cost is a unitless number based on the number of heavy and hydrogen atoms in the
+    molecule, the program, method and basis used to evaluate it, and the number of
+    optimizations the task will perform.
+
+    Args:
+        task: The task to estimate the cost of.
+
+    Returns:
+        The estimated relative cost.
+    """
+
+    molecule = Molecule.from_smiles(task.smiles, allow_undefined_stereo=True)
+
+    n_heavy_atoms = sum(1 for atom in molecule.atoms if atom.atomic_number != 1)
+    n_hydrogen_atoms = molecule.n_atoms - n_heavy_atoms
+    # hydrogen atoms contribute far fewer basis functions than heavy atoms
+    n_effective_atoms = n_heavy_atoms + 0.25 * n_hydrogen_atoms
+
+    prefactor, exponent = _PROGRAM_SCALING.get(task.program.lower(), (1.0, 3.0))
+
+    method = task.model.method.lower()
+
+    if task.program.lower() == "psi4" and ("mp2" in method or "cc" in method):
+        exponent = _CORRELATED_METHOD_EXPONENT
+
+    gradient_cost = (
+        prefactor * n_effective_atoms**exponent * _basis_factor(task.model.basis)
+    )
+
+    return gradient_cost * _n_gradients(task)
+
+
+def get_task_queue(task: Union[HessianTask, OptimizationTask, Torsion1DTask]) -> str:
+    """Returns the name of the celery queue that a QC task should be sent to based on
+    the ``BEFLOW_QC_COMPUTE_QUEUE_ROUTING`` setting."""
+
+    settings = current_settings()
+    routing = settings.BEFLOW_QC_COMPUTE_QUEUE_ROUTING
+
+    if routing == "none":
+        return _DEFAULT_QUEUE
+
+    elif routing == "program":
+        program = task.program.lower()
+
+        # workers only subscribe to the queues of known programs by default
+        if program not in _PROGRAM_SCALING:
+            return _DEFAULT_QUEUE
+
+        return f"{_DEFAULT_QUEUE}-{program}"
+
+    elif routing == "size":
+        cost = estimate_task_cost(task)
+
+        size = (
+            "small"
+            if cost < settings.BEFLOW_QC_COMPUTE_QUEUE_SMALL_COST
+            else (
+                "large"
+                if cost >= settings.BEFLOW_QC_COMPUTE_QUEUE_LARGE_COST
+                else "medium"
+            )
+        )
+        return f"{_DEFAULT_QUEUE}-{size}"
+
+    raise NotImplementedError()
+
+
+def get_worker_queues() -> List[str]:
+    """Returns the names of all of the queues that a QC worker should subscribe to by
+    default so that it can run any task given the current routing settings."""
+
+    settings = current_settings()
+    routing = settings.BEFLOW_QC_COMPUTE_QUEUE_ROUTING
+
+    if routing == "none":
+        return [_DEFAULT_QUEUE]
+
+    elif routing == "program":
+        return [
+            _DEFAULT_QUEUE,
+            *(f"{_DEFAULT_QUEUE}-{program}" for program in _PROGRAM_SCALING),
+        ]
+
+    elif routing == "size":
+        return [_DEFAULT_QUEUE, *(f"{_DEFAULT_QUEUE}-{size}" for size in _SIZE_QUEUES)]
+
+    raise NotImplementedError()
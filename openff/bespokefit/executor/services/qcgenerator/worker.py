@@ -1,12 +1,15 @@
+import hashlib
 import logging
-from typing import Any, Dict, List
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, List, Optional, Union
 
 import psutil
 import qcelemental
 import qcengine
+from celery.signals import heartbeat_sent
 from celery.utils.log import get_task_logger
 from openff.toolkit.topology import Atom, Molecule
-from qcelemental.models import AtomicResult
+from qcelemental.models import AtomicInput, AtomicResult
 from qcelemental.models.common_models import DriverEnum
 from qcelemental.models.procedures import (
     OptimizationInput,
@@ -18,12 +21,27 @@ from qcelemental.models.procedures import (
     TorsionDriveResult,
 )
 from qcelemental.util import serialize
-from qcengine.config import get_global
+from qcengine.config import TaskConfig, get_global
 
 from openff.bespokefit.executor.services import current_settings
+from openff.bespokefit.executor.services.qcgenerator.hessian import (
+    ANALYTIC_HESSIAN_PROGRAMS,
+    compute_finite_difference_hessian,
+)
+from openff.bespokefit.executor.services.qcgenerator.qcengine import (
+    TorsionDriveCheckpoint,
+    TorsionDriveProgress,
+    activate_checkpoint,
+    activate_progress,
+)
+from openff.bespokefit.executor.services.qcgenerator.resources import (
+    ResourceBudget,
+    publish_utilisation,
+)
+from openff.bespokefit.executor.services.qcgenerator.routing import estimate_task_cost
 from openff.bespokefit.executor.utilities.celery import configure_celery_app
 from openff.bespokefit.executor.utilities.redis import connect_to_default_redis
-from openff.bespokefit.schema.tasks import OptimizationTask, Torsion1DTask
+from openff.bespokefit.schema.tasks import HessianTask, OptimizationTask, Torsion1DTask
 
 celery_app = configure_celery_app(
     "qcgenerator", connect_to_default_redis(validate=False)
@@ -32,8 +50,14 @@ celery_app = configure_celery_app(
 _task_logger: logging.Logger = get_task_logger(__name__)
 
 
-def _task_config() -> Dict[str, Any]:
-    worker_settings = current_settings().qc_compute_settings
+_resource_budget: Optional[ResourceBudget] = None
+
+
+def _task_config(
+    task: Optional[Union[HessianTask, OptimizationTask, Torsion1DTask]] = None,
+) -> Dict[str, Any]:
+    settings = current_settings()
+    worker_settings = settings.qc_compute_settings
 
     n_cores = (
         get_global("ncores") if not worker_settings.n_cores else worker_settings.n_cores
@@ -48,9 +72,64 @@ def _task_config() -> Dict[str, Any]:
         )
     )
 
+    if task is not None and settings.BEFLOW_QC_COMPUTE_WORKER_PACK_TASKS:
+        # give the task a share of the workers resources proportional to its cost,
+        # with any task at least as expensive as a 'large' task using all of them.
+        cost_fraction = min(
+            estimate_task_cost(task) / settings.BEFLOW_QC_COMPUTE_QUEUE_LARGE_COST, 1.0
+        )
+        task_n_cores = max(1, round(n_cores * cost_fraction))
+
+        max_memory *= task_n_cores / n_cores
+        n_cores = task_n_cores
+
     return dict(ncores=n_cores, nnodes=1, memory=round(max_memory, 3), retries=3)
 
 
+def _get_resource_budget() -> ResourceBudget:
+    global _resource_budget
+
+    if _resource_budget is None:
+        worker_config = _task_config()
+        _resource_budget = ResourceBudget(
+            n_cores=worker_config["ncores"], memory=worker_config["memory"]
+        )
+
+    return _resource_budget
+
+
+def _publish_utilisation():
+    try:
+        publish_utilisation(_get_resource_budget(), connect_to_default_redis())
+    except Exception as e:  # pragma: no cover
+        _task_logger.warning(f"failed to publish the worker utilisation: {e}")
+
+
+@contextmanager
+def _reserve_resources(task_config: Dict[str, Any]):
+    """Reserve the cores and memory required by a task if the worker is running
+    several tasks at once."""
+
+    if not current_settings().BEFLOW_QC_COMPUTE_WORKER_PACK_TASKS:
+        yield
+        return
+
+    budget = _get_resource_budget()
+
+    try:
+        with budget.acquire(task_config["ncores"], task_config["memory"]):
+            _publish_utilisation()
+            yield
+    finally:
+        _publish_utilisation()
+
+
+@heartbeat_sent.connect
+def _on_heartbeat_sent(**_):
+    if current_settings().BEFLOW_QC_COMPUTE_WORKER_PACK_TASKS:
+        _publish_utilisation()
+
+
 def _select_atom(atoms: List[Atom]) -> int:
     """
     For a list of atoms chose the heaviest atom.
@@ -80,13 +159,9 @@ def _get_program_keywords(program: str) -> Dict[str, str]:
     return keywords
 
 
-@celery_app.task(acks_late=True)
-def compute_torsion_drive(task_json: str) -> TorsionDriveResult:
-    """Runs a torsion drive using QCEngine."""
-
-    task = Torsion1DTask.parse_raw(task_json)
-
-    _task_logger.info(f"running 1D scan with {_task_config()}")
+def _torsion_drive_input(task: Torsion1DTask) -> TorsionDriveInput:
+    """Build the QCEngine input for a 1D torsion drive task, generating the initial
+    conformers to seed the drive with."""
 
     molecule: Molecule = Molecule.from_smiles(task.smiles)
     molecule.generate_conformers(n_conformers=task.n_conformers)
@@ -112,7 +187,7 @@ def compute_torsion_drive(task_json: str) -> TorsionDriveResult:
 
     del molecule.properties["atom_map"]
 
-    input_schema = TorsionDriveInput(
+    return TorsionDriveInput(
         keywords=TDKeywords(
             dihedrals=[
                 (
@@ -147,14 +222,57 @@ def compute_torsion_drive(task_json: str) -> TorsionDriveResult:
         ),
     )
 
-    # run all torsiondrives through our custom procedure which handles parallel optimisations
-    return_value = qcengine.compute_procedure(
-        input_schema,
-        "TorsionDriveParallel",
-        raise_error=True,
-        task_config=_task_config(),
+
+@celery_app.task(acks_late=True)
+def compute_torsion_drive(task_json: str) -> TorsionDriveResult:
+    """Runs a torsion drive using QCEngine.
+
+    The drive is checkpointed after every wavefront iteration so that, if the worker
+    running it is lost, the re-delivered task resumes from the last completed iteration.
+    The progress of the drive is also published after each iteration so that it can be
+    monitored while the drive is running.
+    """
+
+    task = Torsion1DTask.parse_raw(task_json)
+    task_config = _task_config(task)
+
+    _task_logger.info(f"running 1D scan with {task_config}")
+
+    redis_connection = connect_to_default_redis()
+
+    checkpoint = TorsionDriveCheckpoint(
+        redis_connection, hashlib.sha512(task_json.encode()).hexdigest()
+    )
+    # the task will not have an id if it is being run directly rather than by a worker
+    task_id = compute_torsion_drive.request.id
+    progress = (
+        None if task_id is None else TorsionDriveProgress(redis_connection, task_id)
     )
 
+    input_schema = checkpoint.load_input()
+
+    if input_schema is None:
+        input_schema = _torsion_drive_input(task)
+        # store the input so that a resumed drive uses the same initial conformers
+        checkpoint.save_input(input_schema)
+    else:
+        _task_logger.info("resuming 1D scan from checkpoint")
+
+    # run all torsiondrives through our custom procedure which handles parallel optimisations
+    with _reserve_resources(task_config), activate_checkpoint(checkpoint):
+        with nullcontext() if progress is None else activate_progress(progress):
+            return_value = qcengine.compute_procedure(
+                input_schema,
+                "TorsionDriveParallel",
+                raise_error=True,
+                task_config=task_config,
+            )
+
+    checkpoint.clear()
+
+    if progress is not None:
+        progress.clear()
+
     if isinstance(return_value, TorsionDriveResult):
         _task_logger.info(
             f"1D TorsionDrive successfully completed in {return_value.provenance.wall_time}"
@@ -168,17 +286,10 @@ def compute_torsion_drive(task_json: str) -> TorsionDriveResult:
     return return_value.json()
 
 
-@celery_app.task
-def compute_optimization(
-    task_json: str,
+def _compute_optimizations(
+    task: Union[HessianTask, OptimizationTask], task_config: Dict[str, Any]
 ) -> List[OptimizationResult]:
-    """Runs a set of geometry optimizations using QCEngine."""
-    # TODO: should we only return the lowest energy optimization?
-    # or the first optimisation to work?
-
-    task = OptimizationTask.parse_raw(task_json)
-
-    _task_logger.info(f"running opt with {_task_config()}")
+    """Minimize each of the conformers generated for a task."""
 
     molecule: Molecule = Molecule.from_smiles(task.smiles)
     molecule.generate_conformers(n_conformers=task.n_conformers)
@@ -207,12 +318,13 @@ def compute_optimization(
     return_values = []
 
     for input_schema in input_schemas:
-        return_value = qcengine.compute_procedure(
-            input_schema,
-            task.optimization_spec.program,
-            raise_error=True,
-            task_config=_task_config(),
-        )
+        with _reserve_resources(task_config):
+            return_value = qcengine.compute_procedure(
+                input_schema,
+                task.optimization_spec.program,
+                raise_error=True,
+                task_config=task_config,
+            )
 
         if isinstance(return_value, OptimizationResult):
             # Strip the extra **heavy** data
@@ -223,11 +335,83 @@ def compute_optimization(
 
         return_values.append(return_value)
 
+    return return_values
+
+
+@celery_app.task
+def compute_optimization(
+    task_json: str,
+) -> List[OptimizationResult]:
+    """Runs a set of geometry optimizations using QCEngine."""
+    # TODO: should we only return the lowest energy optimization?
+    # or the first optimisation to work?
+
+    task = OptimizationTask.parse_raw(task_json)
+    task_config = _task_config(task)
+
+    _task_logger.info(f"running opt with {task_config}")
+
+    return_values = _compute_optimizations(task, task_config)
+
     # noinspection PyTypeChecker
     return serialize(return_values, "json")
 
 
 @celery_app.task
 def compute_hessian(task_json: str) -> AtomicResult:
-    """Runs a set of hessian evaluations using QCEngine."""
-    raise NotImplementedError()
+    """Runs a hessian calculation using QCEngine.
+
+    Each conformer of the molecule is first minimized, and the hessian of the lowest
+    energy conformer then computed either by the program itself or, for programs which
+    cannot, by the finite difference of gradients evaluated in parallel.
+    """
+
+    task = HessianTask.parse_raw(task_json)
+    task_config = _task_config(task)
+
+    _task_logger.info(f"running hessian with {task_config}")
+
+    optimization_results = [
+        result
+        for result in _compute_optimizations(task, task_config)
+        if isinstance(result, OptimizationResult) and result.success
+    ]
+
+    if len(optimization_results) == 0:
+        raise RuntimeError("None of the conformers could be minimized.")
+
+    minimum_result = min(optimization_results, key=lambda result: result.energies[-1])
+
+    with _reserve_resources(task_config):
+        if task.program.lower() in ANALYTIC_HESSIAN_PROGRAMS:
+            return_value = qcengine.compute(
+                AtomicInput(
+                    molecule=minimum_result.final_molecule,
+                    driver=DriverEnum.hessian,
+                    model=task.model,
+                    keywords=_get_program_keywords(task.program),
+                ),
+                task.program,
+                raise_error=True,
+                task_config=task_config,
+            )
+        else:
+            _task_logger.info("computing the hessian by finite differences")
+
+            return_value = compute_finite_difference_hessian(
+                minimum_result.final_molecule,
+                model=task.model,
+                program=task.program,
+                config=TaskConfig(**task_config),
+                keywords=_get_program_keywords(task.program),
+            )
+
+    if isinstance(return_value, AtomicResult):
+        _task_logger.info("hessian successfully completed")
+        # Strip the extra **heavy** data
+        return_value = AtomicResult(
+            **return_value.dict(exclude={"stdout", "stderr", "native_files"})
+        )
+
+    # noinspection PyTypeChecker
+    return return_value.json()
@@ -21,14 +21,17 @@ class TaskInformation(TypedDict):
     error: Optional[Dict[str, Any]]
 
 
+_TASK_STATUSES: Dict[str, Status] = {
+    "PENDING": "waiting",
+    "STARTED": "running",
+    "RETRY": "running",
+    "FAILURE": "errored",
+    "SUCCESS": "success",
+}
+
+
 def get_status(task_result: AsyncResult) -> Status:
-    return {
-        "PENDING": "waiting",
-        "STARTED": "running",
-        "RETRY": "running",
-        "FAILURE": "errored",
-        "SUCCESS": "success",
-    }[task_result.status]
+    return _TASK_STATUSES[task_result.status]
 
 
 def configure_celery_app(
@@ -69,14 +72,21 @@ def _spawn_worker(celery_app, concurrency: int = 1, **kwargs):
 
 
 def spawn_worker(
-    celery_app, concurrency: int = 1, asynchronous: bool = True, **kwargs
+    celery_app,
+    concurrency: int = 1,
+    asynchronous: bool = True,
+    daemon: bool = True,
+    **kwargs,
 ) -> Optional[multiprocessing.Process]:
     if concurrency < 1:
         return
 
     if asynchronous:  # pragma: no cover
         worker_process = multiprocessing.Process(
-            target=_spawn_worker, args=(celery_app, concurrency), daemon=True
+            target=_spawn_worker,
+            args=(celery_app, concurrency),
+            kwargs=kwargs,
+            daemon=daemon,
         )
         worker_process.start()
 
@@ -86,35 +96,77 @@ def spawn_worker(
         _spawn_worker(celery_app, concurrency, **kwargs)
 
 
-def get_task_information(app: Celery, task_id: str) -> TaskInformation:
-    task_result = AsyncResult(task_id, app=app)
-
-    task_output = (
-        None
-        if not isinstance(task_result.result, str)
-        else json.loads(task_result.result)
-    )
+def _task_information(
+    task_id: str, task_status: Status, task_result: Any, task_traceback: Optional[str]
+) -> TaskInformation:
+    task_output = None if not isinstance(task_result, str) else json.loads(task_result)
 
-    task_raw_error = (
-        None
-        if not isinstance(task_result.result, BaseException)
-        else task_result.result
-    )
+    task_raw_error = None if not isinstance(task_result, BaseException) else task_result
     task_error = (
         None
         if task_raw_error is None
         else Error(
             type=task_raw_error.__class__.__name__,
             message=str(task_raw_error),
-            traceback=task_result.traceback,
+            traceback=task_traceback,
         )
     )
 
-    task_status = get_status(task_result)
-
     return TaskInformation(
         id=task_id,
         status=task_status,
         result=task_output if task_status != "errored" else None,
         error=None if not task_error else task_error.dict(),
     )
+
+
+def get_task_information(app: Celery, task_id: str) -> TaskInformation:
+    task_result = AsyncResult(task_id, app=app)
+
+    return _task_information(
+        task_id, get_status(task_result), task_result.result, task_result.traceback
+    )
+
+
+def get_task_information_batch(
+    app: Celery, task_ids: List[str]
+) -> List[TaskInformation]:
+    """Retrieves the information about a set of tasks from the result backend using a
+    single ``MGET`` rather than one round trip per task.
+
+    Args:
+        app: The celery app that the tasks were submitted to.
+        task_ids: The ids of the tasks.
+
+    Returns:
+        The information about each task in the same order as ``task_ids``.
+    """
+
+    if len(task_ids) == 0:
+        return []
+
+    backend = app.backend
+
+    task_metas = backend.mget(
+        [backend.get_key_for_task(task_id) for task_id in task_ids]
+    )
+
+    task_information = []
+
+    for task_id, task_meta in zip(task_ids, task_metas):
+        task_meta = (
+            {"status": "PENDING", "result": None}
+            if task_meta is None
+            else backend.decode_result(task_meta)
+        )
+
+        task_information.append(
+            _task_information(
+                task_id,
+                _TASK_STATUSES[task_meta["status"]],
+                task_meta["result"],
+                task_meta.get("traceback"),
+            )
+        )
+
+    return task_information
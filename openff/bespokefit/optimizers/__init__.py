@@ -8,6 +8,7 @@ from openff.bespokefit.optimizers.base import (
     register_optimizer,
 )
 from openff.bespokefit.optimizers.forcebalance import ForceBalanceOptimizer
+from openff.bespokefit.optimizers.linear_torsion import LinearTorsionOptimizer
 
 __all__ = [
     "BaseOptimizer",
@@ -16,4 +17,5 @@ __all__ = [
     "list_optimizers",
     "register_optimizer",
     "ForceBalanceOptimizer",
+    "LinearTorsionOptimizer",
 ]
@@ -6,6 +6,7 @@ from typing import Dict, List, Type, Union
 
 from openff.bespokefit.exceptions import OptimizerError
 from openff.bespokefit.optimizers.forcebalance import ForceBalanceOptimizer
+from openff.bespokefit.optimizers.linear_torsion import LinearTorsionOptimizer
 from openff.bespokefit.optimizers.model import BaseOptimizer
 
 _optimizers: Dict[str, Type[BaseOptimizer]] = {}
@@ -107,3 +108,4 @@ def list_optimizers() -> List[str]:
 
 # register the built in optimizers
 register_optimizer(ForceBalanceOptimizer)
+register_optimizer(LinearTorsionOptimizer)
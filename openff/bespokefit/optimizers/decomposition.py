@@ -0,0 +1,224 @@
+"""
+Split an optimization stage into independent sub-fits, e.g. one per group of torsion
+parameters constrained by the same fragments, and merge their results back together.
+"""
+
+import copy
+from typing import Dict, List, Set, Tuple
+
+from openff.qcsubmit.results import (
+    BasicResultCollection,
+    OptimizationResultCollection,
+    TorsionDriveResultCollection,
+)
+from openff.toolkit.topology import Molecule
+from openff.toolkit.typing.engines.smirnoff import ForceField
+
+from openff.bespokefit.optimizers.forcebalance.factories import (
+    TorsionProfileTargetFactory,
+)
+from openff.bespokefit.schema.data import BespokeQCData, LocalQCData
+from openff.bespokefit.schema.fitting import OptimizationStageSchema
+from openff.bespokefit.schema.optimizers import ForceBalanceSchema
+from openff.bespokefit.schema.results import OptimizationStageResults
+from openff.bespokefit.schema.targets import TargetSchema
+
+_ParameterKey = Tuple[str, str]
+
+
+def _target_molecules(target: TargetSchema) -> List[Molecule]:
+    """Returns the unique molecules referenced by the reference data of a target."""
+
+    if isinstance(
+        target.reference_data,
+        (
+            BasicResultCollection,
+            OptimizationResultCollection,
+            TorsionDriveResultCollection,
+        ),
+    ):
+        qc_records = target.reference_data.to_records()
+
+    elif isinstance(target.reference_data, BespokeQCData):
+        raise RuntimeError(
+            "`BespokeQCData` must be converted into `LocalQCData` before splitting a "
+            "stage."
+        )
+
+    elif isinstance(target.reference_data, LocalQCData):
+        # the conversion is the same for every type of target
+        qc_records = TorsionProfileTargetFactory._local_to_qc_records(
+            target.reference_data
+        )
+
+    else:
+        raise NotImplementedError()
+
+    molecules = {
+        molecule.to_smiles(mapped=True): molecule for _, molecule in qc_records
+    }
+
+    return [*molecules.values()]
+
+
+def _target_parameters(
+    force_field: ForceField, target: TargetSchema, parameter_keys: Set[_ParameterKey]
+) -> Set[_ParameterKey]:
+    """Returns the keys of the parameters being optimized that are applied to any of
+    the molecules referenced by a target."""
+
+    applied_keys = set()
+
+    for molecule in _target_molecules(target):
+        labels = force_field.label_molecules(molecule.to_topology())[0]
+
+        applied_keys.update(
+            (handler_name, parameter.smirks)
+            for handler_name, handler_labels in labels.items()
+            for parameter in handler_labels.values()
+        )
+
+    return applied_keys & parameter_keys
+
+
+def split_optimization_stage(
+    stage: OptimizationStageSchema, initial_force_field: ForceField
+) -> List[OptimizationStageSchema]:
+    """Splits an optimization stage into independent sub-stages.
+
+    Parameters are connected if any target references a molecule that both are
+    applied to, and each connected group of parameters is fit in its own sub-stage
+    against only the targets that touch it. Parameters that are not applied to any
+    target are not included in any sub-stage and so retain their initial values.
+
+    For ForceBalance optimizations, whose objective normalizes the weight of each
+    target by the total weight of all targets, the prior penalty of each sub-stage is
+    scaled so that its objective is proportional to the corresponding block of the
+    original objective and so shares the same minimum.
+
+    Args:
+        stage: The stage to split.
+        initial_force_field: The force field the stage will be applied to.
+
+    Returns:
+        The independent sub-stages, or a list containing only the original stage if
+        it cannot be split.
+    """
+
+    parameter_keys = [
+        (parameter.type, parameter.smirks) for parameter in stage.parameters
+    ]
+
+    # a disjoint-set forest over the parameter keys
+    parents: Dict[_ParameterKey, _ParameterKey] = {key: key for key in parameter_keys}
+
+    def _find(key: _ParameterKey) -> _ParameterKey:
+        while parents[key] != key:
+            parents[key] = parents[parents[key]]
+            key = parents[key]
+
+        return key
+
+    target_keys = [
+        _target_parameters(initial_force_field, target, {*parameter_keys})
+        for target in stage.targets
+    ]
+
+    for keys in target_keys:
+        keys = sorted(keys, key=parameter_keys.index)
+
+        for key in keys[1:]:
+            parents[_find(key)] = _find(keys[0])
+
+    components: Dict[_ParameterKey, List[int]] = {}
+
+    for target_index, keys in enumerate(target_keys):
+        if len(keys) == 0:
+            continue
+
+        components.setdefault(_find(next(iter(keys))), []).append(target_index)
+
+    if len(components) < 2:
+        return [stage]
+
+    total_weight = sum(target.weight for target in stage.targets)
+
+    sub_stages = []
+
+    for root, target_indices in sorted(
+        components.items(), key=lambda item: parameter_keys.index(item[0])
+    ):
+        targets = [stage.targets[index] for index in target_indices]
+        optimizer = stage.optimizer.copy(deep=True)
+
+        if isinstance(optimizer, ForceBalanceSchema):
+            optimizer.penalty_additive *= total_weight / sum(
+                target.weight for target in targets
+            )
+
+        sub_stages.append(
+            OptimizationStageSchema(
+                optimizer=optimizer,
+                parameters=[
+                    parameter
+                    for parameter, key in zip(stage.parameters, parameter_keys)
+                    if _find(key) == root
+                ],
+                parameter_hyperparameters=stage.parameter_hyperparameters,
+                targets=targets,
+            )
+        )
+
+    return sub_stages
+
+
+def merge_stage_results(
+    initial_force_field: ForceField,
+    sub_stages: List[OptimizationStageSchema],
+    sub_results: List[OptimizationStageResults],
+) -> OptimizationStageResults:
+    """Merges the results of the sub-stages produced by ``split_optimization_stage``
+    into a single result.
+
+    Args:
+        initial_force_field: The force field the original stage was applied to.
+        sub_stages: The sub-stages that were fit.
+        sub_results: The results of fitting each sub-stage.
+
+    Returns:
+        The results of the first sub-stage that failed, or otherwise the results with
+        the optimized parameters of every sub-stage applied to the initial force field.
+    """
+
+    for result in sub_results:
+        if result.status != "success":
+            return result
+
+    merged_force_field = copy.deepcopy(initial_force_field)
+
+    for sub_stage, result in zip(sub_stages, sub_results):
+        refit_force_field = ForceField(
+            result.refit_force_field, allow_cosmetic_attributes=True
+        )
+
+        for parameter in sub_stage.parameters:
+            refit_parameter = refit_force_field[parameter.type].parameters[
+                parameter.smirks
+            ]
+            merged_parameter = merged_force_field[parameter.type].parameters[
+                parameter.smirks
+            ]
+
+            for attribute in parameter.attributes:
+                setattr(
+                    merged_parameter, attribute, getattr(refit_parameter, attribute)
+                )
+
+    return OptimizationStageResults(
+        provenance={**sub_results[0].provenance, "n_sub_fits": str(len(sub_results))},
+        status="success",
+        error=None,
+        refit_force_field=merged_force_field.to_string(
+            discard_cosmetic_attributes=True
+        ),
+    )
@@ -8,6 +8,7 @@ from openff.toolkit.typing.engines.smirnoff import ForceField
 from openff.utilities.provenance import get_ambertools_version
 
 from openff.bespokefit.optimizers.forcebalance import ForceBalanceInputFactory
+from openff.bespokefit.optimizers.forcebalance.runner import get_force_balance_runner
 from openff.bespokefit.optimizers.model import BaseOptimizer
 from openff.bespokefit.schema import Error
 from openff.bespokefit.schema.fitting import OptimizationStageSchema
@@ -19,6 +20,7 @@ from openff.bespokefit.schema.targets import (
     TorsionProfileTargetSchema,
     VibrationTargetSchema,
 )
+from openff.bespokefit.utilities import current_settings
 from openff.bespokefit.utilities.smirnoff import ForceFieldEditor
 
 _logger = logging.getLogger(__name__)
@@ -98,18 +100,30 @@ class ForceBalanceOptimizer(BaseOptimizer):
     def _optimize(
         cls, schema: OptimizationStageSchema, initial_force_field: ForceField
     ) -> OptimizationStageResults:
-        with open("log.txt", "w") as log:
-            _logger.debug("Launching Forcebalance")
+        settings = current_settings()
 
-            subprocess.run(
-                "ForceBalance optimize.in",
-                shell=True,
-                stdout=log,
-                stderr=log,
-            )
+        if settings.BEFLOW_OPTIMIZER_FORCEBALANCE_MODE == "in-process":
+            _logger.debug("Running Forcebalance in the shared runner")
+
+            # the runner writes the same log.txt, optimize.out and optimize.err files
+            # as the ForceBalance executable, including the traceback of any failure.
+            get_force_balance_runner().run(os.getcwd(), "optimize.in")
 
             results = cls._collect_results("")
 
+        else:
+            with open("log.txt", "w") as log:
+                _logger.debug("Launching Forcebalance")
+
+                subprocess.run(
+                    "ForceBalance optimize.in",
+                    shell=True,
+                    stdout=log,
+                    stderr=log,
+                )
+
+                results = cls._collect_results("")
+
         _logger.debug("OPT finished in folder", os.getcwd())
         return results
 
@@ -0,0 +1,300 @@
+"""
+Run ForceBalance optimizations through its python API inside a long-lived, pre-warmed
+python interpreter rather than launching a new ``ForceBalance`` process per fit.
+"""
+
+import atexit
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+import traceback
+from typing import IO, Any, Dict, List, Optional
+
+from openff.bespokefit.exceptions import OptimizerError
+
+_logger = logging.getLogger(__name__)
+
+
+def _prewarm():
+    """Import the (slow to import) modules required to run ForceBalance so that this
+    cost is only paid once per interpreter rather than once per fit."""
+
+    import forcebalance.forcefield  # noqa: F401
+    import forcebalance.objective  # noqa: F401
+    import forcebalance.optimizer  # noqa: F401
+    import forcebalance.parser  # noqa: F401
+    import forcebalance.smirnoff_hack  # noqa: F401
+    import openmm  # noqa: F401
+    from openff.toolkit.typing.engines.smirnoff import ForceField
+
+    # constructing a force field loads and caches the parameter handler plugins
+    ForceField()
+
+
+def _clear_caches():
+    """Clear the ``smirnoff_hack`` caches so that no state leaks between fits."""
+
+    from forcebalance.smirnoff_hack import (
+        AT_TOOLKIT_CACHE_assign_partial_charges,
+        OE_TOOLKIT_CACHE_assign_partial_charges,
+        OE_TOOLKIT_CACHE_find_smarts_matches,
+        OE_TOOLKIT_CACHE_molecule_conformers,
+        RDK_TOOLKIT_CACHE_find_smarts_matches,
+        RDK_TOOLKIT_CACHE_molecule_conformers,
+    )
+
+    OE_TOOLKIT_CACHE_find_smarts_matches.clear()
+    RDK_TOOLKIT_CACHE_find_smarts_matches.clear()
+    OE_TOOLKIT_CACHE_assign_partial_charges.clear()
+    AT_TOOLKIT_CACHE_assign_partial_charges.clear()
+    OE_TOOLKIT_CACHE_molecule_conformers.clear()
+    RDK_TOOLKIT_CACHE_molecule_conformers.clear()
+
+
+def _run_force_balance(input_file: str):
+    """Run a ForceBalance optimization in the current working directory in the same
+    way as the ``ForceBalance`` command line program."""
+
+    from forcebalance.forcefield import FF
+    from forcebalance.objective import Objective
+    from forcebalance.optimizer import Optimizer
+    from forcebalance.parser import parse_inputs
+
+    options, target_options = parse_inputs(input_file)
+
+    force_field = FF(options)
+    objective = Objective(options, target_options, force_field)
+    optimizer = Optimizer(options, objective, force_field)
+
+    optimizer.Run()
+
+
+def _tee(read_fd: int, outputs: List[IO[bytes]], lock: threading.Lock):
+    """Copy everything read from a file descriptor to each of a set of files until the
+    write end of the descriptor is closed."""
+
+    with os.fdopen(read_fd, "rb", buffering=0) as stream:
+        for chunk in iter(lambda: stream.read(65536), b""):
+            with lock:
+                for output in outputs:
+                    output.write(chunk)
+                    output.flush()
+
+
+def _run_job(directory: str, input_file: str) -> Optional[str]:
+    """Run a single ForceBalance optimization in a directory.
+
+    As with the ``ForceBalance`` executable, anything written to stdout during the fit
+    is captured in a ``<input name>.out`` file and anything written to stderr in a
+    ``<input name>.err`` file in that directory. Both are also captured in a
+    ``log.txt`` file, as when the executable is launched by the optimizer.
+
+    Returns:
+        The traceback of any exception raised by ForceBalance.
+    """
+
+    force_balance_logger = logging.getLogger("forcebalance")
+    initial_handlers = [*force_balance_logger.handlers]
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    stdout_fd, stderr_fd = os.dup(1), os.dup(2)
+    error = None
+
+    os.chdir(directory)
+
+    output_name = os.path.splitext(input_file)[0]
+
+    with open(f"{output_name}.out", "wb") as output, open(
+        f"{output_name}.err", "wb"
+    ) as error_output, open("log.txt", "wb") as log:
+        lock = threading.Lock()
+        tee_threads = []
+
+        for fd, outputs in ((1, [output, log]), (2, [error_output, log])):
+            read_fd, write_fd = os.pipe()
+
+            tee_thread = threading.Thread(
+                target=_tee, args=(read_fd, outputs, lock), daemon=True
+            )
+            tee_thread.start()
+            tee_threads.append(tee_thread)
+
+            os.dup2(write_fd, fd)
+            os.close(write_fd)
+
+        try:
+            _clear_caches()
+            _run_force_balance(input_file)
+        except BaseException:  # lgtm [py/catch-base-exception]
+            error = traceback.format_exc()
+            sys.stderr.write(error)
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+
+            # restoring the original descriptors closes the pipes so the tee threads
+            # finish once they have copied any remaining output.
+            os.dup2(stdout_fd, 1)
+            os.dup2(stderr_fd, 2)
+            os.close(stdout_fd)
+            os.close(stderr_fd)
+
+            for tee_thread in tee_threads:
+                tee_thread.join()
+
+            # ForceBalance attaches a file handler per input file which would otherwise
+            # keep writing to the output files of previous fits.
+            for handler in [*force_balance_logger.handlers]:
+                if handler in initial_handlers:
+                    continue
+
+                force_balance_logger.removeHandler(handler)
+                handler.close()
+
+    return error
+
+
+def _serve():
+    """Serve ForceBalance jobs sent as JSON lines over stdin, replying to each over
+    the original stdout once it has completed."""
+
+    # keep the original stdout for replies and send anything else written to it
+    # outside of a job to stderr so it cannot corrupt the replies.
+    replies = os.fdopen(os.dup(1), "w")
+    os.dup2(2, 1)
+
+    def _reply(message: Dict[str, Any]):
+        replies.write(json.dumps(message) + "\n")
+        replies.flush()
+
+    try:
+        _prewarm()
+    except BaseException:  # lgtm [py/catch-base-exception]
+        _reply({"ready": False, "error": traceback.format_exc()})
+        return
+
+    _reply({"ready": True, "error": None})
+
+    for line in sys.stdin:
+        job = json.loads(line)
+        _reply({"error": _run_job(job["directory"], job["input_file"])})
+
+
+class ForceBalanceRunner:
+    """A long-lived python interpreter which runs ForceBalance optimizations through
+    its python API.
+
+    The interpreter is launched as a separate process, so that fits remain isolated
+    from the state of the calling process (e.g. a celery worker), and imports
+    ForceBalance, OpenMM and the OpenFF toolkit once when it starts rather than once
+    per fit. It is restarted automatically if it exits unexpectedly.
+    """
+
+    def __init__(self):
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    def _read_reply(self) -> Dict[str, Any]:
+        reply_stdout: IO[str] = self._process.stdout
+        line = reply_stdout.readline()
+
+        if len(line) == 0:
+            self.stop()
+            raise OptimizerError("The ForceBalance process exited unexpectedly.")
+
+        return json.loads(line)
+
+    def _start(self):
+        self._process = subprocess.Popen(
+            [sys.executable, "-c", f"from {__name__} import _serve; _serve()"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+
+        reply = self._read_reply()
+
+        if not reply["ready"]:
+            self.stop()
+            raise OptimizerError(
+                f"The ForceBalance process failed to start: {reply['error']}"
+            )
+
+    def start(self):
+        """Start the interpreter and pre-import ForceBalance if it is not already
+        running."""
+
+        with self._lock:
+            if not self.is_running:
+                self._start()
+
+    def stop(self):
+        """Stop the interpreter if it is running."""
+
+        if self._process is None:
+            return
+
+        if self._process.poll() is None:
+            self._process.stdin.close()
+
+            try:
+                self._process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+
+        self._process = None
+
+    def run(self, directory: str, input_file: str = "optimize.in") -> Optional[str]:
+        """Run a ForceBalance optimization and wait for it to complete.
+
+        Args:
+            directory: The directory containing the ForceBalance inputs. Anything
+                written to stdout or stderr during the fit is captured in ``.out`` and
+                ``.err`` files named after the input file, and in a ``log.txt`` file,
+                in this directory.
+            input_file: The name of the main ForceBalance input file.
+
+        Returns:
+            The traceback of any exception raised by ForceBalance.
+        """
+
+        with self._lock:
+            if not self.is_running:
+                self._start()
+
+            _logger.debug(f"running ForceBalance in {directory}")
+
+            self._process.stdin.write(
+                json.dumps(
+                    {"directory": os.path.abspath(directory), "input_file": input_file}
+                )
+                + "\n"
+            )
+            self._process.stdin.flush()
+
+            return self._read_reply()["error"]
+
+
+_runner: Optional[ForceBalanceRunner] = None
+
+
+def get_force_balance_runner() -> ForceBalanceRunner:
+    """Returns the ForceBalance runner shared by this process."""
+
+    global _runner
+
+    if _runner is None:
+        _runner = ForceBalanceRunner()
+        atexit.register(_runner.stop)
+
+    return _runner
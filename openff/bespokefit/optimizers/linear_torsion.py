@@ -0,0 +1,610 @@
+"""
+A native optimizer which fits the force constants of proper torsion parameters to
+torsion profiles by regularised linear least squares.
+"""
+
+import copy
+import importlib
+import json
+import logging
+import re
+from typing import Dict, List, Tuple
+
+import numpy as np
+from openff.qcsubmit.results import TorsionDriveResultCollection
+from openff.toolkit.topology import Molecule
+from openff.toolkit.typing.engines.smirnoff import ForceField
+from openff.units import unit
+from qcelemental.models.procedures import TorsionDriveResult
+from qcportal.torsiondrive import TorsiondriveRecord
+
+from openff.bespokefit.exceptions import OptimizerError
+from openff.bespokefit.optimizers.forcebalance.factories import (
+    TorsionProfileTargetFactory,
+    _standardize_grid_id_str,
+)
+from openff.bespokefit.optimizers.model import BaseOptimizer
+from openff.bespokefit.schema.data import BespokeQCData, LocalQCData
+from openff.bespokefit.schema.fitting import OptimizationStageSchema
+from openff.bespokefit.schema.optimizers import LinearTorsionSchema
+from openff.bespokefit.schema.results import OptimizationStageResults
+from openff.bespokefit.schema.smirnoff import ProperTorsionSMIRKS
+from openff.bespokefit.schema.targets import TorsionProfileTargetSchema
+
+_logger = logging.getLogger(__name__)
+
+_HARTREE_TO_KCAL_MOL = 627.509474
+_KJ_TO_KCAL = 1.0 / 4.184
+
+# A fitted term, i.e. the SMIRKS of a proper torsion parameter and the index of the
+# force constant of that parameter being fit.
+_Term = Tuple[str, int]
+
+
+class _TorsionScan:
+    """The data required to fit a set of torsion terms against one torsion drive."""
+
+    def __init__(
+        self,
+        target: TorsionProfileTargetSchema,
+        molecule: Molecule,
+        dihedral: Tuple[int, int, int, int],
+        qm_energies: np.ndarray,
+    ):
+        self.target = target
+        self.molecule = molecule
+        self.dihedral = dihedral
+        # [kcal / mol]
+        self.qm_energies = qm_energies
+
+        # populated by ``_compute_mm_contributions``
+        self.geometries: np.ndarray = np.zeros((0, molecule.n_atoms, 3))
+        self.mm_energies: np.ndarray = np.zeros(0)
+        self.basis: np.ndarray = np.zeros((0, 0))
+
+    @property
+    def weights(self) -> np.ndarray:
+        """The normalized weight of each grid point, which follows the same form as
+        the ForceBalance torsion profile target."""
+
+        relative_energies = self.qm_energies - self.qm_energies.min()
+        denominator = self.target.energy_denominator
+
+        if self.target.attenuate_weights:
+            weights = 1.0 / np.sqrt(
+                1.0
+                + (np.maximum(relative_energies - denominator, 0.0) / denominator) ** 2
+            )
+        else:
+            weights = np.ones_like(relative_energies)
+
+        weights[relative_energies > self.target.energy_cutoff] = 0.0
+
+        return weights / weights.sum()
+
+
+def _dihedral_angles(geometries: np.ndarray, dihedrals: np.ndarray) -> np.ndarray:
+    """Computes the value [rad] of a set of dihedral angles in a set of geometries.
+
+    Args:
+        geometries: The geometries with shape=(n_geometries, n_atoms, 3).
+        dihedrals: The indices of the atoms in each dihedral with
+            shape=(n_dihedrals, 4).
+
+    Returns:
+        The dihedral angles with shape=(n_geometries, n_dihedrals).
+    """
+
+    points = geometries[:, dihedrals]
+
+    b1 = points[:, :, 1] - points[:, :, 0]
+    b2 = points[:, :, 2] - points[:, :, 1]
+    b3 = points[:, :, 3] - points[:, :, 2]
+
+    n1 = np.cross(b1, b2)
+    n2 = np.cross(b2, b3)
+
+    x = np.einsum("gdi,gdi->gd", n1, n2)
+    y = np.linalg.norm(b2, axis=-1) * np.einsum("gdi,gdi->gd", b1, n2)
+
+    return np.arctan2(y, x)
+
+
+def _torsion_scans(target: TorsionProfileTargetSchema) -> List[_TorsionScan]:
+    """Extracts the reference geometries and energies from a torsion profile
+    target."""
+
+    if isinstance(target.reference_data, TorsionDriveResultCollection):
+        qc_records = target.reference_data.to_records()
+
+    elif isinstance(target.reference_data, BespokeQCData):
+        raise RuntimeError(
+            "`BespokeQCData` must be converted into `LocalQCData` before fitting."
+        )
+
+    elif isinstance(target.reference_data, LocalQCData):
+        qc_records = TorsionProfileTargetFactory._local_to_qc_records(
+            target.reference_data
+        )
+
+    else:
+        raise NotImplementedError()
+
+    scans = []
+
+    for qc_record, molecule in qc_records:
+        if isinstance(qc_record, TorsiondriveRecord):
+            grid_energies = qc_record.final_energies
+            dihedrals = qc_record.specification.keywords.dihedrals
+        elif isinstance(qc_record, TorsionDriveResult):
+            grid_energies = {
+                _standardize_grid_id_str(key): value
+                for key, value in qc_record.final_energies.items()
+            }
+            dihedrals = qc_record.keywords.dihedrals
+        else:
+            raise NotImplementedError()
+
+        if len(dihedrals) != 1:
+            raise OptimizerError(
+                "Only one dimensional torsion drives can be fit by the "
+                "``LinearTorsionOptimizer``."
+            )
+
+        qm_energies = np.array(
+            [
+                grid_energies[tuple(grid_id)]
+                for grid_id in molecule.properties["grid_ids"]
+            ]
+        )
+
+        scans.append(
+            _TorsionScan(
+                target=target,
+                molecule=molecule,
+                dihedral=tuple(dihedrals[0]),
+                qm_energies=qm_energies * _HARTREE_TO_KCAL_MOL,
+            )
+        )
+
+    return scans
+
+
+def _fitted_terms(
+    schema: OptimizationStageSchema,
+) -> Tuple[List[_Term], np.ndarray]:
+    """Returns the force constants to fit and the width [kcal / mol] of the prior
+    placed on each."""
+
+    priors = {
+        attribute: prior
+        for hyperparameter in schema.parameter_hyperparameters
+        if hyperparameter.type == "ProperTorsions"
+        for attribute, prior in hyperparameter.priors.items()
+    }
+
+    terms, widths = [], []
+
+    for parameter in schema.parameters:
+        for attribute in sorted(parameter.attributes):
+            match = re.match(r"^k(\d+)$", attribute)
+            # should have already been validated.
+            assert match is not None
+
+            prior = priors.get(attribute, priors.get("k"))
+
+            if prior is None:
+                raise OptimizerError(
+                    f"No prior was provided for the {attribute} attribute of the "
+                    f"{parameter.smirks} parameter."
+                )
+
+            terms.append((parameter.smirks, int(match.group(1)) - 1))
+            widths.append(prior)
+
+    return terms, np.array(widths)
+
+
+def _torsion_terms(
+    force_field: ForceField, molecule: Molecule, terms: List[_Term]
+) -> Dict[_Term, List[Tuple[Tuple[int, int, int, int], int, float, float]]]:
+    """Returns the dihedrals in a molecule that each fitted term is applied to, along
+    with the periodicity, phase [rad] and divisor of the term."""
+
+    labels = force_field.label_molecules(molecule.to_topology())[0]["ProperTorsions"]
+
+    torsion_terms = {term: [] for term in terms}
+
+    for dihedral, parameter in labels.items():
+        for smirks, index in terms:
+            if parameter.smirks != smirks:
+                continue
+
+            idivf = 1.0 if parameter.idivf is None else float(parameter.idivf[index])
+
+            torsion_terms[(smirks, index)].append(
+                (
+                    tuple(dihedral),
+                    int(parameter.periodicity[index]),
+                    parameter.phase[index].m_as(unit.radian),
+                    idivf,
+                )
+            )
+
+    return torsion_terms
+
+
+def _compute_mm_contributions(
+    scan: _TorsionScan,
+    force_field: ForceField,
+    terms: List[_Term],
+    settings: LinearTorsionSchema,
+):
+    """Computes the MM energy of each reference geometry excluding the fitted torsion
+    terms, and the value of the basis function of each fitted term, i.e. its energy
+    per unit force constant.
+
+    These are computed only once per scan so that the objective function becomes a
+    linear function of the force constants being fit.
+    """
+
+    import openmm
+    from openmm import unit as openmm_unit
+
+    torsion_terms = _torsion_terms(force_field, scan.molecule, terms)
+
+    excluded_force_field = copy.deepcopy(force_field)
+    torsion_handler = excluded_force_field.get_parameter_handler("ProperTorsions")
+
+    for smirks, index in terms:
+        parameter = torsion_handler.parameters[smirks]
+
+        k = [*parameter.k]
+        k[index] = 0.0 * unit.kilocalorie_per_mole
+        parameter.k = k
+
+    system = excluded_force_field.create_openmm_system(scan.molecule.to_topology())
+
+    geometries = np.array(
+        [conformer.m_as(unit.nanometer) for conformer in scan.molecule.conformers]
+    )
+
+    if settings.relax_geometries:
+        relax_system = copy.deepcopy(system)
+
+        # restore the excluded torsion terms with their initial force constants
+        initial_handler = force_field.get_parameter_handler("ProperTorsions")
+        torsion_force = openmm.PeriodicTorsionForce()
+
+        for smirks, index in terms:
+            k = (
+                initial_handler.parameters[smirks]
+                .k[index]
+                .m_as(unit.kilojoule_per_mole)
+            )
+
+            for dihedral, periodicity, phase, idivf in torsion_terms[(smirks, index)]:
+                torsion_force.addTorsion(*dihedral, periodicity, phase, k / idivf)
+
+        relax_system.addForce(torsion_force)
+
+        restraint_force = openmm.CustomTorsionForce(
+            "0.5 * k_restraint * d_theta^2;"
+            "d_theta = min(d_abs, 2 * pi - d_abs);"
+            "d_abs = abs(theta - theta_0);"
+            f"pi = {np.pi}"
+        )
+        restraint_force.addGlobalParameter("k_restraint", settings.restraint_k)
+        restraint_force.addPerTorsionParameter("theta_0")
+        restraint_force.addTorsion(*scan.dihedral, [0.0])
+        relax_system.addForce(restraint_force)
+
+        relax_context = openmm.Context(
+            relax_system,
+            openmm.VerletIntegrator(0.001),
+            openmm.Platform.getPlatformByName("Reference"),
+        )
+
+        target_angles = _dihedral_angles(geometries, np.array([scan.dihedral]))[:, 0]
+
+        for i, target_angle in enumerate(target_angles):
+            restraint_force.setTorsionParameters(0, *scan.dihedral, [target_angle])
+            restraint_force.updateParametersInContext(relax_context)
+
+            relax_context.setPositions(geometries[i] * openmm_unit.nanometer)
+            openmm.LocalEnergyMinimizer.minimize(relax_context)
+
+            geometries[i] = (
+                relax_context.getState(getPositions=True)
+                .getPositions(asNumpy=True)
+                .value_in_unit(openmm_unit.nanometer)
+            )
+
+    context = openmm.Context(
+        system,
+        openmm.VerletIntegrator(0.001),
+        openmm.Platform.getPlatformByName("Reference"),
+    )
+
+    mm_energies = []
+
+    for geometry in geometries:
+        context.setPositions(geometry * openmm_unit.nanometer)
+
+        mm_energies.append(
+            context.getState(getEnergy=True)
+            .getPotentialEnergy()
+            .value_in_unit(openmm_unit.kilojoule_per_mole)
+            * _KJ_TO_KCAL
+        )
+
+    basis = np.zeros((len(geometries), len(terms)))
+
+    for j, term in enumerate(terms):
+        if len(torsion_terms[term]) == 0:
+            continue
+
+        dihedrals, periodicities, phases, idivfs = (
+            np.array(values) for values in zip(*torsion_terms[term])
+        )
+
+        angles = _dihedral_angles(geometries, dihedrals)
+
+        basis[:, j] = (
+            (1.0 + np.cos(periodicities[None, :] * angles - phases[None, :]))
+            / idivfs[None, :]
+        ).sum(axis=1)
+
+    scan.geometries = geometries
+    scan.mm_energies = np.array(mm_energies)
+    scan.basis = basis
+
+
+def _design_matrix(scans: List[_TorsionScan]) -> Tuple[np.ndarray, np.ndarray]:
+    """Builds the weighted linear least squares problem ``A k ~ y`` whose residuals
+    are the differences between the relative MM and QM energies of every scan.
+
+    The MM and QM energies of each scan are aligned by their weighted mean, and each
+    row is scaled so that the sum of the squared residuals equals the objective
+    function of the torsion profile targets.
+    """
+
+    design_blocks, target_blocks = [], []
+
+    for scan in scans:
+        weights = scan.weights
+
+        basis = scan.basis - weights @ scan.basis
+        reference = scan.qm_energies - scan.mm_energies
+        reference = reference - weights @ reference
+
+        scale = np.sqrt(scan.target.weight * weights) / scan.target.energy_denominator
+
+        design_blocks.append(scale[:, None] * basis)
+        target_blocks.append(scale * reference)
+
+    return np.vstack(design_blocks), np.concatenate(target_blocks)
+
+
+def _solve(
+    design_matrix: np.ndarray,
+    reference: np.ndarray,
+    initial_k: np.ndarray,
+    prior_widths: np.ndarray,
+    settings: LinearTorsionSchema,
+) -> np.ndarray:
+    """Minimizes ``|A k - y|^2 + penalty`` where the penalty is either the L1 or L2
+    norm of ``(k - k_0) / prior``, scaled by the penalty additive factor.
+
+    L2 regularised problems are solved exactly, while L1 regularised problems are
+    solved by iteratively re-weighted least squares.
+    """
+
+    # work in terms of the scaled parameters p = (k - k_0) / prior
+    scaled_matrix = design_matrix * prior_widths[None, :]
+    scaled_reference = reference - design_matrix @ initial_k
+
+    n_parameters = len(initial_k)
+
+    def _solve_weighted(penalty_weights: np.ndarray) -> np.ndarray:
+        stacked_matrix = np.vstack([scaled_matrix, np.diag(np.sqrt(penalty_weights))])
+        stacked_reference = np.concatenate([scaled_reference, np.zeros(n_parameters)])
+
+        return np.linalg.lstsq(stacked_matrix, stacked_reference, rcond=None)[0]
+
+    scaled_k = _solve_weighted(np.full(n_parameters, settings.penalty_additive))
+
+    if settings.penalty_type == "L1":
+        for _ in range(settings.max_iterations):
+            # |p| ~ p^2 / (2 |p_old|) + |p_old| / 2 close to p_old
+            penalty_weights = settings.penalty_additive / (
+                2.0 * np.maximum(np.abs(scaled_k), 1.0e-8)
+            )
+            new_scaled_k = _solve_weighted(penalty_weights)
+
+            converged = (
+                np.max(np.abs(new_scaled_k - scaled_k) * prior_widths)
+                < settings.convergence_threshold
+            )
+            scaled_k = new_scaled_k
+
+            if converged:
+                break
+
+    return initial_k + scaled_k * prior_widths
+
+
+def _objective(
+    design_matrix: np.ndarray,
+    reference: np.ndarray,
+    k: np.ndarray,
+    initial_k: np.ndarray,
+    prior_widths: np.ndarray,
+    settings: LinearTorsionSchema,
+) -> float:
+    scaled_k = (k - initial_k) / prior_widths
+
+    penalty = (
+        np.sum(np.abs(scaled_k))
+        if settings.penalty_type == "L1"
+        else np.sum(scaled_k**2)
+    )
+
+    return float(
+        np.sum((design_matrix @ k - reference) ** 2)
+        + settings.penalty_additive * penalty
+    )
+
+
+class LinearTorsionOptimizer(BaseOptimizer):
+    """
+    An optimizer which fits the force constants of proper torsion parameters to
+    torsion profiles without running an external optimizer.
+
+    Torsion energies are linear in their force constants and so, once the MM energy
+    of each reference geometry excluding the fitted terms has been computed, the
+    regularised objective function is a quadratic (L2 prior) or piecewise quadratic
+    (L1 prior) function of the force constants which can be minimized directly.
+    """
+
+    @classmethod
+    def name(cls) -> str:
+        return "LinearTorsion"
+
+    @classmethod
+    def description(cls) -> str:
+        return (
+            "A native optimizer which fits proper torsion force constants to torsion "
+            "profiles by regularised linear least squares."
+        )
+
+    @classmethod
+    def provenance(cls) -> Dict:
+        import openff.toolkit
+        import openmm
+
+        import openff.bespokefit
+
+        return {
+            "openff.bespokefit": openff.bespokefit.__version__,
+            "openff.toolkit": openff.toolkit.__version__,
+            "openmm": openmm.__version__,
+        }
+
+    @classmethod
+    def is_available(cls) -> bool:
+        try:
+            importlib.import_module("openmm")
+            return True
+        except ImportError:
+            return False
+
+    @classmethod
+    def _schema_class(cls):
+        return LinearTorsionSchema
+
+    @classmethod
+    def _prepare(
+        cls,
+        schema: OptimizationStageSchema,
+        initial_force_field: ForceField,
+        root_directory: str,
+    ):
+        """The internal implementation of the main ``prepare`` method. The input
+        ``schema`` is assumed to have been validated before being passed to this
+        method.
+        """
+
+        for parameter in schema.parameters:
+            if not isinstance(parameter, ProperTorsionSMIRKS):
+                raise OptimizerError(
+                    f"The ``{cls.__name__}`` can only fit proper torsion parameters, "
+                    f"not {parameter.type} parameters."
+                )
+
+            invalid_attributes = {
+                attribute
+                for attribute in parameter.attributes
+                if re.match(r"^k\d+$", attribute) is None
+            }
+
+            if len(invalid_attributes) > 0:
+                raise OptimizerError(
+                    f"The ``{cls.__name__}`` can only fit the force constants of "
+                    f"proper torsion parameters, not the "
+                    f"{', '.join(sorted(invalid_attributes))} attributes of "
+                    f"{parameter.smirks}."
+                )
+
+    @classmethod
+    def _optimize(
+        cls, schema: OptimizationStageSchema, initial_force_field: ForceField
+    ) -> OptimizationStageResults:
+        settings: LinearTorsionSchema = schema.optimizer
+
+        terms, prior_widths = _fitted_terms(schema)
+
+        torsion_handler = initial_force_field.get_parameter_handler("ProperTorsions")
+
+        initial_k = np.array(
+            [
+                torsion_handler.parameters[smirks]
+                .k[index]
+                .m_as(unit.kilocalorie_per_mole)
+                for smirks, index in terms
+            ]
+        )
+
+        scans = [scan for target in schema.targets for scan in _torsion_scans(target)]
+
+        for scan in scans:
+            _compute_mm_contributions(scan, initial_force_field, terms, settings)
+
+        design_matrix, reference = _design_matrix(scans)
+
+        k = _solve(design_matrix, reference, initial_k, prior_widths, settings)
+
+        objective_args = (design_matrix, reference)
+        prior_args = (initial_k, prior_widths, settings)
+
+        log = {
+            "n_scans": len(scans),
+            "n_terms": len(terms),
+            "initial_objective": _objective(*objective_args, initial_k, *prior_args),
+            "final_objective": _objective(*objective_args, k, *prior_args),
+            "parameters": [
+                {"smirks": smirks, "index": index, "initial_k": k_0, "final_k": k_1}
+                for (smirks, index), k_0, k_1 in zip(terms, initial_k, k)
+            ],
+        }
+
+        with open("log.txt", "w") as file:
+            file.write(json.dumps(log, indent=2))
+
+        _logger.debug(
+            f"objective reduced from {log['initial_objective']:.6f} to "
+            f"{log['final_objective']:.6f}"
+        )
+
+        refit_force_field = copy.deepcopy(initial_force_field)
+        refit_handler = refit_force_field.get_parameter_handler("ProperTorsions")
+
+        for (smirks, index), value in zip(terms, k):
+            parameter = refit_handler.parameters[smirks]
+
+            parameter_k = [*parameter.k]
+            parameter_k[index] = float(value) * unit.kilocalorie_per_mole
+            parameter.k = parameter_k
+
+        return OptimizationStageResults(
+            provenance=cls.provenance(),
+            status="success",
+            error=None,
+            refit_force_field=refit_force_field.to_string(
+                discard_cosmetic_attributes=True
+            ),
+        )
+
+
+# register all of the available targets.
+LinearTorsionOptimizer.register_target(TorsionProfileTargetSchema)
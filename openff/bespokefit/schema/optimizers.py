@@ -100,4 +100,48 @@ class ForceBalanceSchema(BaseOptimizerSchema, abc.ABC):
     )
 
 
-OptimizerSchema = Union[ForceBalanceSchema]
+class LinearTorsionSchema(BaseOptimizerSchema):
+    """A class containing the settings of the native torsion optimizer, which fits the
+    force constants of proper torsion parameters to torsion profiles directly by
+    exploiting the fact that torsion energies are linear in their force constants.
+
+    Priors are stored separately as part of an ``OptimizationSchema``.
+    """
+
+    type: Literal["LinearTorsion"] = "LinearTorsion"
+
+    max_iterations: PositiveInt = Field(
+        50,
+        description="The maximum number of re-weighting iterations to perform when "
+        "an L1 penalty is used. A fit with an L2 penalty is solved exactly.",
+    )
+
+    penalty_type: Literal["L1", "L2"] = Field("L2", description="The penalty type.")
+
+    penalty_additive: PositiveFloat = Field(
+        1.0,
+        description="The factor to scale the contribution of the priors to the "
+        "objective function by.",
+    )
+
+    relax_geometries: bool = Field(
+        True,
+        description="Whether to minimize each reference geometry with the initial "
+        "force field, while restraining the driven dihedral, before computing its MM "
+        "energy. The geometries are only relaxed once, rather than every time the "
+        "parameters change.",
+    )
+    restraint_k: PositiveFloat = Field(
+        1.0e4,
+        description="The force constant [kJ / mol / rad^2] of the restraint applied "
+        "to the driven dihedral when relaxing the reference geometries.",
+    )
+
+    convergence_threshold: PositiveFloat = Field(
+        1.0e-6,
+        description="The largest change in any force constant [kcal / mol] between "
+        "re-weighting iterations for an L1 fit to be considered converged.",
+    )
+
+
+OptimizerSchema = Union[ForceBalanceSchema, LinearTorsionSchema]
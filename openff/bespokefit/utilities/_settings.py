@@ -40,6 +40,12 @@ class Settings(BaseSettings):
     )
     BEFLOW_COORDINATOR_MAX_UPDATE_INTERVAL: float = 5.0
     BEFLOW_COORDINATOR_MAX_RUNNING_TASKS: int = 1000
+    BEFLOW_COORDINATOR_SMIRKS_N_PROCESSES: int = 1
+    """
+    The number of processes the coordinator should use to generate the bespoke torsion
+    SMIRKS of the fragments of a molecule. The SMIRKS of each fragment are generated in
+    parallel when this is greater than one.
+    """
 
     BEFLOW_FRAGMENTER_PREFIX = "fragmentations"
     BEFLOW_FRAGMENTER_ROUTER = (
@@ -57,12 +63,43 @@ class Settings(BaseSettings):
     BEFLOW_QC_COMPUTE_WORKER_N_CORES: Union[int, Literal["auto"]] = "auto"
     BEFLOW_QC_COMPUTE_WORKER_MAX_MEM: Union[float, Literal["auto"]] = "auto"
     BEFLOW_QC_COMPUTE_WORKER_N_TASKS: Union[int, Literal["auto"]] = "auto"
+    BEFLOW_QC_COMPUTE_WORKER_PACK_TASKS: bool = False
+    """
+    Whether a QC compute worker launched using ``launch-worker`` should run several QC
+    tasks at once, assigning each task a share of the worker's cores and memory based
+    on its estimated cost, rather than running a single task at a time using all of
+    the worker's resources.
+    """
+    BEFLOW_QC_COMPUTE_QUEUE_ROUTING: Literal["none", "size", "program"] = "none"
+    """
+    How QC tasks should be routed to worker queues. ``"none"`` sends every task to the
+    single default queue, ``"size"`` sends tasks to a small, medium or large queue based
+    on their estimated cost and ``"program"`` sends tasks to a queue per QC program.
+    """
+    BEFLOW_QC_COMPUTE_QUEUE_SMALL_COST: float = 1.0e4
+    BEFLOW_QC_COMPUTE_QUEUE_LARGE_COST: float = 1.0e6
 
     BEFLOW_OPTIMIZER_PREFIX = "optimizations"
     BEFLOW_OPTIMIZER_ROUTER = "openff.bespokefit.executor.services.optimizer.app:router"
     BEFLOW_OPTIMIZER_WORKER = "openff.bespokefit.executor.services.optimizer.worker"
     BEFLOW_OPTIMIZER_WORKER_N_CORES: Union[int, Literal["auto"]] = "auto"
     BEFLOW_OPTIMIZER_WORKER_MAX_MEM: Union[float, Literal["auto"]] = "auto"
+    BEFLOW_OPTIMIZER_FORCEBALANCE_MODE: Literal["subprocess", "in-process"] = (
+        "subprocess"
+    )
+    """
+    How ForceBalance optimizations should be run. ``"subprocess"`` launches a new
+    ``ForceBalance`` process for each fit, while ``"in-process"`` runs each fit through
+    the ForceBalance python API inside a long-lived interpreter that is started, and
+    has ForceBalance, OpenMM and the OpenFF toolkit imported, once per optimizer worker.
+    """
+    BEFLOW_OPTIMIZER_SPLIT_STAGES: bool = False
+    """
+    Whether the optimizer worker should split each optimization stage into sub-fits of
+    the groups of parameters which are constrained by disjoint sets of targets, e.g.
+    the torsions of different fragments, and run the sub-fits in parallel using up to
+    ``BEFLOW_OPTIMIZER_WORKER_N_CORES`` processes.
+    """
     BEFLOW_OPTIMIZER_KEEP_FILES: bool = False
     """
     .. deprecated:: 0.2.1
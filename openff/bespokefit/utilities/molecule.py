@@ -159,7 +159,9 @@ def get_torsion_indices(
 
 
 def group_valence_by_symmetry(
-    molecule: Molecule, valence_terms: List[Tuple[int, ...]]
+    molecule: Molecule,
+    valence_terms: List[Tuple[int, ...]],
+    symmetry_classes: Optional[List[int]] = None,
 ) -> Dict[Tuple[int, ...], List[Tuple[int, ...]]]:
     """Group the a set of valence terms by symmetry groups.
 
@@ -170,12 +172,15 @@ def group_valence_by_symmetry(
         molecule: The molecule the valence terms correspond to
         valence_terms: The list of atom tuples that make up the valence term the
             should be grouped.
+        symmetry_classes: The symmetry class of each atom in the molecule if already
+            known, otherwise they will be computed.
 
     Returns:
         A dictionary of valence terms grouped by symmetry.
     """
 
-    symmetry_classes = get_atom_symmetries(molecule)
+    if symmetry_classes is None:
+        symmetry_classes = get_atom_symmetries(molecule)
 
     # collect by symmetry class
     valence_by_symmetry = defaultdict(list)
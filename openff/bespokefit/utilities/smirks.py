@@ -1,5 +1,8 @@
 import copy
-from typing import List, Optional, Tuple, Union
+import functools
+import re
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import networkx as nx
 from chemper.graphs.cluster_graph import ClusterGraph
@@ -14,16 +17,212 @@ from openff.bespokefit._pydantic import Field, SchemaBase
 from openff.bespokefit.exceptions import SMIRKSTypeError
 from openff.bespokefit.schema.smirnoff import SMIRNOFFParameter, get_smirnoff_parameter
 from openff.bespokefit.utilities.molecule import (
+    get_atom_symmetries,
     get_torsion_indices,
     group_valence_by_symmetry,
 )
 from openff.bespokefit.utilities.smirnoff import ForceFieldEditor, SMIRKSType
 
+_AtomSpec = Tuple[Optional[int], Optional[int]]
+"""The atomic number and connectivity of an atom, where ``None`` means any."""
+
+
+def _tagged_atom_specs(smirks: str) -> Optional[Tuple[_AtomSpec, ...]]:
+    """Returns the atomic number and connectivity required of each tagged atom in a
+    torsion SMIRKS pattern, or ``None`` if the pattern does not tag four atoms.
+
+    Any primitive which is not a simple conjunction, e.g. uses ``,`` or ``!`` or a
+    recursive SMARTS, is treated as matching any atom.
+    """
+
+    tagged_atoms = {
+        int(tag): primitives
+        for primitives, tag in re.findall(r"\[([^\[\]]+?):(\d+)\]", smirks)
+    }
+
+    if sorted(tagged_atoms) != [1, 2, 3, 4]:
+        return None
+
+    specs = []
+
+    for tag in range(1, 5):
+        primitives = tagged_atoms[tag]
+
+        if any(character in primitives for character in ",;!$"):
+            specs.append((None, None))
+            continue
+
+        atomic_numbers = re.findall(r"#(\d+)", primitives)
+        connectivities = re.findall(r"X(\d+)", primitives)
+
+        specs.append(
+            (
+                int(atomic_numbers[0]) if len(atomic_numbers) == 1 else None,
+                int(connectivities[0]) if len(connectivities) == 1 else None,
+            )
+        )
+
+    return tuple(specs)
+
+
+def _torsion_environments(
+    molecule: Molecule, atom_indices: Set[int]
+) -> Set[Tuple[Tuple[int, int], ...]]:
+    """Returns the atomic number and connectivity of the atoms in each proper torsion
+    of a molecule that only involves the specified atoms."""
+
+    return {
+        tuple((atom.atomic_number, len(atom.bonds)) for atom in proper)
+        for proper in molecule.propers
+        if all(atom.molecule_atom_index in atom_indices for atom in proper)
+    }
+
+
+def _is_compatible(
+    specs: Tuple[_AtomSpec, ...], environment: Tuple[Tuple[int, int], ...]
+) -> bool:
+    """Returns whether a torsion with a given environment could match a SMIRKS pattern
+    with the given tagged atom specs, in either direction."""
+
+    def _matches(ordered_environment) -> bool:
+        return all(
+            (atomic_number is None or atomic_number == atom[0])
+            and (connectivity is None or connectivity == atom[1])
+            for (atomic_number, connectivity), atom in zip(specs, ordered_environment)
+        )
+
+    return _matches(environment) or _matches(environment[::-1])
+
+
+def _element_key(atomic_numbers: Tuple[int, ...]) -> Tuple[int, ...]:
+    return min(atomic_numbers, atomic_numbers[::-1])
+
+
+class CachedTorsionIndex:
+    """An index of cached torsion parameters keyed by the elements of their tagged
+    atoms, so that only the parameters which could possibly apply to a torsion have
+    to be matched against a molecule.
+
+    Parameters whose tagged atoms do not all have a single atomic number are not
+    indexed and are always treated as candidates. Parameters may also be loaded
+    lazily from serialized records, in which case only the SMIRKS patterns are needed
+    to search the index and only the records of matched parameters are loaded.
+    """
+
+    def __init__(self, parameters: List[ProperTorsionHandler.ProperTorsionType]):
+        self._smirks = [parameter.smirks for parameter in parameters]
+        self._parameters: List[Optional[ProperTorsionHandler.ProperTorsionType]] = [
+            *parameters
+        ]
+
+        self._records: List[Any] = [None] * len(self._smirks)
+        self._load_record: Optional[
+            Callable[[Any], ProperTorsionHandler.ProperTorsionType]
+        ] = None
+
+        self._specs: Dict[int, Optional[Tuple[_AtomSpec, ...]]] = {}
+        self._by_elements: Dict[Tuple[int, ...], Set[int]] = defaultdict(set)
+        self._unindexed: Set[int] = set()
+
+        for index in range(len(self._smirks)):
+            self._add(index)
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Dict[str, Any],
+        load_record: Callable[[Any], ProperTorsionHandler.ProperTorsionType],
+    ) -> "CachedTorsionIndex":
+        """Create an index of serialized parameters which are only loaded when
+        matched.
+
+        Args:
+            records: The serialized parameters keyed by their SMIRKS pattern.
+            load_record: A function which loads a parameter from its record.
+        """
+
+        index = cls([])
+
+        index._smirks = [*records]
+        index._parameters = [None] * len(records)
+        index._records = [*records.values()]
+        index._load_record = load_record
+
+        for i in range(len(index._smirks)):
+            index._add(i)
+
+        return index
+
+    def __len__(self) -> int:
+        return len(self._smirks)
+
+    @property
+    def n_loaded(self) -> int:
+        """The number of parameters that have been loaded."""
+        return sum(parameter is not None for parameter in self._parameters)
+
+    def _add(self, index: int):
+        specs = _tagged_atom_specs(self._smirks[index])
+        self._specs[index] = specs
+
+        if specs is None or any(atomic_number is None for atomic_number, _ in specs):
+            self._unindexed.add(index)
+        else:
+            key = _element_key(tuple(atomic_number for atomic_number, _ in specs))
+            self._by_elements[key].add(index)
+
+    def _remove(self, index: int):
+        if index in self._unindexed:
+            self._unindexed.remove(index)
+            return
+
+        key = _element_key(
+            tuple(atomic_number for atomic_number, _ in self._specs[index])
+        )
+        self._by_elements[key].discard(index)
+
+    def smirks(self, index: int) -> str:
+        return self._smirks[index]
+
+    def parameter(self, index: int) -> ProperTorsionHandler.ProperTorsionType:
+        """Returns a parameter in the index, loading it if needed."""
+
+        if self._parameters[index] is None:
+            self._parameters[index] = self._load_record(self._records[index])
+
+        return self._parameters[index]
+
+    def update(self, index: int):
+        """Re-index a parameter whose SMIRKS pattern has been changed in place."""
+
+        self._remove(index)
+        self._smirks[index] = self.parameter(index).smirks
+        self._add(index)
+
+    def candidates(self, molecule: Molecule, atom_indices: Set[int]) -> List[int]:
+        """Returns, in their original order, the indices of the parameters which
+        could match the torsions of a molecule that only involve a set of atoms."""
+
+        indices = {*self._unindexed}
+
+        for environment in _torsion_environments(molecule, atom_indices):
+            key = _element_key(tuple(atomic_number for atomic_number, _ in environment))
+
+            indices.update(
+                index
+                for index in self._by_elements.get(key, ())
+                if _is_compatible(self._specs[index], environment)
+            )
+
+        return sorted(indices)
+
 
 def get_cached_torsion_parameters(
     molecule: Molecule,
     bespoke_parameter: ProperTorsionHandler.ProperTorsionType,
-    cached_parameters: List[ProperTorsionHandler.ProperTorsionType],
+    cached_parameters: Union[
+        List[ProperTorsionHandler.ProperTorsionType], CachedTorsionIndex
+    ],
 ) -> Optional[ProperTorsionHandler.ProperTorsionType]:
     """
     For a given molecule update the input parameter with cached values if an equivalent parameter can be found in the cached list.
@@ -31,7 +230,8 @@ def get_cached_torsion_parameters(
     Args:
         molecule: The target molecule the parameter should be applied to
         bespoke_parameter: Our bespoke parameter which contains the reference smirks pattern
-        cached_parameters: The list of cached parameters which can be reused
+        cached_parameters: The list of cached parameters which can be reused, or an
+            index of them which avoids matching parameters that cannot apply
     """
 
     # get matches for our target smirks
@@ -40,21 +240,118 @@ def get_cached_torsion_parameters(
     )
     target_matches = {m for match in target_matches for m in match}
 
+    if isinstance(cached_parameters, CachedTorsionIndex):
+        # a cached parameter can only hit the same atoms if it matches at least one
+        # torsion between them
+        candidates = [
+            (index, cached_parameters.smirks(index))
+            for index in cached_parameters.candidates(molecule, target_matches)
+        ]
+    else:
+        candidates = [(parameter, parameter.smirks) for parameter in cached_parameters]
+
     # make sure the cached parameter hits the same atoms as our bespoke parameter
-    for cached_parameter in cached_parameters:
-        matches = molecule.chemical_environment_matches(query=cached_parameter.smirks)
+    for candidate, smirks in candidates:
+        matches = molecule.chemical_environment_matches(query=smirks)
         matches = {m for match in matches for m in match}
         if not target_matches.symmetric_difference(matches):
+            cached_parameter = (
+                cached_parameters.parameter(candidate)
+                if isinstance(cached_parameters, CachedTorsionIndex)
+                else candidate
+            )
             cached_parameter.add_cosmetic_attribute(
                 attr_name="cached", attr_value="True"
             )
             # we keep the new bespoke smirks to ensure it matches the parent and the fragment
             cached_parameter.smirks = bespoke_parameter.smirks
+
+            if isinstance(cached_parameters, CachedTorsionIndex):
+                cached_parameters.update(candidate)
+
             return cached_parameter
 
     return None
 
 
+_SMIRKS_GRAPH_CACHE_SIZE = 4096
+"""The maximum number of parsed SMIRKS attribute graphs and hashes to cache."""
+
+
+@functools.lru_cache(maxsize=_SMIRKS_GRAPH_CACHE_SIZE)
+def _parse_smirks_graph(smirks: str) -> Tuple[int, nx.Graph]:
+    """Returns the number of tagged atoms in a SMIRKS pattern and its attribute
+    graph."""
+
+    chem_env = ChemicalEnvironment(smirks)
+
+    return len(chem_env.get_indexed_atoms()), make_smirks_attribute_graph(chem_env)
+
+
+def _smirks_node_label(attributes: Dict[str, Any]) -> str:
+    """Returns a label of the attributes of an atom in a SMIRKS attribute graph which
+    must be identical for it to be matched to another atom by
+    ``compare_smirks_graphs``."""
+
+    # atoms are matched if their or types overlap, so only whether there are any can
+    # be used, and tagged atoms may be matched to atoms with different tags
+    return (
+        f"{attributes['is_atom']}|{attributes['ring']}|{attributes['_and_types']!r}|"
+        f"{len(attributes['_or_types']) > 0}|{(attributes['index'] or 0) > 0}"
+    )
+
+
+@functools.lru_cache(maxsize=_SMIRKS_GRAPH_CACHE_SIZE)
+def smirks_graph_hash(smirks: str) -> str:
+    """
+    Returns a Weisfeiler-Lehman hash of the attribute graph of a SMIRKS pattern.
+
+    Two SMIRKS patterns which ``compare_smirks_graphs`` considers equivalent will
+    always have the same hash, although patterns with the same hash are not
+    necessarily equivalent.
+    """
+
+    n_tagged, graph = _parse_smirks_graph(smirks)
+
+    hash_graph = nx.Graph()
+    hash_graph.add_nodes_from(
+        (node, {"label": _smirks_node_label(attributes)})
+        for node, attributes in graph.nodes(data=True)
+    )
+    hash_graph.add_edges_from(graph.edges())
+
+    graph_hash = nx.weisfeiler_lehman_graph_hash(hash_graph, node_attr="label")
+
+    return f"{n_tagged}:{graph_hash}"
+
+
+class SMIRKSGraphIndex:
+    """An index of SMIRKS patterns keyed by their ``smirks_graph_hash``, so that a
+    pattern only has to be compared in full against the indexed patterns which could
+    possibly be equivalent to it.
+    """
+
+    def __init__(self, smirks: Optional[List[str]] = None):
+        self._by_hash: Dict[str, List[str]] = defaultdict(list)
+
+        for pattern in [] if smirks is None else smirks:
+            self.add(pattern)
+
+    def add(self, smirks: str):
+        """Add a SMIRKS pattern to the index."""
+        self._by_hash[smirks_graph_hash(smirks)].append(smirks)
+
+    def find_equivalent(self, smirks: str) -> Optional[str]:
+        """Returns the first indexed SMIRKS pattern which covers the same types as a
+        SMIRKS pattern, or ``None`` if there are none."""
+
+        for candidate in self._by_hash.get(smirks_graph_hash(smirks), []):
+            if compare_smirks_graphs(smirks, candidate):
+                return candidate
+
+        return None
+
+
 def compare_smirks_graphs(smirks1: str, smirks2: str) -> bool:
     """
     Compare two smirks schema based on the types of smirks they cover.
@@ -62,6 +359,10 @@ def compare_smirks_graphs(smirks1: str, smirks2: str) -> bool:
     if smirks1 == smirks2:
         return True
 
+    # patterns with different hashes can never be isomorphic
+    if smirks_graph_hash(smirks1) != smirks_graph_hash(smirks2):
+        return False
+
     # define the node matching functions
     def atom_match(atom1, atom2):
         """
@@ -118,13 +419,13 @@ def compare_smirks_graphs(smirks1: str, smirks2: str) -> bool:
 
     # first work out the type of graph, atom, angle, dihedral based on the number of
     # tagged atoms
-    env1 = ChemicalEnvironment(smirks1)
-    env2 = ChemicalEnvironment(smirks2)
+    n_tagged1, env1_graph = _parse_smirks_graph(smirks1)
+    n_tagged2, env2_graph = _parse_smirks_graph(smirks2)
     # make sure they tag the same number of atoms
-    if len(env1.get_indexed_atoms()) != len(env2.get_indexed_atoms()):
+    if n_tagged1 != n_tagged2:
         return False
     else:
-        smirks_type = len(env1.get_indexed_atoms())
+        smirks_type = n_tagged1
 
     # define the general node match
     def general_match(x, y):
@@ -144,8 +445,6 @@ def compare_smirks_graphs(smirks1: str, smirks2: str) -> bool:
         return is_equal
 
     # now do the check
-    env1_graph = make_smirks_attribute_graph(env1)
-    env2_graph = make_smirks_attribute_graph(env2)
     gm = nx.algorithms.isomorphism.GraphMatcher(
         env1_graph, env2_graph, node_match=node_match
     )
@@ -167,6 +466,29 @@ def make_smirks_attribute_graph(chem_env: ChemicalEnvironment) -> nx.Graph:
     return new_graph
 
 
+class _MoleculeContext:
+    """Lazily computes, and then re-uses, the representations of a molecule that are
+    needed while generating SMIRKS patterns for it, so that they are computed at most
+    once per call to ``SMIRKSGenerator.generate_smirks_from_fragment`` rather than once
+    per valence group and SMIRKS type."""
+
+    def __init__(self, molecule: Molecule):
+        self.molecule = molecule
+
+    @functools.cached_property
+    def rdkit_molecule(self):
+        return self.molecule.to_rdkit()
+
+    @functools.cached_property
+    def smiles(self) -> str:
+        """The canonical, unmapped and non-isomeric SMILES of the molecule."""
+        return self.molecule.to_smiles(mapped=False, isomeric=False)
+
+    @functools.cached_property
+    def symmetry_classes(self) -> List[int]:
+        return get_atom_symmetries(self.molecule)
+
+
 class SMIRKSettings(SchemaBase):
     """
     Settings for the generation of SMIRKS patterns via the SMIRKSGenerator.
@@ -261,10 +583,15 @@ class SMIRKSGenerator(SMIRKSettings):
             ff = ForceFieldEditor(force_field=self.initial_force_field)
 
         if self.generate_bespoke_terms:
+            fragment_context = _MoleculeContext(fragment)
+            parent_context = (
+                fragment_context if parent is fragment else _MoleculeContext(parent)
+            )
+
             new_parameters = self._get_bespoke_parameters(
                 force_field_editor=ff,
-                parent=parent,
-                fragment=fragment,
+                parent=parent_context,
+                fragment=fragment_context,
                 fragment_map_indices=fragment_map_indices,
             )
 
@@ -345,8 +672,8 @@ class SMIRKSGenerator(SMIRKSettings):
     def _get_bespoke_parameters(
         self,
         force_field_editor: ForceFieldEditor,
-        parent: Molecule,
-        fragment: Molecule,
+        parent: _MoleculeContext,
+        fragment: _MoleculeContext,
         fragment_map_indices: Optional[Tuple[int, int]],
     ) -> List[ParameterType]:
         """
@@ -357,9 +684,7 @@ class SMIRKSGenerator(SMIRKSettings):
         values.
         """
 
-        fragment_is_parent = parent.to_smiles(
-            mapped=False, isomeric=False
-        ) == fragment.to_smiles(mapped=False, isomeric=False)
+        fragment_is_parent = parent is fragment or parent.smiles == fragment.smiles
 
         bespoke_smirks = []
         for smirk_type in self.target_smirks:
@@ -375,14 +700,14 @@ class SMIRKSGenerator(SMIRKSettings):
 
         # now we need to update all smirks
         new_parameters = force_field_editor.get_initial_parameters(
-            molecule=fragment, smirks=bespoke_smirks
+            molecule=fragment.molecule, smirks=bespoke_smirks
         )
         return new_parameters
 
     def _get_bespoke_smirks(
         self,
-        parent: Molecule,
-        fragment: Molecule,
+        parent: _MoleculeContext,
+        fragment: _MoleculeContext,
         fragment_map_indices: Optional[Tuple[int, int]],
         fragment_is_parent: bool,
         smirks_type: SMIRKSType,
@@ -392,18 +717,22 @@ class SMIRKSGenerator(SMIRKSettings):
         bespoke_smirks = []
 
         valence_terms = self._get_valence_terms(
-            fragment,
+            fragment.molecule,
             smirks_type,
             (
                 None
                 if fragment_map_indices is None
                 else (
-                    get_atom_index(fragment, fragment_map_indices[0]),
-                    get_atom_index(fragment, fragment_map_indices[1]),
+                    get_atom_index(fragment.molecule, fragment_map_indices[0]),
+                    get_atom_index(fragment.molecule, fragment_map_indices[1]),
                 )
             ),
         )
-        valence_groups = [*group_valence_by_symmetry(fragment, valence_terms).values()]
+        valence_groups = [
+            *group_valence_by_symmetry(
+                fragment.molecule, valence_terms, fragment.symmetry_classes
+            ).values()
+        ]
 
         for valence_group in valence_groups:
             target_atoms = [valence_group]
@@ -411,14 +740,14 @@ class SMIRKSGenerator(SMIRKSettings):
 
             if not fragment_is_parent:
                 parent_atoms = self._get_parent_valence_terms(
-                    parent, fragment, valence_group
+                    parent.molecule, fragment.molecule, valence_group
                 )
 
                 target_atoms.append(parent_atoms)
                 target_molecules.append(parent)
 
             graph = ClusterGraph(
-                mols=[molecule.to_rdkit() for molecule in target_molecules],
+                mols=[molecule.rdkit_molecule for molecule in target_molecules],
                 smirks_atoms_lists=target_atoms,
                 layers=self.smirks_layers,
             )
@@ -3,8 +3,11 @@ Tools for dealing with SMIRNOFF force field manipulation.
 """
 
 import copy
+import hashlib
+import threading
+from collections import OrderedDict
 from enum import Enum
-from typing import TYPE_CHECKING, Dict, List, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 from openff.toolkit import Molecule
@@ -17,7 +20,7 @@ from openff.toolkit.typing.engines.smirnoff import (
     ProperTorsionHandler,
     vdWHandler,
 )
-from openff.toolkit.utils.exceptions import ParameterLookupError
+from openff.toolkit.typing.engines.smirnoff.parameters import ParameterList
 
 if TYPE_CHECKING:
     from openff.bespokefit.schema.smirnoff import SMIRNOFFParameter
@@ -30,6 +33,177 @@ _PARAMETER_TYPE_TO_HANDLER = {
     ImproperTorsionHandler.ImproperTorsionType: "ImproperTorsions",
 }
 
+_LABEL_CACHE_SIZE = 256
+"""The maximum number of sets of labels to memoise across all force field editors."""
+
+_LabelCacheKey = Tuple[str, str]
+
+# The labels are stored as the indices of the assigned parameters in their handler
+# rather than the parameters themselves so that they can be shared by editors whose
+# force fields have the same contents but are different objects.
+_LABEL_CACHE: "OrderedDict[_LabelCacheKey, Dict[str, Tuple[type, Dict[Any, Any]]]]" = (
+    OrderedDict()
+)
+
+_FORCE_FIELD_CACHE_SIZE = 16
+"""The maximum number of parsed force fields to keep in memory."""
+
+_FORCE_FIELD_CACHE: "OrderedDict[Tuple[str, bool], ForceField]" = OrderedDict()
+_FORCE_FIELD_CACHE_STATISTICS = {"hits": 0, "misses": 0}
+_FORCE_FIELD_CACHE_LOCK = threading.Lock()
+
+
+def load_force_field(
+    force_field: str, allow_cosmetic_attributes: bool = False
+) -> ForceField:
+    """Load a force field from either the path to, or the contents of, an OFFXML
+    file.
+
+    Parsed force fields are cached in memory by the hash of ``force_field`` so that
+    the same force field is only parsed once per process. A copy of the cached force
+    field is returned each time so that it can be safely modified by the caller.
+
+    Args:
+        force_field: The path to, or contents of, the OFFXML file to load.
+        allow_cosmetic_attributes: Whether the force field may contain cosmetic
+            attributes.
+
+    Returns:
+        A copy of the loaded force field.
+    """
+
+    force_field_hash = hashlib.sha512(force_field.encode()).hexdigest()
+
+    # a force field without any cosmetic attributes can be used either way
+    cache_keys = [(force_field_hash, False)]
+
+    if allow_cosmetic_attributes:
+        cache_keys.append((force_field_hash, True))
+
+    with _FORCE_FIELD_CACHE_LOCK:
+        cache_key = next((key for key in cache_keys if key in _FORCE_FIELD_CACHE), None)
+
+        _FORCE_FIELD_CACHE_STATISTICS["misses" if cache_key is None else "hits"] += 1
+
+        if cache_key is not None:
+            _FORCE_FIELD_CACHE.move_to_end(cache_key)
+            cached_force_field = _FORCE_FIELD_CACHE[cache_key]
+
+    if cache_key is None:
+        cached_force_field = ForceField(
+            force_field, allow_cosmetic_attributes=allow_cosmetic_attributes
+        )
+
+        with _FORCE_FIELD_CACHE_LOCK:
+            _FORCE_FIELD_CACHE[cache_keys[-1]] = cached_force_field
+
+            if len(_FORCE_FIELD_CACHE) > _FORCE_FIELD_CACHE_SIZE:
+                _FORCE_FIELD_CACHE.popitem(last=False)
+
+    return copy.deepcopy(cached_force_field)
+
+
+def get_force_field_cache_statistics() -> Dict[str, float]:
+    """Returns the number of hits and misses of the in-memory force field cache of
+    this process, and the resulting hit rate."""
+
+    with _FORCE_FIELD_CACHE_LOCK:
+        n_hits = _FORCE_FIELD_CACHE_STATISTICS["hits"]
+        n_misses = _FORCE_FIELD_CACHE_STATISTICS["misses"]
+
+    return {
+        "hits": n_hits,
+        "misses": n_misses,
+        "hit_rate": 0.0 if n_hits + n_misses == 0 else n_hits / (n_hits + n_misses),
+    }
+
+
+def discard_cosmetic_attributes(force_field: ForceField) -> ForceField:
+    """Remove any cosmetic attributes from the parameter handlers and parameters of a
+    force field in place, rather than re-parsing it from a string serialized with
+    ``discard_cosmetic_attributes=True``.
+
+    Returns:
+        The same force field with its cosmetic attributes removed.
+    """
+
+    for handler_name in force_field.registered_parameter_handlers:
+        handler = force_field.get_parameter_handler(handler_name)
+
+        for attribute_owner in [handler, *handler.parameters]:
+            for attribute in [*attribute_owner._cosmetic_attribs]:
+                attribute_owner.delete_cosmetic_attribute(attribute)
+
+    return force_field
+
+
+def merge_parameters(
+    current_parameters: ParameterList,
+    parameters: List[ParameterType],
+    update_existing: bool = True,
+    new_id: Optional[Callable[[int, ParameterType], str]] = None,
+) -> List[ParameterType]:
+    """Add a batch of parameters to the parameter list of a handler.
+
+    The SMIRKS of the current parameters are indexed once up front, so that each new
+    parameter is found or added in constant time, and all new parameters are appended
+    to the list at once.
+
+    Args:
+        current_parameters: The parameter list of the handler to add to.
+        parameters: The parameters to add.
+        update_existing: Whether a parameter whose SMIRKS is already in the list
+            should update the existing parameter in place, keeping its id, or be
+            ignored.
+        new_id: An optional function which returns the id to give a new parameter,
+            given its index in ``parameters`` and the parameter. By default the id
+            of the parameter is kept.
+
+    Returns:
+        The parameter in the list that each of ``parameters`` was added as, updated
+        or matched to.
+    """
+
+    parameters_by_smirks = {}
+
+    for current_parameter in current_parameters:
+        parameters_by_smirks.setdefault(current_parameter.smirks, current_parameter)
+
+    merged_parameters = []
+    new_parameters = []
+
+    for i, parameter in enumerate(parameters):
+        current_parameter = parameters_by_smirks.get(parameter.smirks)
+
+        if current_parameter is not None and not update_existing:
+            merged_parameters.append(current_parameter)
+            continue
+
+        parameter_data = parameter.to_dict(discard_cosmetic_attributes=False)
+
+        if current_parameter is not None:
+            parameter_data["id"] = current_parameter.id
+            # update the parameter using the init to get around conditional
+            # assigment
+            current_parameter.__init__(**parameter_data, allow_cosmetic_attributes=True)
+
+        else:
+            if new_id is not None:
+                parameter_data["id"] = new_id(i, parameter)
+
+            current_parameter = parameter.__class__(
+                **parameter_data, allow_cosmetic_attributes=True
+            )
+
+            parameters_by_smirks[current_parameter.smirks] = current_parameter
+            new_parameters.append(current_parameter)
+
+        merged_parameters.append(current_parameter)
+
+    current_parameters.extend(ParameterList(new_parameters))
+
+    return merged_parameters
+
 
 class SMIRKSType(str, Enum):
     Bonds = "Bonds"
@@ -55,7 +229,9 @@ class ForceFieldEditor:
         if isinstance(force_field, ForceField):
             self.force_field = force_field
         else:
-            self.force_field = ForceField(force_field, allow_cosmetic_attributes=True)
+            self.force_field = load_force_field(
+                force_field, allow_cosmetic_attributes=True
+            )
 
         try:
             # try and strip a constraint handler
@@ -63,6 +239,19 @@ class ForceFieldEditor:
         except KeyError:
             pass
 
+        self._force_field_hash: Optional[str] = None
+
+    @property
+    def force_field_hash(self) -> str:
+        """A hash of the contents of the force field being edited."""
+
+        if self._force_field_hash is None:
+            self._force_field_hash = hashlib.sha512(
+                self.force_field.to_string().encode()
+            ).hexdigest()
+
+        return self._force_field_hash
+
     def add_parameters(self, parameters: List[ParameterType]) -> List[ParameterType]:
         """
         Work out which type of smirks this is and add it to the forcefield, if this is
@@ -84,32 +273,19 @@ class ForceFieldEditor:
 
         added_parameters = []
 
+        # any memoised labels are no longer valid once new smirks have been added
+        self._force_field_hash = None
+
         for handler_type, handler_parameters in parameters_by_handler.items():
             current_params = self.force_field[handler_type].parameters
             n_params = len(current_params)
 
-            for i, parameter in enumerate(handler_parameters, start=2):
-                parameter_data = parameter.to_dict(discard_cosmetic_attributes=False)
+            def _new_id(i: int, parameter: ParameterType) -> str:
+                return _smirks_ids[parameter.__class__] + str(n_params + i + 2)
 
-                try:
-                    current_param = current_params[parameter_data["smirks"]]
-                    parameter_data["id"] = current_param.id
-                    # update the parameter using the init to get around conditional
-                    # assigment
-                    current_param.__init__(
-                        **parameter_data, allow_cosmetic_attributes=True
-                    )
-                except ParameterLookupError:
-                    parameter_data["id"] = _smirks_ids[parameter.__class__] + str(
-                        n_params + i
-                    )
-
-                    current_param = parameter.__class__(
-                        **parameter_data, allow_cosmetic_attributes=True
-                    )
-                    current_params.append(current_param)
-
-                added_parameters.append(current_param)
+            added_parameters.extend(
+                merge_parameters(current_params, handler_parameters, new_id=_new_id)
+            )
 
         return added_parameters
 
@@ -122,11 +298,83 @@ class ForceFieldEditor:
         Args:
             molecule: The molecule that should be labeled by the force field.
 
+        Notes:
+            * The labels are memoised by the contents of the force field and the
+              mapped SMILES of the molecule, and so the force field should only be
+              modified using ``add_parameters``.
+
         Returns:
             A dictionary of each parameter assigned to molecule organised by parameter
             handler type.
         """
-        return self.force_field.label_molecules(molecule.to_topology())[0]
+
+        cache_key = (self.force_field_hash, molecule.to_smiles(mapped=True))
+
+        if cache_key in _LABEL_CACHE:
+            _LABEL_CACHE.move_to_end(cache_key)
+            return self._labels_from_indices(_LABEL_CACHE[cache_key])
+
+        labels = self.force_field.label_molecules(molecule.to_topology())[0]
+
+        try:
+            _LABEL_CACHE[cache_key] = self._labels_to_indices(labels)
+        except KeyError:
+            # a label which is not a parameter of its handler can't be memoised
+            return labels
+
+        if len(_LABEL_CACHE) > _LABEL_CACHE_SIZE:
+            _LABEL_CACHE.popitem(last=False)
+
+        return labels
+
+    def _labels_to_indices(
+        self, labels: Dict[str, Dict[Tuple[int, ...], Any]]
+    ) -> Dict[str, Tuple[type, Dict[Any, Any]]]:
+        """Replace each labelled parameter with its index in its parameter handler."""
+
+        label_indices = {}
+
+        for handler_name, handler_labels in labels.items():
+            parameter_indices = {
+                id(parameter): i
+                for i, parameter in enumerate(self.force_field[handler_name].parameters)
+            }
+
+            label_indices[handler_name] = (
+                handler_labels.__class__,
+                {
+                    atoms: (
+                        [parameter_indices[id(parameter)] for parameter in parameters]
+                        if isinstance(parameters, list)
+                        else parameter_indices[id(parameters)]
+                    )
+                    for atoms, parameters in handler_labels.items()
+                },
+            )
+
+        return label_indices
+
+    def _labels_from_indices(
+        self, label_indices: Dict[str, Tuple[type, Dict[Any, Any]]]
+    ) -> Dict[str, Dict[Tuple[int, ...], Any]]:
+        """The inverse of ``_labels_to_indices``."""
+
+        labels = {}
+
+        for handler_name, (labels_class, handler_indices) in label_indices.items():
+            parameters = self.force_field[handler_name].parameters
+            handler_labels = labels_class()
+
+            for atoms, indices in handler_indices.items():
+                handler_labels[atoms] = (
+                    [parameters[i] for i in indices]
+                    if isinstance(indices, list)
+                    else parameters[indices]
+                )
+
+            labels[handler_name] = handler_labels
+
+        return labels
 
     def get_parameters(
         self, molecule: Molecule, atoms_by_type: Dict[str, List[Tuple[int, ...]]]
@@ -19,7 +19,6 @@ from openff.qcsubmit.results import (
 from openff.qcsubmit.serializers import deserialize, serialize
 from openff.qcsubmit.workflow_components import ComponentResult
 from openff.toolkit.topology import Molecule
-from openff.toolkit.typing.engines.smirnoff import ForceField
 from qcelemental.models.common_models import Model
 from qcportal.optimization import OptimizationRecord
 from qcportal.torsiondrive import TorsiondriveRecord
@@ -55,7 +54,7 @@ from openff.bespokefit.schema.tasks import (
 )
 from openff.bespokefit.utilities import parallel
 from openff.bespokefit.utilities.smirks import SMIRKSettings, SMIRKSType
-from openff.bespokefit.utilities.smirnoff import ForceFieldEditor
+from openff.bespokefit.utilities.smirnoff import ForceFieldEditor, load_force_field
 
 QCResultRecord = Union[OptimizationRecord, TorsiondriveRecord]
 QCResultCollection = Union[
@@ -136,7 +135,7 @@ class BespokeWorkflowFactory(ClassBase):
     @validator("initial_force_field")
     def _check_force_field(cls, force_field: str) -> str:
         """Check that the force field is available via the toolkit."""
-        assert ForceField(force_field) is not None
+        assert load_force_field(force_field) is not None
         return force_field
 
     @validator("optimizer")